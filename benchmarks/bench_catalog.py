@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Katalog bellek kullanımı: sayfa sayfa biriktirme yolları (tracemalloc, kalıcı + tepe)
+- list[dict]       : crawl_http'nin döndürdüğü kayıt listesi
+- DataFrame+concat : eski collect_all_pages (sayfa başına DataFrame, sonda pd.concat)
+- Catalog          : gencer_catalog (sözlük kodlu kolonlar, URL öneki, array('d') fiyat)
+Her sayfanın kayıtları döngüde yeniden üretilir (gezmedeki gibi), biriktirildikten sonra bırakılır.
+Catalog'dan products.json şemasına gidiş-dönüş de doğrulanır (farklıysa çıkış kodu 1).
+
+Kullanım: python benchmarks/bench_catalog.py [kayıt sayıları, virgülle]   (varsayılan 7314,100000)
+Kaynak: products.json (yetmezse SKU'ları eklenerek çoğaltılır), yoksa sentetik kayıtlar.
+"""
+
+import sys, json, time, tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import pandas as pd
+from gencer_catalog import Catalog
+from mock_portal import synthetic_record
+
+PER_PAGE = 50
+
+def source(n):
+    path = ROOT / "products.json"
+    if not path.exists():
+        return [synthetic_record(i) for i in range(n)]
+    base = json.loads(path.read_text(encoding="utf-8"))
+    out = []
+    for i in range(n):
+        r = dict(base[i % len(base)])
+        k = i // len(base)
+        if k:
+            r["sku"] = f"{r['sku']}-{k}"; r["title"] = f"{r['title']} #{k}"; r["price"] += k * 0.01
+        out.append(r)
+    return out
+
+def page_blobs(records):
+    return [json.dumps(records[i:i + PER_PAGE], ensure_ascii=False)
+            for i in range(0, len(records), PER_PAGE)]
+
+def as_list(blobs):
+    out = []
+    for b in blobs: out.extend(json.loads(b))
+    return out
+
+def as_frames(blobs):
+    frames = [pd.DataFrame(json.loads(b)) for b in blobs]
+    return pd.concat(frames, ignore_index=True)
+
+def as_catalog(blobs):
+    cat = Catalog()
+    for b in blobs: cat.extend(json.loads(b))
+    return cat
+
+def measure(fn, blobs):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    obj = fn(blobs)
+    dt = time.perf_counter() - t0
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, dt, kept, peak
+
+def main():
+    sizes = [int(x) for x in (sys.argv[1] if len(sys.argv) > 1 else "7314,100000").split(",")]
+    ok = True
+    for n in sizes:
+        records = source(n)
+        blobs = page_blobs(records)
+        print(f"\n{n:,} kayıt ({len(blobs)} sayfa)")
+        print(f"  {'yol':<18}{'süre':>9}{'kalıcı':>12}{'tepe':>12}")
+        base = None
+        for name, fn in (("list[dict]", as_list), ("DataFrame+concat", as_frames), ("Catalog", as_catalog)):
+            obj, dt, kept, peak = measure(fn, blobs)
+            base = base or kept
+            print(f"  {name:<18}{dt:>8.3f}s{kept / 1e6:>9.1f} MB{peak / 1e6:>9.1f} MB   x{kept / base:.2f}")
+            if name == "Catalog":
+                same = list(obj.records()) == records
+                ok &= same
+                print(f"  gidiş-dönüş (products.json şeması): {'evet' if same else 'HAYIR'}; "
+                      f"nbytes={obj.nbytes() / 1e6:.1f} MB")
+            del obj
+    if not ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
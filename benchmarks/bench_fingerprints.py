@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Değişim tespiti: önceki products.json + DiffBuilder vs SKU -> parmak izi indeksi (gencer_alerts)
+- Süre ve tepe bellek (tracemalloc): önceki katalog yükle + karşılaştır / indeks yükle + karşılaştır
+- Dosya boyutu: products.json vs _cache/fingerprints.tsv
+- Bilinen değişiklikler: her 97. ürün +%10 (uyarı), her 89. +%1 (eşik altı, uyarı yok),
+  her 53. stok Var<->Yok (uyarı); uyarı sayıları beklenenle aynı olmalı
+- Hedefler yerelde: dosya, webhook (yerel HTTP sunucusu POST'u alır), e-posta taslağı (.eml)
+Beklenenden farklı sonuç olursa çıkış kodu 1.
+
+Kullanım: python benchmarks/bench_fingerprints.py [kayıt sayıları, virgülle]   (varsayılan 7314,100000)
+"""
+
+import sys, json, time, tempfile, threading, tracemalloc
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import gencer_alerts
+from gencer_alerts import ChangeWatch, FileSink, WebhookSink, EmailSink, notify
+from gencer_diff import load_snapshot, DiffBuilder
+from gencer_writers import JsonWriter
+from mock_portal import synthetic_record
+
+def mutate(records):
+    out = []
+    for i, r in enumerate(records):
+        r = dict(r)
+        if i and i % 97 == 0: r["price"] = round(r["price"] * 1.10, 4)
+        elif i and i % 89 == 0: r["price"] = round(r["price"] * 1.01, 4)
+        elif i and i % 53 == 0: r["stock"] = "Yok" if r["stock"] == "Var" else "Var"
+        out.append(r)
+    return out
+
+def expected(n):
+    price = sum(1 for i in range(1, n) if i % 97 == 0)
+    small = sum(1 for i in range(1, n) if i % 97 and i % 89 == 0)
+    stock = sum(1 for i in range(1, n) if i % 97 and i % 89 and i % 53 == 0)
+    return price, stock, price + small + stock
+
+def measure(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    res = fn()
+    dt = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return res, dt, peak
+
+def old_way(json_path, records):
+    diff = DiffBuilder(load_snapshot(json_path))
+    for r in records: diff.add(r)
+    return diff.result()
+
+def new_way(fp_path, records):
+    watch = ChangeWatch(fp_path, price_pct=5.0)
+    for r in records: watch.add(r)
+    return watch
+
+class Hook(BaseHTTPRequestHandler):
+    received = []
+    def do_POST(self):
+        Hook.received.append(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+        self.send_response(204); self.end_headers()
+    def log_message(self, *a): pass
+
+def check_sinks(alerts, tmp):
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Hook)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    try:
+        sinks = [FileSink(tmp / "alerts.jsonl"), WebhookSink(f"http://127.0.0.1:{srv.server_port}/hook"),
+                 EmailSink("satinalma@example.com", outbox=tmp / "outbox")]
+        sent = notify(alerts, sinks)
+    finally:
+        srv.shutdown()
+    lines = (tmp / "alerts.jsonl").read_text(encoding="utf-8").splitlines()
+    emls = list((tmp / "outbox").glob("*.eml"))
+    ok = (sent == 3 and len(lines) == len(alerts) and Hook.received[-1]["count"] == len(alerts)
+          and len(emls) == 1)
+    print(f"  hedefler: dosya {len(lines)} satır, webhook {Hook.received[-1]['count']} uyarı, "
+          f"e-posta taslağı {emls[0].name if emls else '-'} -> {'evet' if ok else 'HAYIR'}")
+    return ok
+
+def main():
+    sizes = [int(x) for x in (sys.argv[1] if len(sys.argv) > 1 else "7314,100000").split(",")]
+    gencer_alerts.log = lambda msg: None
+    ok = True
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            prev = [synthetic_record(i) for i in range(n)]
+            cur = mutate(prev)
+            json_path, fp_path = tmp / "products.json", tmp / "fingerprints.tsv"
+            with JsonWriter(json_path) as jw: jw.write_many(prev)
+            new_way(fp_path, prev).save()
+
+            delta, t_old, m_old = measure(lambda: old_way(json_path, cur))
+            watch, t_new, m_new = measure(lambda: new_way(fp_path, cur))
+            kinds = [a["kind"] for a in watch.alerts]
+            want = expected(n)
+            got = (kinds.count("price"), kinds.count("stock"), watch.changed)
+            ok &= got == want
+            print(f"\n{n:,} kayıt")
+            print(f"  products.json + DiffBuilder : {t_old:6.3f} sn, tepe {m_old / 1e6:6.1f} MB, "
+                  f"dosya {json_path.stat().st_size / 1e6:5.1f} MB, {len(delta['changed'])} değişen")
+            print(f"  parmak izi indeksi          : {t_new:6.3f} sn, tepe {m_new / 1e6:6.1f} MB, "
+                  f"dosya {fp_path.stat().st_size / 1e6:5.1f} MB, {watch.changed} değişen")
+            print(f"  uyarılar (fiyat, stok, değişen): {got}, beklenen {want} -> "
+                  f"{'evet' if got == want else 'HAYIR'}")
+            if n == sizes[0]:
+                ok &= check_sinks(watch.alerts, tmp)
+    if not ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
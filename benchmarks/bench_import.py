@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Soğuk başlangıç / import süresi: her modül ayrı, yeni bir python sürecinde içe aktarılır
+- Süre: en iyi N deneme (süreç başlatma hariç, yalnız import)
+- Hangi ağır bağımlılıkların yüklendiği (selenium, webdriver_manager, pandas, requests, lxml)
+Kurallar (çiğnenirse çıkış kodu 1):
+- scrape_gencer dışındaki hiçbir modül selenium / webdriver_manager yüklememeli
+- ayrıştırma / çıktı / arama yardımcıları pandas ve requests de yüklememeli
+
+Kullanım: python benchmarks/bench_import.py [tekrar]
+"""
+
+import sys, json, subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY = ("selenium", "webdriver_manager", "pandas", "requests", "lxml")
+# modül -> yüklememesi gerekenler
+RULES = {
+    "gencer_price": HEAVY,
+    "gencer_parse": HEAVY,
+    "gencer_writers": HEAVY,
+    "gencer_diff": HEAVY,
+    "gencer_cache": HEAVY,
+    "gencer_history": HEAVY,
+    "gencer_search": HEAVY,
+    "gencer_metrics": HEAVY,
+    "gencer_catalog": HEAVY,
+    "gencer_snapshot": HEAVY,
+    "gencer_alerts": HEAVY,
+    "gencer_normalize": ("selenium", "webdriver_manager", "requests"),
+    "gencer_pipeline": ("selenium", "webdriver_manager", "requests"),
+    "gencer_http": ("selenium", "webdriver_manager", "pandas"),
+    "gencer_shard": ("selenium", "webdriver_manager", "pandas"),
+    "gencer_driver": HEAVY,
+    "scrape_gencer": ("webdriver_manager",),
+}
+
+PROBE = """
+import sys, time, json
+t0 = time.perf_counter()
+import {mod}
+dt = time.perf_counter() - t0
+print(json.dumps({{"s": dt, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def probe(mod, repeat):
+    best, loaded = None, []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", PROBE.format(mod=mod, heavy=HEAVY)], cwd=ROOT,
+                             capture_output=True, text=True)
+        if out.returncode:
+            return None, out.stderr.strip().splitlines()[-1:]
+        r = json.loads(out.stdout)
+        best = r["s"] if best is None else min(best, r["s"])
+        loaded = r["loaded"]
+    return best, loaded
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    bad = []
+    print(f"{'modül':<18}{'import':>10}   yüklenen ağır bağımlılıklar")
+    for mod, forbidden in RULES.items():
+        t, loaded = probe(mod, repeat)
+        if t is None:
+            print(f"{mod:<18}{'hata':>10}   {loaded}")
+            continue
+        wrong = [m for m in loaded if m in forbidden]
+        if wrong:
+            bad.append((mod, wrong))
+        print(f"{mod:<18}{t * 1000:>8.0f}ms   {', '.join(loaded) or '-'}"
+              f"{'   <- ' + ', '.join(wrong) + ' yüklenmemeli' if wrong else ''}")
+    if bad:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Sıralı vs paralel HTTP gezme karşılaştırması (yerel sahte portal, 149 sayfa)
+- Her iki çıktı drop_duplicates(subset=["sku"], keep="first") sonrası birebir aynı olmalı
+
+Kullanım: python benchmarks/bench_parallel_crawl.py [sayfa] [gecikme_sn] [paralel]
+"""
+
+import sys, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import pandas as pd
+import gencer_http as gh
+from mock_portal import MockPortal
+
+def crawl(url, pages, concurrency):
+    t0 = time.perf_counter()
+    recs = gh.crawl_http(gh.make_session(pool_size=concurrency), url, max_pages=pages + 5,
+                         concurrency=concurrency)
+    df = pd.DataFrame(recs).drop_duplicates(subset=["sku"], keep="first").reset_index(drop=True)
+    return df, time.perf_counter() - t0
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 149
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    gh.log = lambda msg: None  # sayfa loglarını sustur
+
+    with MockPortal(pages=pages, latency=latency) as portal:
+        seq, t_seq = crawl(portal.url, pages, 1)
+        par, t_par = crawl(portal.url, pages, concurrency)
+
+    same = seq.equals(par)
+    print(f"{pages} sayfa, {latency*1000:.0f} ms gecikme, {len(seq)} kayıt")
+    print(f"  sıralı      : {t_seq:6.2f} sn")
+    print(f"  paralel (x{concurrency}): {t_par:6.2f} sn  -> hızlanma x{t_seq / t_par:.1f}")
+    print(f"  çıktılar aynı: {same}")
+    if not same or len(seq) != portal.pages * portal.per_page:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+parse_table karşılaştırması: eleman bazlı yol vs tek execute_script
+- Sentetik fiyat tablosu (varsayılan 50 satır) üretip Chrome'da açar
+- Her iki yolu N kez çalıştırır; süre ve WebDriver komut sayısını yazar
+- Çıktıların aynı olduğunu da kontrol eder
+
+Kullanım: python benchmarks/bench_parse_table.py [satır] [tekrar]
+"""
+
+import sys, time, tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import scrape_gencer as sg
+
+def synthetic_table_html(n_rows=50):
+    rows = []
+    for i in range(n_rows):
+        img = (f'<img src="data:image/gif;base64,R0lGOD" data-src="https://gencerteknik.b-cdn.net/urunler/p{i}.webp">'
+               if i % 3 else f'<img src="https://gencerteknik.b-cdn.net/urunler/p{i}.webp">')
+        rows.append(
+            f"<tr><td>{img}</td><td>100.01.{i:04d}</td><td>MERİDYEN SUNTA VİDASI 3X{i}</td>"
+            f"<td>Var</td><td>%20</td><td>BİN</td><td>{i},50 TL</td></tr>")
+    return ("<html><body><table><thead><tr><th></th><th>Kod</th><th>Ürün</th><th>Stok</th>"
+            "<th>KDV</th><th>Birim</th><th>Fiyat (TL)</th></tr></thead><tbody>"
+            + "".join(rows) + "</tbody></table></body></html>")
+
+def count_commands(driver):
+    """driver.execute'u sarıp WebDriver komutlarını sayar."""
+    counter = {"n": 0}
+    orig = driver.execute
+    def execute(*a, **kw):
+        counter["n"] += 1
+        return orig(*a, **kw)
+    driver.execute = execute
+    return counter
+
+def bench(fn, driver, counter, repeat):
+    counter["n"] = 0
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        df = fn(driver)
+    dt = time.perf_counter() - t0
+    return df, dt / repeat, counter["n"] // repeat
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    html = Path(tempfile.mkdtemp()) / "table.html"
+    html.write_text(synthetic_table_html(n_rows), encoding="utf-8")
+
+    drv = sg.init_driver(headless=True)
+    try:
+        drv.get(html.as_uri())
+        counter = count_commands(drv)
+        df_el, t_el, c_el = bench(sg.parse_table_elements, drv, counter, repeat)
+        df_js, t_js, c_js = bench(sg.parse_table_js, drv, counter, repeat)
+    finally:
+        drv.quit()
+
+    same = df_el.equals(df_js)
+    print(f"{n_rows} satır, {repeat} tekrar")
+    print(f"  eleman bazlı : {t_el*1000:8.1f} ms/sayfa, {c_el:5d} WebDriver komutu")
+    print(f"  execute_script: {t_js*1000:8.1f} ms/sayfa, {c_js:5d} WebDriver komutu")
+    print(f"  hızlanma: x{t_el / t_js:.1f}  | çıktılar aynı: {same}")
+    if not same:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
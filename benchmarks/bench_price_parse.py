@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Fiyat/döviz ayrıştırma: eski parse_price_currency vs gencer_price
+- Doğruluk: elle yazılmış örnekler (CORPUS) + rastgele üretilmiş biçimler (fuzz, bilinen değerle)
+- Hız: satır/sn; önbelleksiz (__wrapped__) ve LRU önbellekli (gerçekçi tekrar oranıyla)
+Hatalı sonuç varsa çıkış kodu 1.
+
+Kullanım: python benchmarks/bench_price_parse.py [satır]
+"""
+
+import re, sys, time, random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gencer_price import parse_price_currency, detect_currency
+from mock_portal import synthetic_records, format_price
+
+# (metin, beklenen değer, beklenen para birimi)
+CORPUS = [
+    ("1.234,56 TL", 1234.56, "TRY"),
+    ("1.234,56TL", 1234.56, "TRY"),
+    ("TL 1.234,56", 1234.56, "TRY"),
+    ("₺1.234,56", 1234.56, "TRY"),
+    ("1 234,56 ₺", 1234.56, "TRY"),
+    ("1 234,56 TL", 1234.56, "TRY"),
+    ("1 234 567,8 TRY", 1234567.8, "TRY"),
+    ("12.345.678,90 TL", 12345678.9, "TRY"),
+    ("495,731 TL", 495.731, "TRY"),
+    ("0,5 tl", 0.5, "TRY"),
+    ("1.234 TL", 1234.0, "TRY"),
+    ("12 YTL", 12.0, "TRY"),
+    ("€ 12,5", 12.5, "EUR"),
+    ("€12.50", 12.5, "EUR"),
+    ("12,50 €", 12.5, "EUR"),
+    ("EUR 1.000,00", 1000.0, "EUR"),
+    ("eur 3,2", 3.2, "EUR"),
+    ("$1,234.56", 1234.56, "USD"),
+    ("$ 12.5", 12.5, "USD"),
+    ("USD 1,000,000.00", 1000000.0, "USD"),
+    ("1.234,56 USD", 1234.56, "USD"),
+    ("-12,5 TL", -12.5, "TRY"),
+    ("+3,00 TL", 3.0, "TRY"),
+    ("KDV Dahil 1.499,90 TL", 1499.9, "TRY"),
+    ("Liste: 10,00 TL İndirimli: 8,00 TL", 10.0, "TRY"),
+    # para birimi başka kelimenin içinde: eşleşmemeli
+    ("1.234,56 BOTLE", 1234.56, ""),
+    ("ATLAS 99,90", 99.9, ""),
+    ("STL 5,5", 5.5, ""),
+    ("TRYOUT 7", 7.0, ""),
+    ("USDT 1,5", 1.5, ""),
+    ("KUTLU 12 TL", 12.0, "TRY"),
+    ("1234", 1234.0, ""),
+    ("12.5", 12.5, ""),
+    ("12.50", 12.5, ""),
+    ("1,5", 1.5, ""),
+    ("TL", 0.0, "TRY"),
+    ("—", 0.0, ""),
+    ("", 0.0, ""),
+    (None, 0.0, ""),
+]
+
+HEADERS = [
+    ("Fiyat (TL)", "TRY"), ("Birim Fiyat €", "EUR"), ("Fiyat USD", "USD"),
+    ("KATALOG FİYATI", "TRY"), ("ATLAS FİYAT", "TRY"), ("", "TRY"),
+]
+
+def old_parse(s):
+    CURRENCY_MAP = {"₺":"TRY","TL":"TRY","TRY":"TRY","$":"USD","USD":"USD","€":"EUR","EUR":"EUR"}
+    s = (s or "").strip()
+    if not s: return 0.0, ""
+    cur = ""
+    u = s.upper()
+    for k,v in CURRENCY_MAP.items():
+        if k in u or k in s: cur = v; break
+    sn = s.replace(" ","").replace(".","").replace(",",".")
+    m = re.findall(r"[-+]?\d*\.?\d+", sn)
+    val = float(m[0]) if m else 0.0
+    return val, cur
+
+def group(int_part, sep):
+    s = str(int_part)
+    out = []
+    while len(s) > 3:
+        out.insert(0, s[-3:]); s = s[:-3]
+    return sep.join([s] + out)
+
+def fuzz_cases(n, seed=7):
+    """Bilinen değerden rastgele biçimde metin üretir: (metin, değer, para birimi)."""
+    rnd = random.Random(seed)
+    tr = [("TL", "TRY"), ("₺", "TRY"), ("TRY", "TRY"), ("tl", "TRY")]
+    other = [("€", "EUR"), ("EUR", "EUR"), ("$", "USD"), ("USD", "USD")]
+    cases = []
+    for _ in range(n):
+        whole = rnd.choice([rnd.randint(0, 999), rnd.randint(1000, 10**7)])
+        frac = rnd.randint(0, 99)
+        val = whole + frac / 100
+        style = rnd.randrange(3)
+        if style == 0:   # Türkçe: 1.234,56
+            txt = group(whole, rnd.choice([".", " ", " "])) + f",{frac:02d}"
+        elif style == 1: # İngilizce: 1,234.56
+            txt = group(whole, ",") + f".{frac:02d}"
+        else:            # gruplamasız, virgül ondalık
+            txt = f"{whole},{frac:02d}"
+        sym, cur = rnd.choice(tr + other)
+        txt = rnd.choice([f"{txt} {sym}", f"{sym} {txt}", f"{sym}{txt}", f"{txt}{sym}"])
+        cases.append((txt, val, cur))
+    return cases
+
+def check(fn, cases):
+    bad = []
+    for txt, val, cur in cases:
+        got = fn(txt)
+        if abs(got[0] - val) > 1e-6 or got[1] != cur:
+            bad.append((txt, (val, cur), got))
+    return bad
+
+def rows_per_sec(fn, texts, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for t in texts:
+            fn(t)
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return len(texts) / best
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    fuzz = fuzz_cases(5000)
+    failed = False
+    for name, fn in (("eski", old_parse), ("gencer_price", parse_price_currency.__wrapped__)):
+        bad_c, bad_f = check(fn, CORPUS), check(fn, fuzz)
+        print(f"{name:<13} doğruluk: örnekler {len(CORPUS) - len(bad_c)}/{len(CORPUS)}, "
+              f"fuzz {len(fuzz) - len(bad_f)}/{len(fuzz)}")
+        for b in (bad_c + bad_f)[:5]:
+            print(f"    {b[0]!r}: beklenen {b[1]}, bulunan {b[2]}")
+        failed = failed or (fn is not old_parse and bool(bad_c or bad_f))
+    bad_h = [(h, c, detect_currency(h, "TRY")) for h, c in HEADERS if detect_currency(h, "TRY") != c]
+    print(f"tablo başlığı para birimi: {len(HEADERS) - len(bad_h)}/{len(HEADERS)}")
+    failed = failed or bool(bad_h)
+
+    # gerçekçi akış: mock portal fiyat metinleri (katalogda aynı fiyat çok tekrar eder)
+    prices = [format_price(r["price"]) + " TL" for r in synthetic_records(7000)]
+    texts = [prices[i % len(prices)] for i in range(n)]
+    unique = [t for t, _, _ in fuzz] * (n // len(fuzz) + 1)
+    parse_price_currency.cache_clear()
+    print(f"\n{n} satır ({len(set(texts))} farklı metin)")
+    r_old = rows_per_sec(old_parse, texts)
+    r_new = rows_per_sec(parse_price_currency.__wrapped__, texts)
+    r_lru = rows_per_sec(parse_price_currency, texts)
+    print(f"  eski             : {r_old:12,.0f} satır/sn")
+    print(f"  yeni, önbelleksiz: {r_new:12,.0f} satır/sn  -> x{r_new / r_old:.1f}")
+    print(f"  yeni, LRU        : {r_lru:12,.0f} satır/sn  -> x{r_lru / r_old:.1f}  "
+          f"{parse_price_currency.cache_info()}")
+    unique = unique[:n]
+    r_old_u = rows_per_sec(old_parse, unique)
+    r_new_u = rows_per_sec(parse_price_currency.__wrapped__, unique)
+    print(f"  tekrarsız metinler: eski {r_old_u:,.0f}, yeni {r_new_u:,.0f} satır/sn")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
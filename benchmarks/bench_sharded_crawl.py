@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Parçalı (çok süreçli) HTTP gezme: 1, 2, 4... işçi (yerel sahte portal)
+- Her işçi sayısında çıktı sıralı crawl_http ile birebir aynı olmalı
+- Hata yalıtımı: 1. parçanın işçisi ilk denemede süreci öldürür (os._exit); yalnızca o parça
+  yeniden denenmeli, sonuç yine tam olmalı
+
+Kullanım: python benchmarks/bench_sharded_crawl.py [sayfa] [gecikme_sn] [en_fazla_işçi]
+"""
+
+import os, sys, time, tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import pandas as pd
+import gencer_http as gh
+import gencer_shard as gs
+from mock_portal import MockPortal
+
+def frame(records):
+    return pd.DataFrame(records).drop_duplicates(subset=["sku"], keep="first").reset_index(drop=True)
+
+def crash_once_shard(spec):
+    """1. parça ilk çağrıda süreci düşürür (işaret dosyası ikinci denemeyi ayırt eder)."""
+    marker = Path(spec["marker"])
+    if spec["shard"] == 1 and not marker.exists():
+        marker.touch()
+        os._exit(3)
+    return gs.http_shard(spec)
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 149
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    gh.log = gs.log = lambda msg: None
+
+    ok = True
+    with MockPortal(pages=pages, latency=latency) as portal:
+        t0 = time.perf_counter()
+        base = frame(gh.crawl_http(gh.make_session(), portal.url, max_pages=pages + 5))
+        t_seq = time.perf_counter() - t0
+        print(f"{pages} sayfa, {latency * 1000:.0f} ms gecikme, {len(base)} kayıt, {os.cpu_count()} çekirdek")
+        print(f"  sıralı          : {t_seq:6.2f} sn")
+        n = 1
+        while n <= max_workers:
+            t0 = time.perf_counter()
+            got = gs.crawl_http_sharded(gh.make_session(), portal.url, max_pages=pages + 5, shards=n)
+            dt = time.perf_counter() - t0
+            same = frame([r for _, rows in got for r in rows]).equals(base)
+            ok = ok and same
+            print(f"  {n:2d} işçi         : {dt:6.2f} sn  -> x{t_seq / dt:.1f}  aynı: {same}")
+            n *= 2
+
+        # hata yalıtımı: yalnız çöken parça yeniden denenir
+        with tempfile.TemporaryDirectory() as tmp:
+            _, link = gh.discover_page_param(gh.fetch_html(gh.make_session(), portal.url), portal.url)
+            specs = [{"shard": i, "lo": lo, "hi": hi, "link": link, "param": "sayfa", "cookies": [],
+                      "marker": str(Path(tmp) / "crashed")}
+                     for i, (lo, hi) in enumerate(gs.split_pages(1, pages, 4))]
+            calls = []
+            orig = gs._run_isolated
+            gs._run_isolated = lambda w, s, t: calls.append(s["shard"]) or orig(w, s, t)
+            try:
+                results, errors = gs.run_shards(crash_once_shard, specs, workers=4, retries=1)
+            finally:
+                gs._run_isolated = orig
+        got = frame([r for _, rows in gs.merge_shards(results) for r in rows])
+        isolated = not errors and got.equals(base) and sorted(calls) == [0, 1, 1, 2, 3]
+        ok = ok and isolated
+        print(f"  çöken parça     : çağrılar {sorted(calls)}, hata {errors or 'yok'}, sonuç tam: {got.equals(base)}")
+    if not ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
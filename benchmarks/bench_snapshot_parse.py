@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Sayfa ayrıştırmanın gezinmeyle örtüşmesi (gencer_snapshot.PagePipeline), tarayıcısız benzetim
+- Gezinme + tarayıcı beklemesi: sayfa başına --nav sn time.sleep (WebDriver cevabı beklerken
+  GIL serbest, gerçekteki gibi)
+- sıralı      : gezin -> parse_table_html (ana iş parçacığında) -> sonraki sayfa
+- boru hattı  : gezin -> HTML'i kuyruğa ver -> sonraki sayfa; ayrıştırma N işçide
+Sonuçlar aynı mı, süre ve kuyrukta aynı anda bekleyen en fazla sayfa (<= --queue) raporlanır.
+Gerçek tarayıcıda sıralı yol ayrıca tarayıcı içi innerText/düzen maliyeti öder; onu ölçmek için:
+  python benchmarks/bench_suite.py --browser
+
+Kullanım: python benchmarks/bench_snapshot_parse.py [--pages 40] [--nav 0.05] [--queue 4]
+"""
+
+import sys, time, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gencer_parse import parse_table_html
+from gencer_snapshot import PagePipeline
+from mock_portal import MockPortal, render_page
+
+BASE = "http://127.0.0.1/FiyatListesi.asp"
+
+def sequential(htmls, nav):
+    out = []
+    for html in htmls:
+        time.sleep(nav)
+        out.extend(parse_table_html(html, BASE))
+    return out, 0
+
+def pipelined(htmls, nav, workers, queue):
+    out = []
+    with PagePipeline(workers, max_pending=queue) as pipe:
+        for page, html in enumerate(htmls, 1):
+            time.sleep(nav)
+            for _, records, _ in pipe.submit(page, html, BASE):
+                out.extend(records)
+        for _, records, _ in pipe.drain():
+            out.extend(records)
+        return out, pipe.peak
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--pages", type=int, default=40)
+    p.add_argument("--per-page", type=int, default=50)
+    p.add_argument("--nav", type=float, default=0.05, help="sayfa başına gezinme/bekleme (sn)")
+    p.add_argument("--queue", type=int, default=4)
+    a = p.parse_args()
+    portal = MockPortal(pages=a.pages, per_page=a.per_page)
+    htmls = [render_page(*portal.page_records(i), portal.pages, lazy=True) for i in range(1, a.pages + 1)]
+    t0 = time.perf_counter()
+    ref, _ = sequential(htmls, a.nav)
+    base = time.perf_counter() - t0
+    print(f"{a.pages} sayfa, gezinme {a.nav * 1000:.0f} ms/sayfa")
+    print(f"  sıralı          : {base:6.2f} sn")
+    ok = True
+    for workers in (1, 2, 4):
+        t0 = time.perf_counter()
+        got, peak = pipelined(htmls, a.nav, workers, a.queue)
+        dt = time.perf_counter() - t0
+        same = got == ref
+        ok &= same and peak <= a.queue
+        print(f"  boru hattı x{workers}   : {dt:6.2f} sn  -> x{base / dt:.2f}  aynı: {same}  "
+              f"en çok bekleyen: {peak}/{a.queue}")
+    if not ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
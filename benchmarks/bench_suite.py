@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Çevrimdışı ölçüm takımı (gerçek siteye gitmeden, benchmarks/mock_portal.py üzerinde)
+- parse_table_html : sayfa HTML'i -> kayıt (satır/sn), çıktı portal kayıtlarıyla aynı mı
+- parse_price      : fiyat metni ayrıştırma (satır/sn, önbelleksiz)
+- crawl_http       : login + tüm sayfalar requests/lxml ile (sayfa/sn)
+- collect_all_pages: Selenium ile login + tüm sayfalar (--browser; Chrome yoksa atlanır),
+                     bir de --parse-workers 2 ile (tablo HTML'i arka planda ayrıştırılır)
+- normalize_and_save: geçici klasöre products.csv/json + changes.json + geçmiş (satır/sn)
+- download_images  : portalın /img/ adreslerinden (görsel/sn, MB/sn), ikinci koşu 304 yolu
+Sonuç tablosu yazdırılır; --json ile kaydedilir, --baseline ile önceki kayda göre
+--tolerance'tan fazla yavaşlayan ölçüm varsa çıkış kodu 1.
+
+Kullanım:
+  python benchmarks/bench_suite.py [--products products.json] [--pages 20] [--latency 0.02]
+                                   [--browser] [--json sonuc.json] [--baseline onceki.json]
+"""
+
+import os, sys, json, time, argparse, tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import pandas as pd
+import gencer_common
+import gencer_http as gh
+from gencer_parse import parse_table_html
+from gencer_price import parse_price_currency
+from mock_portal import MockPortal, render_page, format_price, CURRENCY_LABEL
+
+CREDENTIALS = ("1001", "bench", "bench-pass")
+KEYS = ("sku", "title", "stock", "kdv", "birim", "price", "currency", "image_url")
+
+def quiet():
+    import gencer_images
+    for mod in (gencer_common, gh, gencer_images):
+        mod.log = lambda msg: None
+
+def timed(fn, repeat=1):
+    best, res = None, None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        res = fn()
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return res, best
+
+def same_records(got, expected):
+    if len(got) != len(expected):
+        return False
+    return all(all(g.get(k) == e.get(k) for k in KEYS) for g, e in zip(got, expected))
+
+def login_session(portal):
+    s = gh.make_session()
+    r = s.post(portal.login_url, data=dict(zip(("MUSTERI", "KULLANICI", "SIFRE"), CREDENTIALS)))
+    r.raise_for_status()
+    return s
+
+# --- ölçümler: her biri {"name", "seconds", "items", "unit", "ok"} döner ---
+def bench_parse_html(portal):
+    pages = [render_page(*portal.page_records(p), portal.pages, lazy=True) for p in range(1, portal.pages + 1)]
+    out, dt = timed(lambda: [r for h in pages for r in parse_table_html(h, base_url=portal.url)], repeat=3)
+    return {"name": "parse_table_html", "seconds": dt, "items": len(out), "unit": "satır",
+            "ok": same_records(out, portal.records)}
+
+def bench_parse_price(portal):
+    texts = [f"{format_price(r['price'])} {CURRENCY_LABEL.get(r.get('currency'), 'TL')}"
+             for r in portal.records] * 5
+    fn = parse_price_currency.__wrapped__
+    out, dt = timed(lambda: [fn(t) for t in texts], repeat=3)
+    ok = all(abs(v - r["price"]) < 1e-9 for (v, _), r in zip(out, portal.records))
+    return {"name": "parse_price", "seconds": dt, "items": len(texts), "unit": "satır", "ok": ok}
+
+def bench_crawl_http(portal, concurrency):
+    s = login_session(portal)
+    out, dt = timed(lambda: gh.crawl_http(s, portal.url, max_pages=portal.pages + 1,
+                                          concurrency=concurrency))
+    return {"name": f"crawl_http x{concurrency}", "seconds": dt, "items": portal.pages, "unit": "sayfa",
+            "ok": same_records(out, portal.records)}
+
+def bench_collect_browser(portal, tmp, parse_workers=0):
+    import gencer_session  # sahte portalın oturumu gerçek _cache/session.bin'in üzerine yazılmasın
+    gencer_session.SESSION_PATH = tmp / "session.bin"
+    gencer_session.LOCATORS_PATH = tmp / "login_locators.json"
+    os.environ.update({"GENCER_BASE_URL": portal.base, "GENCER_MUSTERI": CREDENTIALS[0],
+                       "GENCER_KULLANICI": CREDENTIALS[1], "GENCER_SIFRE": CREDENTIALS[2]})
+    gencer_common.BASE_URL = portal.base
+    import scrape_gencer as sg
+    sg.BASE_URL, sg.log = portal.base, (lambda msg: None)
+    drv = sg.init_driver(headless=True)
+    try:
+        t0 = time.perf_counter()
+        if not sg.login_and_open_price_list(drv):
+            raise RuntimeError("fiyat listesi açılamadı")
+        df = sg.collect_all_pages(drv, max_pages=portal.pages, parse_workers=parse_workers)
+        dt = time.perf_counter() - t0
+    finally:
+        drv.quit()
+    name = "collect_all_pages" + (f" p{parse_workers}" if parse_workers else "")
+    return {"name": name, "seconds": dt, "items": portal.pages, "unit": "sayfa",
+            "ok": same_records(df.to_dict(orient="records"), portal.records)}
+
+def bench_normalize_and_save(portal, tmp):
+    import gencer_pipeline as gp
+    import gencer_history
+    gp.log = lambda msg: None
+    gp.CSV_PATH, gp.JSON_PATH, gp.CHANGES_PATH = tmp / "products.csv", tmp / "products.json", tmp / "changes.json"
+    gp.history_connect = lambda: gencer_history.connect(tmp / "history.sqlite")
+    gp.FINGERPRINTS_PATH = tmp / "fingerprints.tsv"
+    df = pd.DataFrame(portal.records)
+    _, dt = timed(lambda: gp.normalize_and_save(df), repeat=3)
+    ok = len(json.loads(gp.JSON_PATH.read_text(encoding="utf-8"))) == len({r["sku"] for r in portal.records})
+    return {"name": "normalize_and_save", "seconds": dt, "items": len(df), "unit": "satır", "ok": ok}
+
+def bench_download_images(portal, tmp):
+    from gencer_images import download_all
+    items = [(r["sku"], r["image_url"]) for r in portal.records]
+    res = []
+    for label in ("download_images", "download_images 304"):
+        st, dt = timed(lambda: download_all(items, tmp / "img", concurrency=8))
+        ok = st["failed"] == 0 and (st["ok"] if label == "download_images" else st["not_modified"]) == st["urls"]
+        res.append({"name": label, "seconds": dt, "items": st["urls"], "unit": "görsel", "ok": ok,
+                    "mb_s": round(st["bytes"] / 1e6 / dt, 2)})
+    return res
+
+def report(results, baseline=None, tolerance=0.25):
+    base = {r["name"]: r for r in (baseline or [])}
+    slower = []
+    print(f"{'ölçüm':<22}{'süre':>10}{'hız':>22}   doğru  önceki")
+    for r in results:
+        r["per_s"] = round(r["items"] / r["seconds"], 1) if r["seconds"] else 0.0
+        prev = base.get(r["name"])
+        cmp = ""
+        if prev and prev.get("per_s"):
+            ratio = r["per_s"] / prev["per_s"]
+            cmp = f"x{ratio:.2f}"
+            if ratio < 1 - tolerance:
+                slower.append(r["name"]); cmp += " YAVAŞ"
+        extra = f" ({r['mb_s']} MB/sn)" if r.get("mb_s") else ""
+        print(f"{r['name']:<22}{r['seconds']:>9.3f}s{r['per_s']:>14,.0f} {r['unit']}/sn"
+              f"   {'evet' if r['ok'] else 'HAYIR':<6} {cmp}{extra}")
+    return slower
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Çevrimdışı performans ölçümleri (sahte portal)")
+    p.add_argument("--products", type=Path, default=ROOT / "products.json",
+                   help="kayıt kaynağı (yoksa sentetik kayıtlar)")
+    p.add_argument("--pages", type=int, default=0, help="en fazla sayfa (0: tümü)")
+    p.add_argument("--per-page", type=int, default=50)
+    p.add_argument("--latency", type=float, default=0.02, help="istek başına yapay gecikme (sn)")
+    p.add_argument("--concurrency", type=int, default=4)
+    p.add_argument("--browser", action="store_true", help="collect_all_pages'i Chrome ile de ölç")
+    p.add_argument("--json", type=Path, help="sonuçları bu dosyaya yaz")
+    p.add_argument("--baseline", type=Path, help="önceki --json çıktısı; yavaşlama kontrolü")
+    p.add_argument("--tolerance", type=float, default=0.25)
+    a = p.parse_args(argv)
+    quiet()
+
+    opts = dict(per_page=a.per_page, latency=a.latency, require_login=True, credentials=CREDENTIALS,
+                lazy=True, local_images=True)
+    if a.products.exists():
+        portal = MockPortal.from_json(a.products, pages=a.pages or None, **opts)
+    else:
+        portal = MockPortal(pages=a.pages or 20, **opts)
+    print(f"Sahte portal: {portal.pages} sayfa, {len(portal.records)} kayıt, "
+          f"{a.latency * 1000:.0f} ms gecikme\n")
+
+    results = []
+    with portal, tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        results.append(bench_parse_html(portal))
+        results.append(bench_parse_price(portal))
+        results.append(bench_crawl_http(portal, 1))
+        results.append(bench_crawl_http(portal, a.concurrency))
+        if a.browser:
+            try:
+                results.append(bench_collect_browser(portal, tmp))
+                results.append(bench_collect_browser(portal, tmp, parse_workers=2))
+            except Exception as e: print(f"collect_all_pages atlandı (Chrome/driver yok?): {e}\n")
+        results.append(bench_normalize_and_save(portal, tmp))
+        results.extend(bench_download_images(portal, tmp))
+
+    baseline = json.loads(a.baseline.read_text(encoding="utf-8"))["results"] if a.baseline else None
+    slower = report(results, baseline, a.tolerance)
+    if a.json:
+        a.json.write_text(json.dumps({"pages": portal.pages, "records": len(portal.records),
+                                      "latency": a.latency, "results": results},
+                                     ensure_ascii=False, indent=2), encoding="utf-8")
+    if slower or not all(r["ok"] for r in results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
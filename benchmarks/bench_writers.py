@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Çıktı yazıcıları: süre, dosya boyutu ve tepe bellek (tracemalloc)
+- eski yol: DataFrame -> to_dict(records) -> json.dumps(indent=2) -> write_text
+- yeni yol: sayfa sayfa (50 kayıt) StreamingSink -> json / json-compact / jsonl / csv / parquet
+Kayıtlar sayfa sayfa üretildiği için yeni yolda tepe bellek katalog boyutundan bağımsız kalmalı.
+
+Kullanım: python benchmarks/bench_writers.py [kayıt sayıları, virgülle]   (varsayılan 7314,100000)
+"""
+
+import sys, json, time, tempfile, tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import pandas as pd
+from gencer_writers import StreamingSink, make_writer, FORMATS
+from mock_portal import synthetic_record
+
+PER_PAGE = 50
+
+def pages(n):
+    for start in range(0, n, PER_PAGE):
+        yield [synthetic_record(i) for i in range(start, min(n, start + PER_PAGE))]
+
+def measure(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    fn()
+    dt = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return dt, peak
+
+def old_way(n, path):
+    frames = [pd.DataFrame(p) for p in pages(n)]
+    out = pd.concat(frames, ignore_index=True)
+    path.write_text(json.dumps(out.to_dict(orient="records"), ensure_ascii=False, indent=2),
+                    encoding="utf-8")
+
+def stream_way(n, fmt, path):
+    sink = StreamingSink([make_writer(fmt, path)])
+    for p in pages(n):
+        sink.write_page(p)
+    sink.close()
+
+def main():
+    sizes = [int(x) for x in (sys.argv[1] if len(sys.argv) > 1 else "7314,100000").split(",")]
+    tmp = Path(tempfile.mkdtemp())
+    print(f"{'kayıt':>7} {'yol':<22} {'süre sn':>8} {'boyut MB':>9} {'tepe bellek MB':>15}")
+    for n in sizes:
+        path = tmp / "old.json"
+        dt, peak = measure(lambda: old_way(n, path))
+        print(f"{n:>7} {'eski (indent=2 dump)':<22} {dt:8.2f} {path.stat().st_size / 1e6:9.2f} {peak / 1e6:15.1f}")
+        for fmt in FORMATS:
+            path = tmp / f"products{FORMATS[fmt]}"
+            try:
+                dt, peak = measure(lambda: stream_way(n, fmt, path))
+            except ImportError as e:
+                print(f"{n:>7} {fmt:<22} atlandı ({e})")
+                continue
+            print(f"{n:>7} {fmt:<22} {dt:8.2f} {path.stat().st_size / 1e6:9.2f} {peak / 1e6:15.1f}")
+
+if __name__ == "__main__":
+    main()
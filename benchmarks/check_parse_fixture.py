@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Kaydedilmiş fiyat listesi sayfasıyla (fixtures/price_page.html) ayrıştırma kontrolü, ağsız/tarayıcısız
+- parse_table_html: başlıktaki döviz (USD) varsayılan olur, hücredeki döviz (€, TL, $) onu ezer;
+  lazy görselde data:image yer tutucu atlanıp data-src, yalnız yer tutucu varsa hücrenin
+  background url'si alınır; göreli / // linkler base_url'e göre tamamlanır; <4 hücreli satır atlanır
+- discover_page_param: "1" (javascript:) ve "Sonraki" linkleri değil, "2" linkindeki parametre
+Beklenenden farklıysa farklar yazılır ve çıkış kodu 1.
+
+Kullanım: python benchmarks/check_parse_fixture.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gencer_parse import parse_table_html
+from gencer_http import discover_page_param
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "price_page.html"
+BASE = "https://www.gencerteknik.com/FiyatListesi.asp?kat=5"
+
+EXPECTED = [
+    {"image_url": "https://www.gencerteknik.com/urunler/buyuk/100.01.0001.jpg", "sku": "100.01.0001",
+     "title": "MERİDYEN SUNTA VİDASI 3X16", "stock": "Var", "kdv": "%20", "birim": "BİN",
+     "price": 12.4, "currency": "USD"},
+    {"image_url": "https://gencerteknik.b-cdn.net/urunler/100.01.0002.webp", "sku": "100.01.0002",
+     "title": "MERİDYEN SUNTA VİDASI 4X30", "stock": "Yok", "kdv": "%20", "birim": "BİN",
+     "price": 1234.5, "currency": "EUR"},
+    {"image_url": "https://www.gencerteknik.com/urunler/kucuk/200.05.0110.png", "sku": "200.05.0110",
+     "title": "FIRÇA MENTEŞE 35MM", "stock": "Var", "kdv": "%10", "birim": "ADET",
+     "price": 3.75, "currency": "TRY"},
+    {"image_url": "https://cdn.gencerteknik.com/urunler/300.02.0007.jpg", "sku": "",
+     "title": "Mobilya Ayağı Krom 10cm", "stock": "Var", "kdv": "%20", "birim": "TAKIM",
+     "price": 8.9, "currency": "USD"},
+]
+EXPECTED_PARAM = ("sayfa", "https://www.gencerteknik.com/FiyatListesi.asp?kat=5&sayfa=2")
+
+def main():
+    html = FIXTURE.read_bytes()
+    bad = []
+    got = parse_table_html(html, base_url=BASE)
+    if len(got) != len(EXPECTED):
+        bad.append(f"kayıt sayısı: {len(got)} (beklenen {len(EXPECTED)})")
+    for i, (g, e) in enumerate(zip(got, EXPECTED), 1):
+        for k in e:
+            if g.get(k) != e[k]:
+                bad.append(f"satır {i} {k}: {g.get(k)!r} (beklenen {e[k]!r})")
+    param = discover_page_param(html, BASE)
+    if param != EXPECTED_PARAM:
+        bad.append(f"sayfa parametresi: {param!r} (beklenen {EXPECTED_PARAM!r})")
+    no_pager = html.split(b'<div class="pagination">')[0] + b"</body></html>"
+    if discover_page_param(no_pager, BASE) != (None, None):
+        bad.append("sayfalama linki yokken parametre bulundu")
+
+    print(f"{FIXTURE.name}: {len(got)} kayıt, sayfa parametresi {param[0]!r}")
+    for line in bad:
+        print(f"  FARK  {line}")
+    if bad:
+        sys.exit(1)
+    print("  tamam")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+Yerel sahte bayi portalı (stdlib http.server)
+- /Login.asp : gerçek sitedeki gibi MUSTERI / KULLANICI / şifre formu; POST başarılıysa oturum çerezi
+  verip /Default.asp'ye (menüde "Fiyat Listesi" linki) yönlendirir
+- /FiyatListesi.asp?sayfa=N : parse_table ile aynı kolon düzeninde fiyat tablosu + sayfalama linkleri;
+  require_login ise oturumsuz istek /Login.asp'ye yönlendirilir
+- Son sayfadan sonrası son sayfayı tekrar döndürür (gerçek site gibi)
+- lazy: görseller data: yer tutucu + data-src ile gelir, scroll/load'da küçük bir JS gerçek src'yi koyar
+- /img/<ad> : her görsel adı için sabit, geçerli küçük bir PNG (ETag / If-None-Match -> 304);
+  local_images ise kayıtların image_url'leri buraya çevrilir (indirme ölçümü için, CDN'e gitmeden)
+- Kayıtlar sentetik ya da products.json'dan (from_json); sayfa sayısı ve yapay gecikme ayarlanabilir
+
+Kullanım: python benchmarks/mock_portal.py [sayfa|products.json] [port]
+  GENCER_BASE_URL=http://127.0.0.1:8765 GENCER_MUSTERI=1 GENCER_KULLANICI=a GENCER_SIFRE=b \\
+      python scrape_gencer.py --headless
+"""
+
+import sys, json, time, zlib, struct, hashlib, secrets, threading, html, math
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+CDN = "https://gencerteknik.b-cdn.net/urunler/"
+SESSION_COOKIE = "ASPSESSIONIDMOCK"
+CURRENCY_LABEL = {"TRY": "TL", "USD": "USD", "EUR": "EUR"}
+PLACEHOLDER = "data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7"
+
+# data-src'yi görünür olunca src'ye taşır (sitedeki lazy-load eklentisinin davranışı)
+LAZY_JS = r"""
+function reveal(){
+  document.querySelectorAll("img[data-src]").forEach(function(im){
+    if (im.getBoundingClientRect().top < innerHeight + 300) {
+      im.src = im.getAttribute("data-src"); im.removeAttribute("data-src");
+    }
+  });
+}
+addEventListener("scroll", function(){ setTimeout(reveal, 50); });
+addEventListener("load", reveal);
+"""
+
+def synthetic_record(i):
+    return {"image_url": f"{CDN}p{i}.webp", "sku": f"100.{i // 1000:02d}.{i % 1000:04d}",
+            "title": f"MERİDYEN SUNTA VİDASI 3.5X{i % 90 + 10}", "stock": "Var" if i % 19 else "Yok",
+            "kdv": "%20" if i % 11 else "%10", "birim": "AD", "price": round(10 + i * 0.37, 2),
+            "currency": "TRY"}
+
+def synthetic_records(n):
+    return [synthetic_record(i) for i in range(n)]
+
+def format_price(v):
+    # 1234.5 -> "1.234,50", 495.731 -> "495,731" (en az 2, en fazla 4 ondalık)
+    s = f"{v:,.4f}".rstrip("0")
+    s += "0" * (2 - len(s.split(".")[1]))
+    return s.replace(",", "X").replace(".", ",").replace("X", ".")
+
+def tiny_png(name, size=8):
+    """Ada göre renklenen size x size geçerli PNG (Pillow gerekmeden)."""
+    r, g, b = hashlib.sha1(name.encode("utf-8")).digest()[:3]
+    raw = b"".join(b"\x00" + bytes((r, g, b)) * size for _ in range(size))
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b""))
+
+def render_page(rows, page, pages, lazy=False):
+    e = html.escape
+    def img(url):
+        if lazy:
+            return f'<img class="lazy" src="{PLACEHOLDER}" data-src="{e(url)}">'
+        return f'<img src="{e(url)}">'
+    trs = "".join(
+        f'<tr><td>{img(r["image_url"])}</td><td>{e(r["sku"])}</td><td>{e(r["title"])}</td>'
+        f'<td>{e(r["stock"])}</td><td>{e(r["kdv"])}</td><td>{e(r["birim"])}</td>'
+        f'<td>{format_price(r["price"])} {CURRENCY_LABEL.get(r.get("currency"), "TL")}</td></tr>'
+        for r in rows)
+    lo, hi = max(1, page - 5), min(pages, page + 5)
+    links = "".join(f'<li><a href="FiyatListesi.asp?sayfa={k}">{k}</a></li>' for k in range(lo, hi + 1))
+    if page < pages:
+        links += f'<li class="next"><a rel="next" href="FiyatListesi.asp?sayfa={page + 1}">»</a></li>'
+    script = f"<script>{LAZY_JS}</script>" if lazy else ""
+    return ('<!DOCTYPE html><html><head><meta charset="utf-8"><title>Fiyat Listesi</title></head><body>'
+            '<table><thead><tr><th></th><th>Kod</th><th>Ürün</th><th>Stok</th><th>KDV</th>'
+            f'<th>Birim</th><th>Fiyat (TL)</th></tr></thead><tbody>{trs}</tbody></table>'
+            f'<ul class="pagination">{links}</ul>{script}</body></html>')
+
+def render_login(error=""):
+    msg = f'<p class="error">{html.escape(error)}</p>' if error else ""
+    return ('<!DOCTYPE html><html><head><meta charset="utf-8"><title>Bayi Girişi</title></head><body>'
+            f'<h2>Bayi Girişi</h2>{msg}<form method="post" action="Login.asp">'
+            '<label for="MUSTERI">Müşteri Kodu</label><input type="text" name="MUSTERI" id="MUSTERI">'
+            '<label for="KULLANICI">Kullanıcı Adı</label><input type="text" name="KULLANICI" id="KULLANICI">'
+            '<label for="SIFRE">Şifre</label><input type="password" name="SIFRE" id="SIFRE">'
+            '<button type="submit">Giriş</button></form></body></html>')
+
+def render_home():
+    return ('<!DOCTYPE html><html><head><meta charset="utf-8"><title>Bayi</title></head><body>'
+            '<nav><a href="Default.asp">Ana Sayfa</a> <a href="FiyatListesi.asp">Fiyat Listesi</a> '
+            '<a href="Sepet.asp">Sepet</a> <a href="Cikis.asp">Çıkış</a></nav>'
+            '<p>Hoş geldiniz. Ürün kataloğu ve stok bilgisi için fiyat listesine gidin.</p></body></html>')
+
+class MockPortal:
+    """records yoksa pages * per_page sentetik kayıt; varsa pages kayıt sayısından hesaplanır.
+       credentials=(müşteri, kullanıcı, şifre) verilirse yalnız o bilgiler kabul edilir."""
+    def __init__(self, records=None, pages=None, per_page=50, latency=0.0, port=0, require_login=False,
+                 credentials=None, lazy=False, local_images=False):
+        self.per_page = per_page
+        if records is None:
+            pages = pages or 149
+            records = synthetic_records(pages * per_page)
+        self.pages = pages or max(1, math.ceil(len(records) / per_page))
+        self.latency = latency
+        self.require_login = require_login
+        self.credentials = credentials
+        self.lazy = lazy
+        self.local_images = local_images
+        self.sessions = set()
+        self.hits = 0
+        self.image_hits = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+        if local_images:
+            records = [{**r, "image_url": f"{self.base}/img/{Path(urlsplit(r['image_url']).path).name}"
+                        if r.get("image_url") else ""} for r in records]
+        self.records = records[:self.pages * per_page]
+
+    @classmethod
+    def from_json(cls, path, **kw):
+        """products.json'daki kayıtlarla (pages verilirse ilk pages * per_page kayıt)."""
+        records = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(records=records, **kw)
+
+    @property
+    def base(self):
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    @property
+    def url(self):
+        return f"{self.base}/FiyatListesi.asp"
+
+    @property
+    def login_url(self):
+        return f"{self.base}/Login.asp"
+
+    def page_records(self, page):
+        page = min(max(page, 1), self.pages)
+        return self.records[(page - 1) * self.per_page: page * self.per_page], page
+
+    def check_login(self, musteri, kullanici, sifre):
+        if self.credentials is None:
+            return bool(musteri and kullanici and sifre)
+        return (musteri, kullanici, sifre) == tuple(self.credentials)
+
+    def _handler(self):
+        portal = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *a): pass
+
+            def send_body(self, data, ctype, status=200, headers=()):
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(data)))
+                for k, v in headers:
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def send_html(self, body, status=200, headers=()):
+                self.send_body(body.encode("utf-8"), "text/html; charset=utf-8", status, headers)
+
+            def redirect(self, location, headers=()):
+                self.send_response(302)
+                self.send_header("Location", location)
+                self.send_header("Content-Length", "0")
+                for k, v in headers:
+                    self.send_header(k, v)
+                self.end_headers()
+
+            def logged_in(self):
+                for part in (self.headers.get("Cookie") or "").split(";"):
+                    k, _, v = part.strip().partition("=")
+                    if k == SESSION_COOKIE and v in portal.sessions:
+                        return True
+                return False
+
+            def send_image(self, name):
+                with portal._lock:
+                    portal.image_hits += 1
+                etag = '"' + hashlib.sha1(name.encode("utf-8")).hexdigest()[:16] + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_body(tiny_png(name), "image/png", headers=[("ETag", etag)])
+
+            def do_GET(self):
+                with portal._lock:
+                    portal.hits += 1
+                if portal.latency:
+                    time.sleep(portal.latency)
+                parts = urlsplit(self.path)
+                path = parts.path.lower()
+                if path.startswith("/img/"):
+                    return self.send_image(parts.path[5:])
+                if path == "/login.asp":
+                    return self.send_html(render_login())
+                if path in ("/", "/default.asp"):
+                    if portal.require_login and not self.logged_in():
+                        return self.redirect("/Login.asp")
+                    return self.send_html(render_home())
+                if path != "/fiyatlistesi.asp":
+                    return self.send_html("<h1>404</h1>", 404)
+                if portal.require_login and not self.logged_in():
+                    return self.redirect("/Login.asp")
+                try: page = int(parse_qs(parts.query).get("sayfa", ["1"])[0])
+                except ValueError: page = 1
+                rows, page = portal.page_records(page)
+                self.send_html(render_page(rows, page, portal.pages, lazy=portal.lazy))
+
+            def do_POST(self):
+                if urlsplit(self.path).path.lower() != "/login.asp":
+                    return self.send_html("<h1>404</h1>", 404)
+                if portal.latency:
+                    time.sleep(portal.latency)
+                n = int(self.headers.get("Content-Length") or 0)
+                form = {k: v[0] for k, v in parse_qs(self.rfile.read(n).decode("utf-8")).items()}
+                if not portal.check_login(form.get("MUSTERI"), form.get("KULLANICI"), form.get("SIFRE")):
+                    return self.send_html(render_login("Müşteri kodu, kullanıcı adı veya şifre hatalı."))
+                token = secrets.token_hex(12)
+                with portal._lock:
+                    portal.sessions.add(token)
+                self.redirect("/Default.asp", headers=[("Set-Cookie", f"{SESSION_COOKIE}={token}; Path=/")])
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self): return self.start()
+    def __exit__(self, *exc): self.stop()
+
+if __name__ == "__main__":
+    src = sys.argv[1] if len(sys.argv) > 1 else "149"
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+    opts = dict(port=port, require_login=True, lazy=True, local_images=True)
+    portal = MockPortal(pages=int(src), **opts) if src.isdigit() else MockPortal.from_json(src, **opts)
+    with portal as p:
+        print(f"Sahte portal: {p.login_url}  ({p.pages} sayfa, {len(p.records)} kayıt; Ctrl+C ile çık)")
+        try:
+            while True: time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Fiyat / stok değişim bildirimleri (kayıt parmak izleriyle, önceki products.json yüklenmeden)
+- Her normalize kayda kararlı parmak izi: blake2b-64(price, currency, stock, kdv, birim, title)
+- _cache/fingerprints.tsv: SKU başına "sku  parmak_izi  fiyat  döviz  stok" (products.json'un
+  ~1/6'sı); her koşuda tek geçişte karşılaştırılıp yeniden yazılır
+- Parmak izi aynıysa kayda bakılmaz; farklıysa:
+  - fiyat en az price_pct % (ve/veya price_abs) oynadıysa "price" uyarısı (döviz değiştiyse karşılaştırılmaz)
+  - stok metni değiştiyse ("Var" -> "Yok") "stock" uyarısı
+- Uyarılar takılabilir hedeflere gider: dosya (logs/alerts.jsonl), webhook, e-posta
+  (URL / SMTP sunucusu verilmemişse yerelde denemek için taslak: loglar / logs/outbox/*.eml)
+
+Yapılandırma (.env): GENCER_ALERT_WEBHOOK, GENCER_ALERT_EMAIL, GENCER_ALERT_FROM,
+GENCER_SMTP_HOST, GENCER_SMTP_PORT, GENCER_SMTP_USER, GENCER_SMTP_PASSWORD
+"""
+
+import os, json, datetime
+from hashlib import blake2b
+from email.message import EmailMessage
+
+from gencer_cache import atomic_write_text
+from gencer_common import CACHE_DIR, LOGS, log
+
+FINGERPRINTS_PATH = CACHE_DIR / "fingerprints.tsv"
+FP_FIELDS = ("price", "currency", "stock", "kdv", "birim", "title")
+HEADER = "# gencer fingerprints v1: sku\tfp\tprice\tcurrency\tstock\n"
+SINKS = ("file", "webhook", "email")
+# scrape_gencer ve gencer_pipeline normalize CLI'ları aynı varsayılanı kullanır
+DEFAULT_SINKS = "file"
+DEFAULT_PRICE_PCT = 5.0
+
+def _price(v):
+    try: return float(v or 0.0)
+    except (TypeError, ValueError): return 0.0
+
+def _fp(price, cur, stock, kdv, birim, title):
+    blob = f"{price!r}\x1f{cur}\x1f{stock}\x1f{kdv}\x1f{birim}\x1f{title}".encode("utf-8")
+    return blake2b(blob, digest_size=8).hexdigest()
+
+def fingerprint(r):
+    """16 hex karakter; fiyat float repr ile (495.731 ve "495.7310" aynı), metinler olduğu gibi."""
+    return _fp(_price(r.get("price")), *(r.get(f) or "" for f in FP_FIELDS[1:]))
+
+def _clean(s):
+    return str(s or "").replace("\t", " ").replace("\n", " ")
+
+# --- SKU -> parmak izi indeksi ---
+def load_index(path=FINGERPRINTS_PATH):
+    """{sku: (fp, price, currency, stock)}; dosya yoksa/bozuksa boş."""
+    out = {}
+    try:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                if line.startswith("#"): continue
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) == 5:
+                    out[parts[0]] = (parts[1], float(parts[2]), parts[3], parts[4])
+    except (OSError, ValueError):
+        return {}
+    return out
+
+def save_index(index, path=FINGERPRINTS_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(path, HEADER + "".join(
+        f"{_clean(sku)}\t{fp}\t{price!r}\t{_clean(cur)}\t{_clean(stock)}\n"
+        for sku, (fp, price, cur, stock) in index.items()))
+
+class ChangeWatch:
+    """normalize_and_save satırları add() ile verir; sonda alerts + save()."""
+    def __init__(self, path=FINGERPRINTS_PATH, price_pct=DEFAULT_PRICE_PCT, price_abs=0.0):
+        self.path = path
+        self.price_pct, self.price_abs = price_pct, price_abs
+        self.prev = load_index(path)
+        self.index = {}
+        self.alerts = []
+        self.changed = 0
+
+    def add(self, r):
+        sku = r.get("sku")
+        if not sku:
+            return
+        get = r.get
+        price, cur, stock = _price(get("price")), get("currency") or "", get("stock") or ""
+        fp = _fp(price, cur, stock, get("kdv") or "", get("birim") or "", get("title") or "")
+        self.index[sku] = (fp, price, cur, stock)
+        old = self.prev.get(sku)
+        if old is None or old[0] == fp:
+            return
+        self.changed += 1
+        _, old_price, old_cur, old_stock = old
+        base = {"sku": sku, "title": get("title") or "", "currency": cur}
+        if old_cur == cur and old_price != price:
+            delta = price - old_price
+            pct = delta / old_price * 100 if old_price else None
+            if (pct is None or abs(pct) >= self.price_pct) and abs(delta) >= self.price_abs:
+                self.alerts.append({**base, "kind": "price", "old": old_price, "new": price,
+                                    "pct": None if pct is None else round(pct, 2)})
+        if old_stock != stock:
+            self.alerts.append({**base, "kind": "stock", "old": old_stock, "new": stock})
+
+    def save(self):
+        save_index(self.index, self.path)
+
+# --- hedefler ---
+def alert_line(a):
+    if a["kind"] == "price":
+        pct = f" ({a['pct']:+.1f}%)" if a["pct"] is not None else ""
+        return f"{a['sku']} {a['title']}: {a['old']:g} -> {a['new']:g} {a['currency']}{pct}"
+    return f"{a['sku']} {a['title']}: stok {a['old'] or '-'} -> {a['new'] or '-'}"
+
+class FileSink:
+    """Her uyarı bir JSON satırı (zaman damgalı), dosyaya eklenir."""
+    def __init__(self, path=LOGS / "alerts.jsonl"):
+        self.path = path
+
+    def send(self, alerts, at):
+        with open(self.path, "a", encoding="utf-8") as fh:
+            for a in alerts:
+                fh.write(json.dumps({"at": at, **a}, ensure_ascii=False) + "\n")
+
+class WebhookSink:
+    """url verilmişse JSON POST {at, count, alerts}; yoksa taslak (yalnız log)."""
+    def __init__(self, url=None, timeout=10):
+        self.url, self.timeout = url, timeout
+
+    def send(self, alerts, at):
+        payload = {"at": at, "count": len(alerts), "alerts": alerts}
+        if not self.url:
+            log(f"Webhook (taslak): {len(alerts)} uyarı, {len(json.dumps(payload))} bayt")
+            return
+        import requests  # yalnız gerçekten gönderilirken
+        requests.post(self.url, json=payload, timeout=self.timeout).raise_for_status()
+
+class EmailSink:
+    """smtp_host verilmişse gönderir; yoksa .eml dosyası olarak outbox'a yazar (taslak)."""
+    def __init__(self, to, sender=None, smtp_host=None, port=587, user=None, password=None,
+                 outbox=LOGS / "outbox"):
+        self.to, self.sender = to, sender or "gencer-scraper@localhost"
+        self.smtp_host, self.port, self.user, self.password = smtp_host, port, user, password
+        self.outbox = outbox
+
+    def message(self, alerts, at):
+        msg = EmailMessage()
+        msg["Subject"] = f"Gencer: {len(alerts)} fiyat/stok değişikliği ({at[:10]})"
+        msg["From"], msg["To"] = self.sender, self.to
+        msg.set_content("\n".join(alert_line(a) for a in alerts) + "\n")
+        return msg
+
+    def send(self, alerts, at):
+        msg = self.message(alerts, at)
+        if not self.smtp_host:
+            self.outbox.mkdir(parents=True, exist_ok=True)
+            path = self.outbox / f"alerts_{at.replace(':', '')}.eml"
+            path.write_bytes(bytes(msg))
+            log(f"E-posta (taslak): {path}")
+            return
+        import smtplib
+        with smtplib.SMTP(self.smtp_host, self.port, timeout=30) as s:
+            s.starttls()
+            if self.user: s.login(self.user, self.password or "")
+            s.send_message(msg)
+
+def make_sinks(names):
+    """'file', 'webhook', 'email' -> hedef nesneleri (ayarlar ortam değişkenlerinden)."""
+    env = os.getenv
+    out = []
+    for name in names:
+        if name == "file":
+            out.append(FileSink())
+        elif name == "webhook":
+            out.append(WebhookSink(env("GENCER_ALERT_WEBHOOK")))
+        elif name == "email":
+            out.append(EmailSink(env("GENCER_ALERT_EMAIL", "satinalma@localhost"), env("GENCER_ALERT_FROM"),
+                                 env("GENCER_SMTP_HOST"), int(env("GENCER_SMTP_PORT", "587")),
+                                 env("GENCER_SMTP_USER"), env("GENCER_SMTP_PASSWORD")))
+        else:
+            raise ValueError(f"bilinmeyen uyarı hedefi: {name}")
+    return out
+
+def notify(alerts, sinks):
+    """Her hedef ayrı denenir; biri hata verirse diğerleri yine gönderilir. Başarılı hedef sayısı."""
+    if not alerts or not sinks:
+        return 0
+    at = datetime.datetime.now().isoformat(timespec="seconds")
+    ok = 0
+    for sink in sinks:
+        try:
+            sink.send(alerts, at); ok += 1
+        except Exception as e:
+            log(f"Uyarı gönderilemedi ({type(sink).__name__}): {e}")
+    return ok
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Sayfa bazlı disk checkpoint'i (yarıda kalan gezmeyi sürdürmek için)
+- _cache/pages/0001.json: {page, hash, records}; hash tablo HTML'inin sha1'i
+- Aynı sayfa aynı hash ile gelirse kayıtlar yeniden ayrıştırılmadan buradan alınır
+- run.json: bu koşuda sırayla tamamlanan son sayfa + bitti mi; --resume buradan devam eder
+  (yalnız aynı gün başlamış koşular için). Erken bitişte stopped_at (sonraki sayfalar önbellekte
+  yok), parçalı koşuda sharded (sayfalar önbelleğe yazılmaz) işaretlenir
+Yazmalar geçici dosya + os.replace ile atomik (çökme yarım dosya bırakmaz); geçici dosya adı
+yazan sürece özgü (paralel parça süreçleri aynı dosyayı yazarken birbirinin .tmp'sini taşımasın).
+"""
+
+import os, json, hashlib, datetime, tempfile
+
+from gencer_common import log
+
+def atomic_write_bytes(path, data):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try: os.unlink(tmp)
+        except OSError: pass
+        raise
+
+def atomic_write_text(path, text):
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+def content_hash(html):
+    """Sadece <table>...</table> kısmının hash'i (sayfadaki saat, oturum vb. etkilemesin)."""
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    lo = html.lower()
+    a, b = lo.find(b"<table"), lo.rfind(b"</table>")
+    if a >= 0 and b > a:
+        html = html[a:b + 8]
+    return hashlib.sha1(html).hexdigest()
+
+class PageCache:
+    def __init__(self, root):
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.state_path = root / "run.json"
+        self.state = {"started": None, "last_page": 0, "complete": True}
+
+    def _page_path(self, page):
+        return self.root / f"{page:04d}.json"
+
+    def get(self, page):
+        try: return json.loads(self._page_path(page).read_text(encoding="utf-8"))
+        except (OSError, ValueError): return None
+
+    def lookup(self, page, h):
+        """Önbellekteki sayfa aynı hash'e sahipse kayıtlarını döner, yoksa None."""
+        entry = self.get(page)
+        return entry["records"] if entry and entry.get("hash") == h else None
+
+    def put(self, page, h, records):
+        atomic_write_text(self._page_path(page), json.dumps(
+            {"page": page, "hash": h, "records": records}, ensure_ascii=False,
+            separators=(",", ":"), default=str))
+
+    # --- koşu durumu ---
+    def _save_state(self):
+        atomic_write_text(self.state_path, json.dumps(self.state))
+
+    def start(self, resume=False, sharded=False):
+        """Yeni koşu başlatır (sharded=True: sayfalar önbelleğe yazılmayacak, devam edilemez); resume=True ve önceki koşu bugün başlayıp yarım kaldıysa devam
+           noktasını döner (son tamamlanan sayfa, 1..o sayfa kayıtları). Aksi halde (0, []).
+           Önceki günden kalan yarım koşudan devam edilmez (dünün fiyatları bugüne karışmasın)."""
+        try: prev = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError): prev = None
+        today = datetime.date.today().isoformat()
+        if resume and not sharded and prev and not prev.get("complete") and prev.get("last_page") and \
+                (prev.get("started") or "")[:10] != today:
+            log(f"Yarım kalan koşu {prev.get('started')} tarihli, devam edilmiyor; baştan gezilecek")
+        elif resume and not sharded and prev and not prev.get("complete") and prev.get("last_page"):
+            records = []
+            for p in range(1, prev["last_page"] + 1):
+                entry = self.get(p)
+                if entry is None:
+                    break
+                records.extend(entry["records"])
+            else:
+                self.state = {**prev, "resumed": datetime.datetime.now().isoformat(timespec="seconds")}
+                self._save_state()
+                return prev["last_page"], records
+        self.state = {"started": datetime.datetime.now().isoformat(timespec="seconds"),
+                      "last_page": 0, "complete": False}
+        if sharded: self.state["sharded"] = True
+        self._save_state()
+        return 0, []
+
+    def done(self, page):
+        """Sayfa (sırayla) tamamlandı."""
+        self.state["last_page"] = page
+        self._save_state()
+
+    def finish(self, stopped_at=None):
+        """Koşu bitti; stopped_at: erken bitişte son gezilen sayfa (sonrası önceki koşudan)."""
+        self.state["complete"] = True
+        if stopped_at: self.state["stopped_at"] = stopped_at
+        self._save_state()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Kolon bazlı, sıkıştırılmış katalog (sayfa sayfa DataFrame + concat yerine)
+- Az değerli kolonlar (stock, kdv, birim, currency) sözlük + kod dizisi olarak tutulur:
+  "TRY", "Var", "%20", "BİN" her satırda tekrar etmez, satır başına 1-2 bayt
+- image_url: önek (".../urunler/") sözlükte, satırda yalnız önek kodu + dosya adı
+- price: array('d'), eksik fiyat NaN
+- sku / title: düz str listeleri (zaten tekil)
+- extend(kayıtlar) her sayfada çağrılır; diziler yerinde büyür, concat yok
+- products.json şemasıyla gidiş-dönüş: from_json / to_json, records(), to_frame()
+
+Kullanım:
+    cat = Catalog()
+    cat.extend(page_records)        # her sayfada
+    df = cat.to_frame()             # normalize_frame için (pandas yalnız burada yüklenir)
+"""
+
+import sys, json
+from array import array
+from math import nan
+
+from gencer_writers import FIELDS, JsonWriter
+
+CATEGORICAL = ("stock", "kdv", "birim", "currency")
+
+class Interned:
+    """Sözlük kodlu kolon; kod 0 = None."""
+    def __init__(self):
+        self.values = [None]
+        self.index = {None: 0}
+        self.codes = array("B")
+
+    def code(self, v):
+        if v != v:  # pandas NaN -> None
+            v = None
+        c = self.index.get(v)
+        if c is None:
+            c = self.index[v] = len(self.values)
+            self.values.append(v)
+            if c > 255 and self.codes.typecode == "B":
+                self.codes = array("H", self.codes)
+            elif c > 65535 and self.codes.typecode == "H":
+                self.codes = array("I", self.codes)
+        return c
+
+    def append(self, v):
+        self.codes.append(self.code(v))
+
+    def __getitem__(self, i):
+        return self.values[self.codes[i]]
+
+    def __iter__(self):
+        vals = self.values
+        return (vals[c] for c in self.codes)
+
+    def __len__(self):
+        return len(self.codes)
+
+def _missing(v):
+    return None if v != v else v
+
+def _float(v):
+    try: return float(v)
+    except (TypeError, ValueError): return nan
+
+def split_url(url):
+    """'https://cdn/urunler/a.webp' -> ('https://cdn/urunler/', 'a.webp')."""
+    if not isinstance(url, str):
+        return None, url
+    i = url.rfind("/") + 1
+    return url[:i], url[i:]
+
+class Catalog:
+    def __init__(self, records=()):
+        self.sku, self.title = [], []
+        self.cols = {f: Interned() for f in CATEGORICAL}
+        self.url_prefix, self.url_name = Interned(), []
+        self.price = array("d")
+        self.extend(records)
+
+    def __len__(self):
+        return len(self.sku)
+
+    def append(self, r):
+        get = r.get
+        self.sku.append(_missing(get("sku")))
+        self.title.append(_missing(get("title")))
+        for f, col in self.cols.items():
+            col.append(get(f))
+        prefix, name = split_url(_missing(get("image_url")))
+        self.url_prefix.append(prefix)
+        self.url_name.append(name)
+        p = get("price")
+        try: self.price.append(nan if p is None else p)
+        except TypeError: self.price.append(_float(p))
+
+    def extend(self, records):
+        for r in records:
+            self.append(r)
+        return self
+
+    # --- okuma ---
+    def image_urls(self):
+        return (n if p is None else p + n for p, n in zip(self.url_prefix, self.url_name))
+
+    def records(self):
+        """products.json sırasıyla dict'ler (NaN fiyat -> None)."""
+        cols = {"image_url": self.image_urls(), "sku": self.sku, "title": self.title,
+                "price": (None if p != p else p for p in self.price)}
+        cols.update(self.cols)
+        return (dict(zip(FIELDS, row)) for row in zip(*(cols[f] for f in FIELDS)))
+
+    __iter__ = records
+
+    def to_frame(self, categorical=False):
+        """pandas DataFrame; categorical=True ise az değerli kolonlar category dtype."""
+        import pandas as pd
+        data = {"image_url": list(self.image_urls()), "sku": self.sku, "title": self.title,
+                "price": pd.array(self.price, dtype="float64")}
+        for f, col in self.cols.items():
+            if categorical:
+                codes = [c - 1 for c in col.codes]  # None -> -1 (pandas'ta eksik)
+                data[f] = pd.Categorical.from_codes(codes, col.values[1:])
+            else:
+                data[f] = list(col)
+        return pd.DataFrame(data, columns=FIELDS)
+
+    # --- products.json ---
+    @classmethod
+    def from_json(cls, path):
+        with open(path, encoding="utf-8") as fh:
+            return cls(json.load(fh))
+
+    def to_json(self, path, indent=2):
+        with JsonWriter(path, indent=indent) as jw:
+            jw.write_many(self.records())
+
+    # --- bellek ---
+    def nbytes(self):
+        """Derin bellek tahmini (bayt): kaplar + her tekil str nesnesi bir kez."""
+        seen, total = set(), 0
+        def obj(o):
+            nonlocal total
+            if id(o) not in seen:
+                seen.add(id(o)); total += sys.getsizeof(o)
+        for lst in (self.sku, self.title, self.url_name, self.price):
+            obj(lst)
+            if lst is not self.price:
+                for s in lst: obj(s)
+        for col in (*self.cols.values(), self.url_prefix):
+            obj(col.codes); obj(col.values); obj(col.index)
+            for s in col.values: obj(s)
+        return total
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""Ortak yollar ve log (scraper modüllerinin hepsi buradan alır)."""
+
+import os, datetime
+from pathlib import Path
+
+# bayi portalı (benchmarks/mock_portal.py ile yerelde denemek için GENCER_BASE_URL)
+BASE_URL = os.getenv("GENCER_BASE_URL", "https://bayi.gencerteknik.com.tr").rstrip("/")
+
+# --- yollar ---
+ROOT = Path(__file__).resolve().parent
+CSV_PATH = ROOT / "products.csv"
+JSON_PATH = ROOT / "products.json"
+CHANGES_PATH = ROOT / "changes.json"
+PAGE_HASHES_PATH = ROOT / "page_hashes.json"
+DOWNLOADS = ROOT / "_downloads"
+CACHE_DIR = ROOT / "_cache"
+LOGS = ROOT / "logs"
+for d in (DOWNLOADS, LOGS):
+    d.mkdir(parents=True, exist_ok=True)
+
+def log(msg): print(f"[{datetime.datetime.now():%Y-%m-%d %H:%M:%S}] {msg}")
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Artımlı senkron: önceki products.json ile fark
+- Önceki snapshot SKU ile indekslenir
+- added / removed / changed (price, stock, title, image_url) hesaplanır
+- Kompakt changes.json yazılır; apply_changes ile önceki listeye uygulanabilir
+- PageHashes: sayfa içerik hash'leri; art arda N sayfa geçen koşuyla aynıysa gezme erken bitirilir,
+  kalan sayfaların kayıtları önceki snapshot'tan alınır
+"""
+
+import json, hashlib, datetime
+
+DIFF_FIELDS = ("price", "stock", "title", "image_url")
+
+def load_snapshot(path):
+    """products.json -> {sku: kayıt}. Dosya yoksa/bozuksa boş dict."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {r["sku"]: r for r in data if r.get("sku")}
+
+def _same(field, a, b):
+    if field == "price":
+        try: return abs(float(a) - float(b)) < 1e-9
+        except (TypeError, ValueError): pass
+    return a == b
+
+class DiffBuilder:
+    """Kayıtlar tek tek verilerek fark çıkarılır (yeni katalog listesi bellekte tutulmaz)."""
+    def __init__(self, prev):
+        self.prev = prev
+        self.added, self.changed, self.seen = [], [], set()
+
+    def add(self, r):
+        sku = r["sku"]
+        self.seen.add(sku)
+        old = self.prev.get(sku)
+        if old is None:
+            self.added.append(r)
+            return
+        ch = {f: [old.get(f), r.get(f)] for f in DIFF_FIELDS if not _same(f, old.get(f), r.get(f))}
+        if ch:
+            self.changed.append({"sku": sku, "changes": ch})
+
+    def result(self):
+        removed = [sku for sku in self.prev if sku not in self.seen]
+        return {"added": self.added, "removed": removed, "changed": self.changed}
+
+def diff_records(prev, records):
+    """prev: {sku: kayıt}, records: yeni kayıt listesi (SKU tekil)."""
+    d = DiffBuilder(prev)
+    for r in records:
+        d.add(r)
+    return d.result()
+
+def write_changes(path, delta, base_count, count):
+    doc = {"generated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+           "base_count": base_count, "count": count, **delta}
+    path.write_text(json.dumps(doc, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+
+def apply_changes(prev_records, delta):
+    """Önceki kayıt listesine changes.json'u uygular (tüketici tarafı için)."""
+    removed = set(delta.get("removed", []))
+    changed = {c["sku"]: c["changes"] for c in delta.get("changed", [])}
+    out = []
+    for r in prev_records:
+        if r["sku"] in removed: continue
+        if r["sku"] in changed:
+            r = {**r, **{f: v[1] for f, v in changed[r["sku"]].items()}}
+        out.append(r)
+    return out + list(delta.get("added", []))
+
+def page_hash(records):
+    blob = json.dumps(records, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+class PageHashes:
+    """Sayfa başına {hash, skus}; collect_all_pages/crawl_http'ye on_page olarak verilir.
+       stop_after>0 ise art arda o kadar sayfa önceki koşuyla aynıysa True döner (gezmeyi bitir)."""
+    def __init__(self, path, stop_after=0):
+        self.path = path
+        self.stop_after = stop_after
+        try: self.prev = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError): self.prev = {}
+        self.pages = {}
+        self.unchanged_run = 0
+        self.stopped_at = None
+
+    def record(self, page, records):
+        """Bu koşunun sayfası (ör. --resume ile önbellekten gelen); erken bitiş sayacına girmez."""
+        h = page_hash(records)
+        self.pages[str(page)] = {"hash": h, "skus": [r.get("sku", "") for r in records]}
+        return h
+
+    def __call__(self, page, records):
+        h = self.record(page, records)
+        same = self.prev.get(str(page), {}).get("hash") == h
+        self.unchanged_run = self.unchanged_run + 1 if same else 0
+        if self.stop_after and self.unchanged_run >= self.stop_after:
+            self.stopped_at = page
+            return True
+        return False
+
+    def tail_skus(self):
+        """Erken bitişte gezilmeyen sayfaların (önceki koşudaki) SKU'ları, sayfa sırasıyla."""
+        if self.stopped_at is None:
+            return []
+        tail = sorted((int(p), v) for p, v in self.prev.items() if int(p) > self.stopped_at)
+        for p, v in tail:
+            self.pages[str(p)] = v
+        return [s for _, v in tail for s in v["skus"]]
+
+    def save(self):
+        """Bu koşuda görülmeyen ara sayfalar (en yüksek görülen sayfanın altında) önceki koşudan
+           taşınır; sonraki koşunun karşılaştırması ve tail_skus eksik tabanla çalışmasın.
+           Liste kısaldıysa en yüksek sayfanın üstündekiler taşınmaz."""
+        top = max(map(int, self.pages), default=0)
+        for p, v in self.prev.items():
+            if int(p) < top and p not in self.pages:
+                self.pages[p] = v
+        out = dict(sorted(self.pages.items(), key=lambda kv: int(kv[0])))
+        self.path.write_text(json.dumps(out, ensure_ascii=False, separators=(",", ":")),
+                             encoding="utf-8")
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+chromedriver yolunun çözümlenmesi (her koşuda ChromeDriverManager().install() yerine)
+- Sırayla: GENCER_CHROMEDRIVER (elle verilen yol) -> _cache/chromedriver.json'daki yol
+  -> webdriver_manager (yalnız gerektiğinde import edilir) -> None (Selenium Manager çözer)
+- GENCER_CHROMEDRIVER_VERSION ile sürüm sabitlenebilir; önbellekteki sürüm farklıysa yeniden indirilir
+- Sabitlenmemişse önbellek MAX_AGE sonra tazelenir (Chrome güncellemelerini takip etmek için);
+  indirme başarısız olursa (ağ yok) eski yol kullanılmaya devam eder
+- Chrome sürümü sürücüyle uyuşmazsa init_driver invalidate() edip bir kez daha dener
+"""
+
+import os, re, json, time, subprocess
+from pathlib import Path
+
+from gencer_cache import atomic_write_text
+from gencer_common import CACHE_DIR, log
+
+DRIVER_CACHE = CACHE_DIR / "chromedriver.json"
+MAX_AGE = 7 * 24 * 3600
+
+def driver_version(path):
+    """'ChromeDriver 129.0.6668.70 (...)' -> '129.0.6668.70' (çalıştırılamazsa None)."""
+    try:
+        out = subprocess.run([str(path), "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    m = re.search(r"(\d+(?:\.\d+)+)", out or "")
+    return m.group(1) if m else None
+
+def _load(path=DRIVER_CACHE):
+    try: return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError): return {}
+
+def _matches(version, pin):
+    """pin '129' ya da '129.0.6668.70' olabilir."""
+    return not pin or (version or "").split(".")[:len(pin.split("."))] == pin.split(".")
+
+def resolve_chromedriver(pin=None, cache_path=DRIVER_CACHE):
+    """chromedriver yolu (str) ya da None (Selenium Manager'a bırak)."""
+    explicit = os.getenv("GENCER_CHROMEDRIVER")
+    if explicit:
+        return explicit
+    pin = pin or os.getenv("GENCER_CHROMEDRIVER_VERSION") or None
+    cached = _load(cache_path)
+    fresh = pin or time.time() - cached.get("resolved_at", 0) < MAX_AGE
+    if cached.get("path") and Path(cached["path"]).exists() and fresh and _matches(cached.get("version"), pin):
+        return cached["path"]
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager(driver_version=pin).install()
+    except Exception as e:
+        if cached.get("path") and Path(cached["path"]).exists():
+            log(f"chromedriver güncellenemedi ({e}), önbellekteki kullanılıyor: {cached['path']}")
+            return cached["path"]
+        log(f"chromedriver çözümlenemedi ({e}), Selenium Manager denenecek")
+        return None
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(cache_path, json.dumps({"path": path, "version": driver_version(path), "pin": pin,
+                                              "resolved_at": time.time()}, indent=2))
+    return path
+
+def invalidate(cache_path=DRIVER_CACHE):
+    cache_path.unlink(missing_ok=True)
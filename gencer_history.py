@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite fiyat geçmişi (products.json git geçmişini taramadan sorgulamak için)
+- products: SKU başına son bilinen hali (kdv_pct: "%20" -> 20.0, normalize_frame'den)
+- price_observations: her koşuda SKU başına bir satır (yalnız ekleme), (sku, observed_at) indeksli
+- runs: koşu tarihleri (sorgular bunların arasındaki gözlemleri indeksle eşleştirir)
+- stock_changes: ekleme sırasında önceki koşuya göre stok durumu değişenler
+- WAL modu, toplu eklemeler tek transaction içinde parti parti
+Sorgular: fiyatı belli oranda değişenler, stok durumu değişenler
+
+Kullanım:
+  python gencer_history.py import products.json [--at 2026-10-01]
+  python gencer_history.py price-changes --since 2026-10-01 --min-pct 10
+  python gencer_history.py stock-flips --since 2026-10-01
+"""
+
+import re, sys, json, sqlite3, argparse, datetime
+from pathlib import Path
+
+from gencer_common import ROOT
+
+DB_PATH = ROOT / "price_history.sqlite"
+KDV_RE = re.compile(r"(\d+(?:[.,]\d+)?)")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    sku        TEXT PRIMARY KEY,
+    title      TEXT,
+    image_url  TEXT,
+    stock      TEXT,
+    kdv        TEXT,
+    kdv_pct    REAL,
+    birim      TEXT,
+    price      REAL,
+    currency   TEXT,
+    first_seen TEXT,
+    last_seen  TEXT
+);
+CREATE TABLE IF NOT EXISTS price_observations (
+    sku         TEXT NOT NULL,
+    observed_at TEXT NOT NULL,
+    price       REAL,
+    currency    TEXT,
+    stock       TEXT,
+    PRIMARY KEY (sku, observed_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_obs_date ON price_observations (observed_at);
+CREATE TABLE IF NOT EXISTS runs (
+    observed_at TEXT PRIMARY KEY,
+    n           INTEGER
+);
+CREATE TABLE IF NOT EXISTS stock_changes (
+    sku         TEXT NOT NULL,
+    observed_at TEXT NOT NULL,
+    prev_stock  TEXT,
+    stock       TEXT,
+    PRIMARY KEY (observed_at, sku)
+) WITHOUT ROWID;
+"""
+
+def connect(path=DB_PATH):
+    con = sqlite3.connect(str(path))
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.executescript(SCHEMA)
+    if "kdv_pct" not in {r[1] for r in con.execute("PRAGMA table_info(products)")}:
+        con.execute("ALTER TABLE products ADD COLUMN kdv_pct REAL")  # eski veritabanları
+    return con
+
+def _kdv_pct(r):
+    """normalize_frame'in kdv_pct'si; yoksa (products.json içe aktarımı) kdv metninden."""
+    v = r.get("kdv_pct")
+    if v is None:
+        m = KDV_RE.search(r.get("kdv") or "")
+        v = float(m.group(1).replace(",", ".")) if m else None
+    return None if v is None or v != v else float(v)
+
+def _batches(it, size):
+    buf = []
+    for x in it:
+        buf.append(x)
+        if len(buf) >= size:
+            yield buf; buf = []
+    if buf:
+        yield buf
+
+def upsert_run(con, records, observed_at=None, batch_size=2000):
+    """Bir koşunun kayıtlarını ekler. observed_at: 'YYYY-MM-DD' (varsayılan bugün); koşular tarih
+       sırasıyla eklenmeli. Aynı gün tekrar çalışırsa o günün gözlemi güncellenir.
+       Stok durumu önceki koşuya (o SKU'nun önceki günkü gözlemine) göre değişenler stock_changes'e
+       de yazılır; aynı gün tekrarında o günün eski satırları yerine. Satır sayısını döner."""
+    observed_at = observed_at or datetime.date.today().isoformat()
+    con.execute("CREATE TEMP TABLE IF NOT EXISTS _run (sku TEXT PRIMARY KEY, title, image_url,"
+                " stock, kdv, kdv_pct, birim, price, currency)")
+    n = 0
+    for batch in _batches(records, batch_size):
+        with con:  # parti başına bir transaction
+            con.execute("DELETE FROM _run")
+            con.executemany(
+                "INSERT OR REPLACE INTO _run VALUES (?,?,?,?,?,?,?,?,?)",
+                [(r["sku"], r.get("title"), r.get("image_url"), r.get("stock"), r.get("kdv"),
+                  _kdv_pct(r), r.get("birim"), r.get("price"), r.get("currency")) for r in batch])
+            # aynı gün yeniden koşulursa ilk geçişin stok değişimleri silinip önceki günün
+            # gözlemine göre yeniden hesaplanır (products o gün zaten güncellenmiş olabilir)
+            con.execute("DELETE FROM stock_changes WHERE observed_at = ? AND sku IN (SELECT sku FROM _run)",
+                        (observed_at,))
+            con.execute(
+                "INSERT INTO stock_changes (sku, observed_at, prev_stock, stock)"
+                " SELECT r.sku, ?, o.stock, r.stock FROM _run r JOIN price_observations o ON o.sku = r.sku"
+                " AND o.observed_at = (SELECT MAX(observed_at) FROM price_observations"
+                " WHERE sku = r.sku AND observed_at < ?)"
+                " WHERE o.stock <> r.stock", (observed_at, observed_at))
+            con.execute(
+                "INSERT INTO products (sku, title, image_url, stock, kdv, kdv_pct, birim, price, currency,"
+                " first_seen, last_seen) SELECT *, ?, ? FROM _run WHERE true"
+                " ON CONFLICT(sku) DO UPDATE SET title=excluded.title, image_url=excluded.image_url,"
+                " stock=excluded.stock, kdv=excluded.kdv, kdv_pct=excluded.kdv_pct,"
+                " birim=excluded.birim, price=excluded.price,"
+                " currency=excluded.currency, last_seen=excluded.last_seen",
+                (observed_at, observed_at))
+            con.execute(
+                "INSERT OR REPLACE INTO price_observations (sku, observed_at, price, currency, stock)"
+                " SELECT sku, ?, price, currency, stock FROM _run", (observed_at,))
+        n += len(batch)
+    with con:
+        con.execute("INSERT OR REPLACE INTO runs (observed_at, n) VALUES (?, ?)", (observed_at, n))
+    return n
+
+def run_dates(con, since, until=None):
+    return [r[0] for r in con.execute(
+        "SELECT observed_at FROM runs WHERE observed_at BETWEEN ? AND ? ORDER BY observed_at",
+        (since, until or "9999-12-31"))]
+
+def price_changes(con, since, until=None, min_pct=10.0):
+    """Aralıktaki ilk ve son koşu arasında fiyatı en az min_pct % değişen SKU'lar
+       (min_pct negatifse o kadar düşenler). Para birimi değişenler karşılaştırılmaz."""
+    dates = run_dates(con, since, until)
+    if len(dates) < 2:
+        return []
+    a, b = dates[0], dates[-1]
+    cond = "pct >= ?" if min_pct >= 0 else "pct <= ?"
+    rows = con.execute(f"""
+        SELECT * FROM (
+            SELECT o2.sku, p.title, o1.price, o2.price, o2.currency,
+                   (o2.price - o1.price) * 100.0 / o1.price AS pct
+            FROM price_observations o2
+            JOIN price_observations o1 ON o1.sku = o2.sku AND o1.observed_at = ?
+            LEFT JOIN products p ON p.sku = o2.sku
+            WHERE o2.observed_at = ? AND o1.price > 0 AND o1.currency = o2.currency
+        ) WHERE {cond} ORDER BY ABS(pct) DESC
+    """, (a, b, min_pct)).fetchall()
+    return [dict(zip(("sku", "title", "old_price", "new_price", "currency", "pct"), r), **{"from": a, "to": b})
+            for r in rows]
+
+def stock_flips(con, since, until=None):
+    """Aralıkta stok durumu önceki koşuya göre değişen SKU'lar (upsert_run'da kaydedilir)."""
+    rows = con.execute(
+        "SELECT sku, observed_at, stock, prev_stock FROM stock_changes"
+        " WHERE observed_at BETWEEN ? AND ? ORDER BY observed_at, sku",
+        (since, until or "9999-12-31")).fetchall()
+    return [dict(zip(("sku", "observed_at", "stock", "prev_stock"), r)) for r in rows]
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Gencer fiyat geçmişi (SQLite)")
+    p.add_argument("--db", type=Path, default=DB_PATH)
+    sub = p.add_subparsers(dest="cmd", required=True)
+    imp = sub.add_parser("import", help="products.json'u bir gözlem olarak ekle")
+    imp.add_argument("path", type=Path)
+    imp.add_argument("--at", help="gözlem tarihi YYYY-MM-DD (varsayılan bugün)")
+    pc = sub.add_parser("price-changes", help="fiyatı en az --min-pct % değişenler")
+    pc.add_argument("--since", required=True)
+    pc.add_argument("--until")
+    pc.add_argument("--min-pct", type=float, default=10.0)
+    sf = sub.add_parser("stock-flips", help="stok durumu değişenler")
+    sf.add_argument("--since", required=True)
+    sf.add_argument("--until")
+    a = p.parse_args(argv)
+
+    con = connect(a.db)
+    if a.cmd == "import":
+        n = upsert_run(con, json.loads(a.path.read_text(encoding="utf-8")), observed_at=a.at)
+        print(f"{n} kayıt eklendi")
+    elif a.cmd == "price-changes":
+        for r in price_changes(con, a.since, a.until, a.min_pct):
+            print(f"{r['sku']:<20} {r['old_price']:>12.3f} -> {r['new_price']:>12.3f} {r['currency']:<4}"
+                  f" {r['pct']:+7.1f}%  {r['title']}")
+    elif a.cmd == "stock-flips":
+        for r in stock_flips(con, a.since, a.until):
+            print(f"{r['observed_at']}  {r['sku']:<20} {r['prev_stock']} -> {r['stock']}")
+    con.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
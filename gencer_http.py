@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+Login sonrası Selenium'suz sayfa gezme
+- Tarayıcıdaki oturum çerezlerini havuzlu bir requests.Session'a aktarır
+- Fiyat listesinin sayfa parametresini sayfalama linklerinden bulur (?sayfa=2 vb.)
+- Sayfaları doğrudan GET ile çekip lxml ile ayrıştırır (gencer_parse.parse_table_html)
+- İstenirse sayfalar sınırlı bir iş parçacığı havuzuyla, host başına hız sınırıyla
+  paralel çekilir; sonuçlar sayfa sırasıyla birleştirilir
+- Herhangi bir sorun olursa HttpCrawlError atar; çağıran Selenium'a düşer
+"""
+
+import threading, time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from gencer_cache import content_hash
+from gencer_common import log
+from gencer_metrics import METRICS, http_retries
+from gencer_parse import parse_table_html
+
+class HttpCrawlError(Exception):
+    """HTTP modunda devam edilemiyor (oturum düştü, sayfalama çözülemedi...)."""
+
+LOGIN_MARKERS = ("login.asp", "/login")
+
+# Tablo ana sayfada değilse içinde tablo olan iframe'in adresini döndürür
+PRICE_LIST_URL_JS = r"""
+if (document.querySelector("table tr")) return location.href;
+var fs = document.querySelectorAll("iframe");
+for (var i = 0; i < fs.length; i++) {
+  try {
+    var d = fs[i].contentDocument;
+    if (d && d.querySelector("table tr")) return fs[i].contentWindow.location.href;
+  } catch (e) {}
+}
+return location.href;
+"""
+
+def make_session(pool_size=8, retries=3, user_agent=None):
+    s = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(["GET", "HEAD"]))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    s.headers["Accept-Language"] = "tr-TR,tr;q=0.9"
+    if user_agent:
+        s.headers["User-Agent"] = user_agent
+    return s
+
+def session_from_driver(driver, pool_size=8):
+    """Login olmuş tarayıcının çerezleri ve User-Agent'ı ile Session kurar."""
+    try: ua = driver.execute_script("return navigator.userAgent")
+    except Exception: ua = None
+    s = make_session(pool_size=pool_size, user_agent=ua)
+    for c in driver.get_cookies():
+        s.cookies.set(c["name"], c["value"], domain=c.get("domain"), path=c.get("path", "/"))
+    return s
+
+def price_list_url(driver):
+    try: return driver.execute_script(PRICE_LIST_URL_JS) or driver.current_url
+    except Exception: return driver.current_url
+
+def page_url(url, param, page_no):
+    """url içindeki param değerini page_no ile değiştirir (yoksa ekler)."""
+    parts = urlsplit(url)
+    q = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != param]
+    q.append((param, str(page_no)))
+    return urlunsplit(parts._replace(query=urlencode(q)))
+
+def discover_page_param(html, base_url):
+    """Sayfalama linklerinde metni '2' olup href'inde değeri 2 olan parametreyi bulur.
+       (param, link_url) döner; bulunamazsa (None, None)."""
+    from lxml import html as lxml_html
+
+    if not html:
+        return None, None
+    doc = lxml_html.fromstring(html)
+    for a in doc.xpath("//a[@href]"):
+        txt = a.text_content().strip()
+        href = a.get("href").strip()
+        if not txt.isdigit() or txt == "1" or href.lower().startswith(("javascript:", "#")):
+            continue
+        full = urljoin(base_url, href)
+        for k, v in parse_qsl(urlsplit(full).query, keep_blank_values=True):
+            if v == txt:
+                return k, full
+    return None, None
+
+def fetch_html(session, url, timeout=30):
+    r = session.get(url, timeout=timeout)
+    METRICS.count("http_requests")
+    METRICS.count("http_retries", http_retries(r))
+    METRICS.count("http_bytes", len(r.content))
+    r.raise_for_status()
+    if any(m in r.url.lower() for m in LOGIN_MARKERS):
+        raise HttpCrawlError(f"Oturum geçersiz, login sayfasına yönlendirildi: {r.url}")
+    return r.content
+
+class HostRateLimiter:
+    """Host başına saniyede en fazla `rate` istek (iş parçacıkları arası paylaşılır)."""
+    def __init__(self, rate=None):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        if not self.interval:
+            return
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._next.get(host, now))
+            self._next[host] = at + self.interval
+        if at > now:
+            time.sleep(at - now)
+
+def iter_ordered(fetch, pages, concurrency=1):
+    """fetch(page)'i en fazla `concurrency` iş parçacığıyla çalıştırır, (page, sonuç)'u sayfa
+       sırasıyla verir. Döngüden çıkılınca bekleyen istekler iptal edilir."""
+    if concurrency <= 1:
+        for p in pages:
+            yield p, fetch(p)
+        return
+    it = iter(pages)
+    ex = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        pending = deque((p, ex.submit(fetch, p)) for p in islice(it, concurrency * 2))
+        while pending:
+            p, fut = pending.popleft()
+            nxt = next(it, None)
+            if nxt is not None:
+                pending.append((nxt, ex.submit(fetch, nxt)))
+            yield p, fut.result()
+    finally:
+        ex.shutdown(wait=True, cancel_futures=True)
+
+def crawl_http(session, start_url, max_pages=149, timeout=30, concurrency=1, rate=None,
+               on_page=None, cache=None, start_page=1):
+    """Fiyat listesini sayfa sayfa GET ile çeker; parse_table ile aynı kayıt listesini döner.
+       concurrency>1 ise sayfalar paralel çekilir ama sonuç sırası sıralı gezmeyle aynıdır.
+       on_page(page, kayıtlar) True dönerse gezme orada biter.
+       cache (gencer_cache.PageCache) verilirse tablo hash'i aynı olan sayfa yeniden ayrıştırılmaz;
+       start_page>1 ise 1. sayfa sadece sayfalama için çekilir, dönüş start_page'den başlar."""
+    limiter = HostRateLimiter(rate)
+
+    def parse(page, html, base, t0):
+        h = content_hash(html) if cache else None
+        rows = cache.lookup(page, h) if cache else None
+        source = "cache" if rows is not None else "http"
+        if rows is None:
+            rows = parse_table_html(html, base_url=base)
+            if cache and rows: cache.put(page, h, rows)
+        METRICS.page(page, time.perf_counter() - t0, len(rows), source)
+        return rows
+
+    t0 = time.perf_counter()
+    limiter.wait(start_url)
+    html = fetch_html(session, start_url, timeout)
+    first = parse(1, html, start_url, t0)
+    if not first:
+        raise HttpCrawlError("İlk sayfada tablo bulunamadı (HTML, tarayıcı ile aynı değil).")
+
+    param, link = discover_page_param(html, start_url)
+    if not param and max_pages > 1:
+        raise HttpCrawlError("Sayfa parametresi bulunamadı (sayfalama JS ile olabilir).")
+
+    records = []
+    if start_page <= 1:
+        log(f"[http] Sayfa 1: {len(first)} kayıt")
+        records.extend(first)
+        if cache: cache.done(1)
+        stopped = bool(on_page and on_page(1, first))
+        if stopped or not param:
+            if cache: cache.finish(stopped_at=1 if stopped else None)
+            return records
+        start_page, prev_rows = 2, first
+    else:
+        log(f"[http] {start_page - 1}. sayfaya kadar önceki koşudan alındı, {start_page}. sayfadan devam")
+        prev_rows = (cache.get(start_page - 1) or {}).get("records", []) if cache else []
+
+    def fetch(page):
+        t0 = time.perf_counter()
+        url = page_url(link, param, page)
+        limiter.wait(url)
+        return parse(page, fetch_html(session, url, timeout), link, t0)
+
+    prev_skus, stopped = [r["sku"] for r in prev_rows], None
+    for page, rows in iter_ordered(fetch, range(start_page, max_pages + 1), concurrency):
+        skus = [r["sku"] for r in rows]
+        if not rows or skus == prev_skus:  # son sayfayı geçtik (site son sayfayı tekrar eder)
+            break
+        log(f"[http] Sayfa {page}: {len(rows)} kayıt")
+        records.extend(rows)
+        prev_skus = skus
+        if cache: cache.done(page)
+        if on_page and on_page(page, rows):
+            log(f"[http] Sayfa {page}: önceki koşuyla aynı, gezme erken bitirildi")
+            stopped = page
+            break
+    if cache: cache.finish(stopped_at=stopped)
+    return records
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Ürün görsellerini indirme (paralel, havuzlu, koşullu)
+- Tek requests.Session + bağlantı havuzu, en fazla `concurrency` eşzamanlı istek
+- Hata/429/5xx için artan beklemeli tekrar (urllib3 Retry)
+- Gövde .part dosyasına akıtılır, sha256 hesaplanır, os.replace ile atomik yerleştirilir
+- _downloads/manifest.json: url -> {etag, last_modified, sha256, size, files}
+  Tekrar koşularda If-None-Match / If-Modified-Since gönderilir; 304 ise aktarım yok
+- Aynı URL'yi kullanan SKU'lar için görsel bir kez indirilip diğer dosyalara kopyalanır
+- process_images: içerik hash'ine göre blobs/ altında tek kopya + SKU dosyaları link,
+  süreç havuzunda sabit boyutlu WebP küçük resimler (thumbs/), images.json eşlemesi
+"""
+
+import os, re, json, shutil, hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from gencer_cache import atomic_write_text
+from gencer_common import log
+from gencer_http import make_session
+from gencer_metrics import METRICS, http_retries
+
+IMG_EXTS = [".jpg",".jpeg",".png",".webp",".gif",".bmp"]
+MANIFEST_NAME = "manifest.json"
+
+def sanitize_name(s):
+    s = re.sub(r"[^\w\.-]+","_", s, flags=re.U)
+    return s.strip("_")[:80] or "IMG"
+
+def image_ext(url):
+    ext = os.path.splitext(url.split("?")[0])[1].lower()
+    return ext if ext in IMG_EXTS else ".jpg"
+
+def load_manifest(outdir):
+    try: return json.loads((outdir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError): return {}
+
+def save_manifest(outdir, manifest):
+    atomic_write_text(outdir / MANIFEST_NAME,
+                      json.dumps(manifest, ensure_ascii=False, separators=(",", ":")))
+
+def link_or_copy(src, dst):
+    """dst'yi src'ye hard link yapar (olmazsa sembolik link, o da olmazsa kopya).
+       Önce geçici ada yazılıp os.replace edilir; dst başka bir dosyaya link ise onu bozmaz."""
+    tmp = dst.with_name(dst.name + ".lnk")
+    tmp.unlink(missing_ok=True)
+    try: os.link(src, tmp)
+    except OSError:
+        try: os.symlink(os.path.relpath(src, dst.parent), tmp)
+        except OSError: shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+def plan_downloads(items, outdir):
+    """(sku, url) çiftlerinden {url: [hedef dosyalar]} üretir (sıra korunur)."""
+    plan = {}
+    for sku, url in items:
+        url, sku = (url or "").strip(), (sku or "").strip()
+        if not url or not sku:
+            continue
+        path = outdir / f"{sanitize_name(sku)}{image_ext(url)}"
+        files = plan.setdefault(url, [])
+        if path not in files:
+            files.append(path)
+    return plan
+
+def fetch_image(session, url, files, entry, timeout=20, chunk=64 * 1024):
+    """Tek URL'yi indirir. ('ok'|'not_modified'|'failed', yeni manifest kaydı, bayt, hata) döner."""
+    entry = entry or {}
+    have_all = all(f.exists() for f in files)
+    headers = {}
+    if have_all:
+        if entry.get("etag"): headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"): headers["If-Modified-Since"] = entry["last_modified"]
+    try:
+        with session.get(url, headers=headers, timeout=timeout, stream=True) as r:
+            METRICS.count("image_retries", http_retries(r))
+            if r.status_code == 304:
+                return "not_modified", entry, 0, None
+            r.raise_for_status()
+            dest = files[0]
+            tmp = dest.with_name(dest.name + ".part")
+            h, size = hashlib.sha256(), 0
+            with open(tmp, "wb") as fh:
+                for block in r.iter_content(chunk):
+                    fh.write(block); h.update(block); size += len(block)
+            if not size:
+                tmp.unlink(missing_ok=True)
+                return "failed", entry, 0, "boş yanıt"
+            os.replace(tmp, dest)
+            for other in files[1:]:
+                link_or_copy(dest, other)
+            return "ok", {"etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified"),
+                          "sha256": h.hexdigest(), "size": size,
+                          "files": [f.name for f in files]}, size, None
+    except Exception as e:
+        return "failed", entry, 0, str(e)
+
+def download_all(items, outdir, concurrency=8, retries=3, timeout=20):
+    """items: (sku, url) çiftleri. Özet istatistik dict'i döner."""
+    outdir.mkdir(parents=True, exist_ok=True)
+    plan = plan_downloads(items, outdir)
+    manifest = load_manifest(outdir)
+    session = make_session(pool_size=concurrency, retries=retries)
+    stats = {"urls": len(plan), "ok": 0, "not_modified": 0, "failed": 0, "bytes": 0}
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as ex:
+            futs = {ex.submit(fetch_image, session, url, files, manifest.get(url), timeout): url
+                    for url, files in plan.items()}
+            for fut in as_completed(futs):
+                url = futs[fut]
+                status, entry, size, err = fut.result()
+                stats[status] += 1
+                stats["bytes"] += size
+                if status == "failed":
+                    log(f"Görsel indirilemedi ({url}): {err}")
+                elif entry:
+                    manifest[url] = entry
+    finally:
+        save_manifest(outdir, manifest)
+    return stats
+
+# --- tekilleştirme + küçük resimler ---
+BLOBS_DIR = "blobs"
+THUMBS_DIR = "thumbs"
+INDEX_NAME = "images.json"
+
+def blob_path(outdir, sha, ext):
+    return outdir / BLOBS_DIR / sha[:2] / f"{sha}{ext}"
+
+def dedupe_images(outdir, manifest):
+    """Her benzersiz içeriği blobs/ altında bir kez tutar; SKU dosyaları ona link olur."""
+    st = {"blobs": 0, "linked": 0, "saved_bytes": 0}
+    sizes = {}
+    for url, e in manifest.items():
+        if not e.get("sha256") or not e.get("files"):
+            continue
+        files = [outdir / f for f in e["files"] if (outdir / f).exists()]
+        if not files:
+            continue
+        blob = blob_path(outdir, e["sha256"], image_ext(url))
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(files[0], blob)
+        for f in files:
+            if f.is_symlink() or not os.path.samefile(f, blob):
+                link_or_copy(blob, f)
+                st["linked"] += 1
+        size = e.get("size") or 0
+        st["saved_bytes"] += size * len(files)
+        sizes[e["sha256"]] = size
+    st["blobs"] = len(sizes)
+    st["saved_bytes"] -= sum(sizes.values())
+    return st
+
+def make_thumbnail(job):
+    """Süreç havuzunda çalışır: (kaynak, hedef, boyut) -> (hedef, hata)."""
+    src, dst, size = job
+    try:
+        from PIL import Image, ImageOps
+        with Image.open(src) as im:
+            im = ImageOps.exif_transpose(im).convert("RGB")
+            im = ImageOps.pad(im, (size, size), color=(255, 255, 255))
+            tmp = dst.with_name(dst.name + ".part")
+            im.save(tmp, "WEBP", quality=80, method=4)
+        os.replace(tmp, dst)
+        return dst, None
+    except Exception as e:
+        return dst, str(e)
+
+def build_thumbnails(outdir, manifest, size=256, workers=None):
+    """Her benzersiz görsel için thumbs/<sha>_<size>.webp üretir; var olanları atlar."""
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        log("Pillow kurulu değil, küçük resimler atlandı (pip install pillow)")
+        return {"made": 0, "skipped": 0, "failed": 0}
+    from concurrent.futures import ProcessPoolExecutor
+
+    tdir = outdir / THUMBS_DIR
+    tdir.mkdir(parents=True, exist_ok=True)
+    jobs, seen, skipped = [], set(), 0
+    for url, e in manifest.items():
+        sha = e.get("sha256")
+        if not sha or sha in seen:
+            continue
+        seen.add(sha)
+        dst = tdir / f"{sha}_{size}.webp"
+        src = blob_path(outdir, sha, image_ext(url))
+        if dst.exists():
+            skipped += 1
+        elif src.exists():
+            jobs.append((src, dst, size))
+    st = {"made": 0, "skipped": skipped, "failed": 0}
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for dst, err in ex.map(make_thumbnail, jobs, chunksize=16):
+                if err:
+                    st["failed"] += 1
+                    log(f"Küçük resim üretilemedi ({dst.name}): {err}")
+                else:
+                    st["made"] += 1
+    return st
+
+def process_images(outdir, size=256, workers=None):
+    """İndirme sonrası: tekilleştir, küçük resim üret, images.json (sku -> blob/thumb) yaz."""
+    manifest = load_manifest(outdir)
+    st = dedupe_images(outdir, manifest)
+    st.update(build_thumbnails(outdir, manifest, size=size, workers=workers))
+    index = {}
+    for url, e in manifest.items():
+        sha = e.get("sha256")
+        if not sha:
+            continue
+        rec = {"sha256": sha,
+               "blob": blob_path(outdir, sha, image_ext(url)).relative_to(outdir).as_posix()}
+        thumb = outdir / THUMBS_DIR / f"{sha}_{size}.webp"
+        if thumb.exists():
+            rec["thumb"] = thumb.relative_to(outdir).as_posix()
+        for f in e.get("files", []):
+            index[f] = rec
+    atomic_write_text(outdir / INDEX_NAME, json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+    return st
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Koşu metrikleri (aşama süreleri + sayaçlar)
+- Aşamalar: login, goto_price_list, page, parse_current_page, normalize_and_save, download_images...
+  her biri için çağrı sayısı, toplam / en uzun süre, hata sayısı
+- Sayaçlar: kayıt sayısı, WebDriver komutları, indirilen bayt, HTTP/login yeniden denemeleri...
+- Sayfa başına: süre, satır sayısı, kaynak (browser / http / cache)
+- Koşu sonunda logs/run_metrics.json; istenirse Prometheus metin biçimi (node_exporter textfile)
+Bağımlılıksız; tüm modüller METRICS tekilini kullanır.
+"""
+
+import json, time, datetime, threading, functools
+from contextlib import contextmanager
+
+from gencer_cache import atomic_write_text
+
+class RunMetrics:
+    def __init__(self):
+        self.started = time.time()
+        self.stages = {}
+        self.counters = {}
+        self.pages = []
+        self._lock = threading.Lock()
+
+    def _stage(self, name, seconds, ok):
+        with self._lock:
+            s = self.stages.setdefault(name, {"count": 0, "total_s": 0.0, "max_s": 0.0, "errors": 0})
+            s["count"] += 1
+            s["total_s"] += seconds
+            s["max_s"] = max(s["max_s"], seconds)
+            s["errors"] += 0 if ok else 1
+
+    @contextmanager
+    def stage(self, name):
+        """with METRICS.stage("login"): ...  (hata olursa errors artar, hata yine yükselir)"""
+        t0 = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self._stage(name, time.perf_counter() - t0, ok)
+
+    def timed(self, name=None):
+        """Fonksiyon dekoratörü: her çağrı `name` aşaması olarak ölçülür."""
+        def deco(fn):
+            @functools.wraps(fn)
+            def wrapper(*a, **kw):
+                with self.stage(name or fn.__name__):
+                    return fn(*a, **kw)
+            return wrapper
+        return deco
+
+    def count(self, name, n=1):
+        if not n:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def page(self, page, seconds, rows, source):
+        """collect_all_pages / crawl_http sayfa başına."""
+        self._stage("page", seconds, True)
+        with self._lock:
+            self.pages.append({"page": page, "seconds": round(seconds, 3), "rows": rows, "source": source})
+
+    def snapshot(self):
+        with self._lock:
+            stages = {k: {"count": v["count"], "total_s": round(v["total_s"], 3),
+                          "avg_s": round(v["total_s"] / v["count"], 3) if v["count"] else 0.0,
+                          "max_s": round(v["max_s"], 3), "errors": v["errors"]}
+                      for k, v in self.stages.items()}
+            return {"started_at": datetime.datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+                    "duration_s": round(time.time() - self.started, 3),
+                    "stages": stages, "counters": dict(self.counters),
+                    "pages": sorted(self.pages, key=lambda p: p["page"])}
+
+    def save(self, path):
+        atomic_write_text(path, json.dumps(self.snapshot(), ensure_ascii=False, indent=2))
+
+    def prometheus(self, prefix="gencer"):
+        snap = self.snapshot()
+        out = []
+        def metric(name, kind, help_, samples):
+            out.append(f"# HELP {prefix}_{name} {help_}")
+            out.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, v in samples:
+                lab = "{" + ",".join(f'{k}="{v_}"' for k, v_ in labels.items()) + "}" if labels else ""
+                out.append(f"{prefix}_{name}{lab} {v}")
+        st = snap["stages"].items()
+        metric("stage_seconds_total", "gauge", "Aşamada geçen toplam süre (koşu başına)",
+               [({"stage": k}, v["total_s"]) for k, v in st])
+        metric("stage_seconds_max", "gauge", "Aşamanın en uzun tek çağrısı",
+               [({"stage": k}, v["max_s"]) for k, v in st])
+        metric("stage_calls", "gauge", "Aşama çağrı sayısı", [({"stage": k}, v["count"]) for k, v in st])
+        metric("stage_errors", "gauge", "Hata ile biten aşama çağrıları",
+               [({"stage": k}, v["errors"]) for k, v in st])
+        metric("count", "gauge", "Koşu sayaçları (satır, WebDriver komutu, bayt, yeniden deneme...)",
+               [({"name": k}, v) for k, v in sorted(snap["counters"].items())])
+        metric("run_duration_seconds", "gauge", "Koşunun toplam süresi", [({}, snap["duration_s"])])
+        metric("run_timestamp_seconds", "gauge", "Koşunun başlama zamanı", [({}, round(self.started))])
+        return "\n".join(out) + "\n"
+
+    def save_prometheus(self, path, prefix="gencer"):
+        atomic_write_text(path, self.prometheus(prefix))
+
+METRICS = RunMetrics()
+
+def count_driver_calls(driver, metrics=METRICS):
+    """Sürücünün her WebDriver komutunu (find_element, execute_script, click...) sayar."""
+    orig = driver.execute
+    def execute(command, params=None):
+        metrics.count("webdriver_calls")
+        return orig(command, params)
+    driver.execute = execute
+    return driver
+
+def http_retries(response):
+    """urllib3 Retry'ın bu yanıt için yaptığı yeniden deneme sayısı."""
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    return len(getattr(retries, "history", None) or ())
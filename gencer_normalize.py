@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Ham kayıt tablosunu çıktı şemasına getirir (vektörel, satır başına Python fonksiyonu yok)
+- Metin kolonları: NaN -> "", str
+- price: float64; kdv: metin aynen kalır + tipli kdv_pct ("%20" -> 20.0, yoksa NaN;
+  products.json'a yazılmaz, fiyat geçmişi veritabanına gider)
+- SKU boşsa başlıktan slug; slug da boşsa başlığın sha1 özeti (PYTHONHASHSEED'den bağımsız)
+- SKU tekil, ilk gelen kalır
+"""
+
+import pandas as pd
+
+from gencer_parse import sku_digest
+
+TEXT_FIELDS = ["image_url", "sku", "title", "stock", "kdv", "birim", "currency"]
+KDV_RE = r"(\d+(?:[.,]\d+)?)"
+
+def _text(df, col):
+    s = df[col] if col in df else pd.Series("", index=df.index)
+    return s.fillna("").astype(str)
+
+def derive_skus(sku, title):
+    """Boş SKU'ları başlıktan doldurur (gencer_parse.make_sku'nun vektörel karşılığı)."""
+    empty = sku == ""
+    if not empty.any():
+        return sku
+    t = title[empty]
+    slug = t.str.replace(r"[^\w\.-]+", "_", regex=True).str.strip("_").str[:90]
+    no_slug = slug == ""
+    if no_slug.any():
+        slug[no_slug] = t[no_slug].map(sku_digest)
+    sku = sku.copy()
+    sku[empty] = slug
+    return sku
+
+def normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    out = pd.DataFrame(index=df.index)
+    for col in TEXT_FIELDS:
+        out[col] = _text(df, col)
+    price = df["price"] if "price" in df else pd.Series(0.0, index=df.index)
+    out["price"] = pd.to_numeric(price, errors="coerce").fillna(0.0).astype(float)
+    # kdv az sayıda farklı değer alır ("%20", "%10"): sadece tekil değerler ayrıştırılır
+    codes, uniques = pd.factorize(out["kdv"])
+    pct = pd.to_numeric(pd.Series(uniques).str.extract(KDV_RE, expand=False)
+                        .str.replace(",", ".", regex=False), errors="coerce").astype(float)
+    out["kdv_pct"] = pct.to_numpy()[codes] if len(uniques) else pd.Series(dtype=float)
+    out["sku"] = derive_skus(out["sku"], out["title"])
+    return out.drop_duplicates(subset=["sku"], keep="first").reset_index(drop=True)
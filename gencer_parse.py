@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Fiyat listesi ayrıştırma yardımcıları (Selenium'suz)
+- Fiyat/döviz metni çözümleme (gencer_price)
+- Tablo satırı -> kayıt (parse_table ile aynı kolon düzeni)
+- Kaydedilmiş / requests ile çekilmiş HTML'den lxml ile tablo okuma
+"""
+
+import re, hashlib, importlib.util
+from urllib.parse import urljoin
+
+from gencer_price import parse_price_currency, detect_currency
+
+IMG_ATTRS = ["src","data-src","data-original","data-lazy","data-echo","data-image"]
+BG_URL_RE = re.compile(r'url\([\'"]?([^\'")]+)[\'"]?\)')
+
+def currency_from_header(txt):
+    return detect_currency(txt, default="TRY")
+
+def row_record(cells, img, has_img, default_cur):
+    """Bir tablo satırının hücre metinlerinden kayıt üretir (0. kolon resimse kaydırır)."""
+    base = 1 if has_img else 0
+    def td(i): return cells[i] if 0 <= i < len(cells) else ""
+    price, currency = parse_price_currency(cells[-1] if cells else "")
+    return {
+        "image_url": img,
+        "sku": td(base+0),
+        "title": td(base+1),
+        "stock": td(base+2),
+        "kdv": td(base+3),
+        "birim": td(base+4),
+        "price": price,
+        "currency": currency or default_cur
+    }
+
+
+def sku_digest(title):
+    """Koşudan koşuya aynı kalan yedek SKU (hash() PYTHONHASHSEED ile değişir)."""
+    return "SKU_" + hashlib.sha1(title.encode("utf-8")).hexdigest()[:12]
+
+def make_sku(sku, title):
+    """SKU boşsa başlıktan türet."""
+    if sku: return sku
+    base = re.sub(r"[^\w\.-]+","_", title, flags=re.U).strip("_")
+    return base[:90] or sku_digest(title)
+
+def lxml_available():
+    """parse_table_html / discover_page_param için lxml kurulu mu (yüklemeden bakar)."""
+    return importlib.util.find_spec("lxml") is not None
+
+def _cell_text(el):
+    # innerText'e yakın: boşlukları tek boşluğa indir
+    return " ".join(el.text_content().split())
+
+def parse_table_html(html, base_url=None):
+    """HTML içindeki fiyat tablosunu kayıt listesine çevirir.
+       parse_table ile aynı kurallar: başlık satırı atlanır, <4 hücreli satırlar atlanır,
+       0. kolonda img varsa image_url oradan (src/data-*/background url) alınır."""
+    from lxml import html as lxml_html
+
+    if not html:
+        return []
+    doc = lxml_html.fromstring(html)
+    rows = doc.xpath("//table//tr")
+    if not rows:
+        return []
+
+    head = " ".join(_cell_text(th) for th in doc.xpath("//table//thead//th"))
+    default_cur = currency_from_header(head) if head else "TRY"
+
+    data = []
+    for r in rows[1:]:  # başlığı atla
+        tds = r.xpath(".//td")
+        if len(tds) < 4: continue
+        img = ""
+        ims = tds[0].xpath(".//img")
+        if ims:
+            for attr in IMG_ATTRS:
+                val = (ims[0].get(attr) or "").strip()
+                if val and not val.startswith("data:image"): img = val; break
+            if not img:
+                m = BG_URL_RE.search(tds[0].get("style") or "")
+                if m: img = m.group(1)
+            if img and base_url:
+                img = urljoin(base_url, img)
+        data.append(row_record([_cell_text(t) for t in tds], img, bool(ims), default_cur))
+    return data
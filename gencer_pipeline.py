@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Gezme sonrası işlem hattı (Selenium'suz): normalize + kaydet, akışlı çıktılar, görsel indirme
+- scrape_gencer bu fonksiyonları kullanır; tarayıcı/driver yüklemeden de çağrılabilir
+- Kaydedilmiş bir gezmeyi (sayfa önbelleği, jsonl/json/csv) yeniden normalize edip yazmak için:
+    python gencer_pipeline.py normalize                 # son tamamlanan koşunun _cache/pages/*.json
+    python gencer_pipeline.py normalize products.jsonl  # ya da .json / .csv
+    python gencer_pipeline.py normalize --alerts file,email --alert-pct 3
+- Fiyat / stok değişim uyarıları: bkz. gencer_alerts.py
+"""
+
+import sys, json, argparse
+from pathlib import Path
+
+import pandas as pd
+
+from gencer_common import CSV_PATH, JSON_PATH, CHANGES_PATH, CACHE_DIR, DOWNLOADS, log
+from gencer_diff import load_snapshot, DiffBuilder, write_changes
+from gencer_writers import FIELDS, StreamingSink, CsvWriter, JsonWriter, make_writer, output_path
+from gencer_normalize import normalize_frame
+from gencer_history import connect as history_connect, upsert_run, DB_PATH as HISTORY_DB
+from gencer_metrics import METRICS
+from gencer_alerts import (ChangeWatch, FINGERPRINTS_PATH, SINKS, DEFAULT_SINKS, DEFAULT_PRICE_PCT,
+                           make_sinks, notify)
+
+# --- normalize & kaydet ---
+@METRICS.timed()
+def normalize_and_save(df: pd.DataFrame, sinks=(), price_pct=DEFAULT_PRICE_PCT):
+    """sinks: gencer_alerts hedefleri; fiyatı price_pct %'den fazla oynayan / stoğu değişen
+       ürünler için uyarı gönderilir (parmak izi indeksi her koşuda güncellenir)."""
+    out = normalize_frame(df)
+
+    # satır satır yaz: products.csv + products.json, aynı geçişte önceki snapshot ile fark
+    prev = load_snapshot(JSON_PATH)
+    diff = DiffBuilder(prev)
+    watch = ChangeWatch(FINGERPRINTS_PATH, price_pct=price_pct)
+    with CsvWriter(CSV_PATH) as cw, JsonWriter(JSON_PATH, indent=2) as jw:
+        for row in out[FIELDS].itertuples(index=False, name=None):
+            r = dict(zip(FIELDS, row))
+            cw.write(r); jw.write(r); diff.add(r); watch.add(r)
+    watch.save()
+    METRICS.count("alerts", len(watch.alerts))
+    log(f"Parmak izi: {watch.changed} ürün değişmiş, {len(watch.alerts)} uyarı")
+    if watch.alerts and sinks:
+        notify(watch.alerts, sinks)
+    delta = diff.result()
+    write_changes(CHANGES_PATH, delta, base_count=len(prev), count=len(out))
+    log(f"Değişiklik: +{len(delta['added'])} / -{len(delta['removed'])} / ~{len(delta['changed'])} "
+        f"-> changes.json")
+    METRICS.count("products", len(out))
+    log(f"Yazıldı: {len(out)} ürün -> products.csv + products.json")
+
+    try:
+        con = history_connect()
+        try:
+            cols = FIELDS + ["kdv_pct"]
+            n = upsert_run(con, (dict(zip(cols, row))
+                                 for row in out[cols].itertuples(index=False, name=None)))
+        finally:
+            con.close()
+        log(f"Fiyat geçmişi: {n} gözlem -> {HISTORY_DB.name}")
+    except Exception as e:
+        log(f"Fiyat geçmişi yazılamadı: {e}")
+
+def open_stream_sink(formats):
+    """--formats için: products.jsonl / .min.json / .parquet'i gezme sırasında yazan sink."""
+    writers = []
+    for fmt in formats:
+        try: writers.append(make_writer(fmt, output_path(JSON_PATH, fmt)))
+        except ImportError as e: log(f"{fmt} çıktısı atlandı: {e}")
+    return StreamingSink(writers) if writers else None
+
+def chain_pages(*hooks):
+    """Birden çok on_page kancasını tek kancada birleştirir (hepsi çağrılır)."""
+    hooks = [h for h in hooks if h]
+    return lambda page, records: any([h(page, records) for h in hooks])
+
+@METRICS.timed()
+def download_images(df: pd.DataFrame, outdir: Path = DOWNLOADS, concurrency=8):
+    from gencer_images import download_all  # requests yalnız indirme yolunda
+    items = zip(df.get("sku", pd.Series(dtype=str)).fillna("").astype(str),
+                df.get("image_url", pd.Series(dtype=str)).fillna("").astype(str))
+    st = download_all(items, outdir, concurrency=concurrency)
+    METRICS.count("image_bytes", st["bytes"])
+    METRICS.count("images_ok", st["ok"])
+    METRICS.count("images_not_modified", st["not_modified"])
+    METRICS.count("images_failed", st["failed"])
+    log(f"Görsel indirme tamam: {st['ok']} indirildi, {st['not_modified']} değişmemiş, "
+        f"{st['failed']} hata, {st['bytes'] / 1e6:.1f} MB ({st['urls']} URL)")
+    return st
+
+# --- akış ---
+def fill_unvisited_pages(df, pages, sink=None):
+    """Erken bitişte gezilmeyen sayfaların kayıtlarını önceki products.json'dan ekler."""
+    tail = pages.tail_skus()
+    if not tail:
+        return df
+    prev = load_snapshot(JSON_PATH)
+    rest = [prev[s] for s in tail if s in prev]
+    log(f"Gezilmeyen {len(tail)} SKU önceki snapshot'tan alındı ({len(rest)} bulundu)")
+    if sink: sink.write_page(rest)
+    return pd.concat([df, pd.DataFrame(rest)], ignore_index=True)
+
+def resume_point(cache, resume, hashes=None):
+    """hashes (gencer_diff.PageHashes): önbellekten gelen 1..son sayfalar da bu koşununmuş gibi
+       kaydedilir (page_hashes.json yalnız yeniden gezilen sayfalardan oluşmasın)."""
+    last, cached = cache.start(resume=resume)
+    if last:
+        log(f"Devam: {last}. sayfaya kadar {len(cached)} kayıt önbellekten alındı")
+        if hashes is not None:
+            for p in range(1, last + 1):
+                hashes.record(p, (cache.get(p) or {}).get("records", []))
+    return last + 1, pd.DataFrame(cached)
+
+# --- kaydedilmiş gezmeden ---
+def load_crawl(path=None):
+    """Ham kayıtlar: path yoksa sayfa önbelleği (_cache/pages/NNNN.json, sayfa sırasıyla),
+       varsa .jsonl / .json / .csv dosyası. Önbellekten yalnız run.json'a göre tamamlanmış son
+       koşunun 1..last_page sayfaları okunur (daha uzun eski koşulardan kalan sayfalar değil);
+       koşu yarım kaldıysa, erken bittiyse (--stop-unchanged), parçalı gezildiyse (sayfalar
+       önbelleğe yazılmaz) ya da sayfa eksikse boş döner."""
+    if path is None:
+        root = CACHE_DIR / "pages"
+        try: state = json.loads((root / "run.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError): state = {}
+        if state.get("sharded") or state.get("stopped_at"):
+            log("Son koşu " + ("parçalı gezildi (sayfa önbelleği o koşuya ait değil)" if state.get("sharded") else
+                               f"{state['stopped_at']}. sayfada erken bitti (sonraki sayfalar önbellekte yok)")
+                + "; normalize edilmedi")
+            return pd.DataFrame()
+        if not state.get("complete") or not state.get("last_page"):
+            log("Sayfa önbelleğinde tamamlanmış bir koşu yok (yarım koşu için --resume ile gezin)")
+            return pd.DataFrame()
+        records = []
+        for page in range(1, state["last_page"] + 1):
+            try: records.extend(json.loads((root / f"{page:04d}.json").read_text(encoding="utf-8"))["records"])
+            except (OSError, ValueError, KeyError):
+                log(f"Sayfa önbelleğinde {page}. sayfa eksik/bozuk, normalize edilmedi")
+                return pd.DataFrame()
+        return pd.DataFrame(records)
+    if path.suffix == ".jsonl":
+        return pd.read_json(path, lines=True, dtype=False)
+    if path.suffix == ".csv":
+        return pd.read_csv(path, dtype=str, keep_default_na=False)
+    return pd.DataFrame(json.loads(path.read_text(encoding="utf-8")))
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Gencer gezme sonrası işlemler (tarayıcısız)")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    n = sub.add_parser("normalize", help="kaydedilmiş gezmeyi normalize edip products.* yaz")
+    n.add_argument("path", type=Path, nargs="?", help="jsonl/json/csv (varsayılan: sayfa önbelleği)")
+    n.add_argument("--alerts", default=DEFAULT_SINKS,
+                   help=f"uyarı hedefleri, virgülle: {','.join(SINKS)} (boş: kapalı)")
+    n.add_argument("--alert-pct", type=float, default=DEFAULT_PRICE_PCT, help="fiyat uyarısı eşiği (%%)")
+    a = p.parse_args(argv)
+
+    if a.cmd == "normalize":
+        df = load_crawl(a.path)
+        if df.empty:
+            log("Kayıt bulunamadı."); return 1
+        log(f"{len(df)} ham kayıt okundu")
+        normalize_and_save(df, sinks=make_sinks([s for s in a.alerts.split(",") if s]),
+                           price_pct=a.alert_pct)
+
+if __name__ == "__main__":
+    sys.exit(main())
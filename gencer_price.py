@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Fiyat / döviz metni ayrıştırma
+- Derlenmiş tek düzenli ifade: ilk sayı ve yanındaki para birimi tek search() ile bulunur;
+  yanında para birimi yoksa metnin geri kalanında aranır
+- Para birimi kodları kelimenin tamamıyla eşleşir ("TL" başka bir kelimenin içinde eşleşmez),
+  semboller (₺ $ €) ayrı parça olarak bulunur
+- Sayı biçimleri: "1.234,56" / "1,234.56" / "1 234,56" / "12,5" / "12.50" / "1.234"
+  (hem . hem , varsa sondaki ondalık; yalnız , ondalık; tek . ve ardından tam 3 hane binlik)
+- Aynı metinler tekrar tekrar geldiği için sonuçlar LRU önbellekte tutulur
+"""
+
+import re
+from functools import lru_cache
+
+CURRENCY_MAP = {"₺":"TRY","TL":"TRY","YTL":"TRY","TRY":"TRY","$":"USD","USD":"USD","€":"EUR","EUR":"EUR"}
+
+_CODE = r"(?<![^\W\d_])(?:YTL|TL|TRY|USD|EUR)(?![^\W\d_])"   # kelimenin tamamı: "TL" evet, "ATLAS" hayır
+CUR_RE = re.compile(rf"[₺$€]|{_CODE}", re.I | re.U)
+# ilk sayı ve hemen önündeki / ardındaki para birimi tek eşleşmede
+PRICE_RE = re.compile(
+    rf"(?:(?P<pre>[₺$€]|{_CODE})\s*)?"
+    r"(?P<num>[-+]?\d+(?:[.,]\d+|[ \u00a0\u202f]\d{3}(?!\d))*)"
+    rf"(?:\s*(?P<post>[₺$€]|{_CODE}))?",
+    re.I | re.U)
+
+def to_float(num):
+    """'1.234,56' -> 1234.56 (bkz. modül açıklaması)."""
+    n = num.replace(" ", "").replace("\u00a0", "").replace("\u202f", "")
+    dot, comma = n.rfind("."), n.rfind(",")
+    if dot >= 0 and comma >= 0:
+        dec = "," if comma > dot else "."
+        n = n.replace("." if dec == "," else ",", "").replace(dec, ".")
+    elif comma >= 0:
+        n = n.replace(",", ".") if n.count(",") == 1 else n.replace(",", "")
+    elif dot >= 0:
+        if n.count(".") > 1 or len(n) - dot - 1 == 3:
+            n = n.replace(".", "")
+    try: return float(n)
+    except ValueError: return 0.0
+
+@lru_cache(maxsize=8192)
+def parse_price_currency(s):
+    """'1.234,56 TL' -> (1234.56, 'TRY'). Sayı yoksa 0.0, para birimi yoksa ''."""
+    s = (s or "").strip()
+    if not s: return 0.0, ""
+    m = PRICE_RE.search(s)
+    if m is None:
+        return 0.0, detect_currency(s)
+    cur = m.group("pre") or m.group("post")
+    if cur is None:
+        return to_float(m.group("num")), detect_currency(s)
+    return to_float(m.group("num")), CURRENCY_MAP[cur.upper()]
+
+def detect_currency(text, default=""):
+    """Metinde geçen ilk para birimi (tablo başlığı vb. için)."""
+    m = CUR_RE.search(text or "")
+    return CURRENCY_MAP[m.group().upper()] if m else default
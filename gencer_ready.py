@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Sabit sleep'ler yerine olay bazlı sayfa hazır olma kontrolleri
+- Tablo değişti mi: satır sayısı + ilk/son satır metninden imza (tıklama sonrası)
+- Lazy görseller indi mi: tablodaki tüm lazy img'lerin src'si data: değil ve yüklenmiş
+- Ağ sakin mi: Resource Timing kayıt sayısı `idle` süresince artmadı
+  (Selenium execute_cdp_cmd CDP olaylarına abone olamadığı için Network.* yerine bu kullanılır)
+Her bekleme bir üst süre ile sınırlı; süreler WaitMetrics'e yazılır.
+"""
+
+import json, time
+
+TABLE_SIGNATURE_JS = r"""
+var trs = document.querySelectorAll("table tr");
+if (!trs.length) trs = document.querySelectorAll(".product,.urun,.card,.product-card");
+if (!trs.length) return "";
+var f = trs.length > 1 ? trs[1] : trs[0], l = trs[trs.length - 1];
+return trs.length + "|" + (f.innerText || "") + "|" + (l.innerText || "");
+"""
+
+PENDING_IMAGES_JS = r"""
+var lazy = ["data-src","data-original","data-lazy","data-echo","data-image"];
+var ims = document.querySelectorAll("table img,.product img,.urun img,.card img,.product-card img"), n = 0;
+for (var i = 0; i < ims.length; i++) {
+  var im = ims[i], s = im.getAttribute("src") || "";
+  var isLazy = lazy.some(function(a){ return im.hasAttribute(a); });
+  if ((isLazy && (!s || s.indexOf("data:") === 0)) || (s && !im.complete)) n++;
+}
+return n;
+"""
+
+RESOURCE_COUNT_JS = "return performance.getEntriesByType('resource').length;"
+
+class WaitMetrics:
+    """Sayfa başına bekleme süreleri; `budget` eski sabit sleep karşılığıdır."""
+    def __init__(self):
+        self.records = []
+
+    def record(self, page, cond, waited, ok, budget=0.0):
+        self.records.append({"page": page, "cond": cond, "waited_s": round(waited, 3),
+                             "ok": ok, "budget_s": budget})
+
+    def summary(self):
+        by = {}
+        for r in self.records:
+            s = by.setdefault(r["cond"], {"n": 0, "waited_s": 0.0, "max_s": 0.0,
+                                         "budget_s": 0.0, "timeouts": 0})
+            s["n"] += 1
+            s["waited_s"] += r["waited_s"]
+            s["max_s"] = max(s["max_s"], r["waited_s"])
+            s["budget_s"] += r["budget_s"]
+            s["timeouts"] += 0 if r["ok"] else 1
+        for s in by.values():
+            s["avg_s"] = round(s["waited_s"] / s["n"], 3)
+            s["saved_s"] = round(s["budget_s"] - s["waited_s"], 1)
+            s["waited_s"] = round(s["waited_s"], 1)
+        return by
+
+    def save(self, path):
+        path.write_text(json.dumps({"summary": self.summary(), "waits": self.records},
+                                   ensure_ascii=False, indent=2), encoding="utf-8")
+
+def wait_for(predicate, timeout, poll=0.1):
+    """predicate() True olana kadar (en fazla timeout sn) bekler. (ok, geçen_sn) döner."""
+    t0 = time.monotonic()
+    while True:
+        try:
+            if predicate(): return True, time.monotonic() - t0
+        except Exception:
+            pass
+        if time.monotonic() - t0 >= timeout:
+            return False, time.monotonic() - t0
+        time.sleep(poll)
+
+def table_signature(driver):
+    try: return driver.execute_script(TABLE_SIGNATURE_JS) or ""
+    except Exception: return ""
+
+def wait_table_changed(driver, before, timeout=10, metrics=None, page=None, budget=0.0):
+    """Tıklama sonrası tablo imzası `before`dan farklı ve boş değil olana kadar bekler."""
+    ok, waited = wait_for(lambda: table_signature(driver) not in ("", before), timeout)
+    if metrics is not None: metrics.record(page, "table_changed", waited, ok, budget)
+    return ok
+
+def wait_images_loaded(driver, timeout=7, metrics=None, page=None, budget=0.0):
+    ok, waited = wait_for(lambda: driver.execute_script(PENDING_IMAGES_JS) == 0, timeout)
+    if metrics is not None: metrics.record(page, "images_loaded", waited, ok, budget)
+    return ok
+
+def wait_network_idle(driver, idle=0.5, timeout=7, metrics=None, page=None, budget=0.0):
+    """Yeni kaynak isteği `idle` sn boyunca gelmediyse ağ sakin kabul edilir."""
+    state = {"n": -1, "since": time.monotonic()}
+    def quiet():
+        n = driver.execute_script(RESOURCE_COUNT_JS)
+        now = time.monotonic()
+        if n != state["n"]:
+            state["n"], state["since"] = n, now
+        return now - state["since"] >= idle
+    ok, waited = wait_for(quiet, timeout)
+    if metrics is not None: metrics.record(page, "network_idle", waited, ok, budget)
+    return ok
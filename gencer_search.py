@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Katalog arama (products.json üzerinden, pandas'sız)
+- SKU öneki: sıralı SKU listesi + bisect ("100.01." -> o gruptaki tüm ürünler)
+- Başlık kelimeleri: ters indeks (kelime -> ürün no dizisi), Türkçe harf katlama
+  (İ/I/ı, Ş, Ğ, Ü, Ö, Ç -> i, s, g, u, o, c; "VİDASI" = "vidasi")
+- Ölçü kelimeleri: "3.5X16", "3,5 x 16" -> "3.5x16" (parçaları da ayrıca indekslenir)
+- Sorgudaki tüm kelimeler aranır (VE); son kelime önek olarak eşleşir
+- İndeks pickle snapshot olarak saklanır; products.json değişmedikçe yeniden kurulmaz
+
+Kullanım:
+  python gencer_search.py query "meridyen sunta 3.5x16"
+  python gencer_search.py sku 100.01.
+  python gencer_search.py serve --port 8766     # GET /search?q=...  GET /sku?prefix=...  (&limit=, en çok 500)
+"""
+
+import re, sys, json, time, pickle, bisect, argparse
+from array import array
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+from gencer_common import JSON_PATH, CACHE_DIR
+
+INDEX_PATH = CACHE_DIR / "search_index.pkl"
+INDEX_VERSION = 1
+MAX_LIMIT = 500  # HTTP'de tek yanıtta en fazla sonuç
+
+_FOLD = str.maketrans({"İ": "i", "I": "ı", "ı": "i", "ş": "s", "Ş": "s", "ğ": "g", "Ğ": "g",
+                       "ü": "u", "Ü": "u", "ö": "o", "Ö": "o", "ç": "c", "Ç": "c"})
+SIZE = r"\d+(?:[.,]\d+)?(?:\s*[x×*]\s*\d+(?:[.,]\d+)?)+"
+TOKEN_RE = re.compile(rf"(?P<size>{SIZE})|\d+(?:[.,]\d+)?|[^\W\d_]+", re.U)
+
+def tr_fold(s):
+    """Türkçe küçük harf + ASCII katlama: 'MERİDYEN VİDASI' -> 'meridyen vidasi'."""
+    # önce I->ı / İ->i (Türkçe kuralı), sonra ı->i ile katla; str.lower() 'İ'yi 'i̇' yapar
+    return s.translate(_FOLD).lower().translate(_FOLD)
+
+def size_token(s):
+    return re.sub(r"\s*[x×*]\s*", "x", s.replace(",", "."))
+
+def tokenize(text):
+    """Metindeki sırayla kelimeler; ölçü kelimesinin ardından parçaları da gelir."""
+    toks = []
+    for m in TOKEN_RE.finditer(tr_fold(text or "")):
+        if m.group("size"):
+            size = size_token(m.group())
+            toks.append(size)
+            toks.extend(size.split("x"))
+        else:
+            toks.append(m.group().replace(",", "."))
+    return list(dict.fromkeys(toks))
+
+class SearchIndex:
+    def __init__(self, records):
+        self.records = [{k: r.get(k) for k in ("sku", "title", "price", "currency", "stock",
+                                                 "birim", "image_url")} for r in records]
+        self.skus = sorted((r["sku"], i) for i, r in enumerate(self.records))
+        self._sku_keys = [s for s, _ in self.skus]
+        post = {}
+        for i, r in enumerate(self.records):
+            for tok in set(tokenize(r["title"]) + tokenize(r["sku"])):
+                post.setdefault(tok, []).append(i)
+        self.postings = {t: array("I", ids) for t, ids in post.items()}
+        self.tokens = sorted(self.postings)
+
+    # --- kalıcılık ---
+    @classmethod
+    def build(cls, json_path=JSON_PATH):
+        return cls(json.loads(json_path.read_text(encoding="utf-8")))
+
+    def save(self, path=INDEX_PATH, source_mtime=None):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as fh:
+            pickle.dump((INDEX_VERSION, source_mtime, self.__dict__), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path=INDEX_PATH, json_path=JSON_PATH):
+        """Snapshot güncelse onu yükler, değilse products.json'dan kurup kaydeder."""
+        mtime = json_path.stat().st_mtime if json_path.exists() else None
+        try:
+            with open(path, "rb") as fh:
+                version, src_mtime, state = pickle.load(fh)
+            if version == INDEX_VERSION and src_mtime == mtime:
+                idx = cls.__new__(cls)
+                idx.__dict__.update(state)
+                return idx
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            pass
+        idx = cls.build(json_path)
+        idx.save(path, source_mtime=mtime)
+        return idx
+
+    # --- sorgular ---
+    def sku_prefix(self, prefix, limit=50):
+        lo = bisect.bisect_left(self._sku_keys, prefix)
+        out = []
+        for s, i in self.skus[lo:]:
+            if not s.startswith(prefix) or len(out) >= limit:
+                break
+            out.append(self.records[i])
+        return out
+
+    def _ids_for_prefix(self, tok, within=None):
+        """tok ile başlayan kelimelerin ürünleri (within verilirse onunla kesişimi)."""
+        lo = bisect.bisect_left(self.tokens, tok)
+        ids = set()
+        for t in self.tokens[lo:]:
+            if not t.startswith(tok):
+                break
+            p = self.postings[t]
+            ids.update(p if within is None else within.intersection(p))
+        return ids
+
+    def search(self, q, limit=50):
+        """Tüm kelimeler (VE); son kelime önek olarak da eşleşir ("vid" -> "vidasi")."""
+        toks = tokenize(q)
+        if not toks:
+            return []
+        *exact, last = toks
+        lists = []
+        for t in exact:
+            p = self.postings.get(t)
+            if p is None:
+                return []
+            lists.append(p)
+        lists.sort(key=len)
+        ids = None
+        for p in lists:
+            ids = set(p) if ids is None else ids.intersection(p)
+            if not ids:
+                return []
+        pref = self._ids_for_prefix(last, within=ids)
+        return [self.records[i] for i in sorted(pref)[:limit]]
+
+# --- HTTP ---
+def make_server(index, host="127.0.0.1", port=8766):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *a): pass
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            qs = {k: v[0] for k, v in parse_qs(parts.query).items()}
+            try: limit = int(qs.get("limit", 50))
+            except ValueError: limit = 0
+            if limit < 1:
+                self.send_error(400, explain="limit pozitif bir tamsayı olmalı"); return
+            limit = min(limit, MAX_LIMIT)
+            t0 = time.perf_counter()
+            if parts.path == "/search":
+                res = index.search(qs.get("q", ""), limit)
+            elif parts.path == "/sku":
+                res = index.sku_prefix(qs.get("prefix", ""), limit)
+            else:
+                self.send_error(404); return
+            body = json.dumps({"took_ms": round((time.perf_counter() - t0) * 1000, 3),
+                               "count": len(res), "results": res}, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Gencer katalog arama")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    q = sub.add_parser("query"); q.add_argument("text"); q.add_argument("--limit", type=int, default=20)
+    s = sub.add_parser("sku"); s.add_argument("prefix"); s.add_argument("--limit", type=int, default=20)
+    sv = sub.add_parser("serve"); sv.add_argument("--port", type=int, default=8766)
+    sub.add_parser("build")
+    a = p.parse_args(argv)
+
+    t0 = time.perf_counter()
+    if a.cmd == "build":
+        idx = SearchIndex.build()
+        idx.save(source_mtime=JSON_PATH.stat().st_mtime)
+        print(f"{len(idx.records)} ürün, {len(idx.tokens)} kelime -> {INDEX_PATH}")
+        return
+    idx = SearchIndex.load()
+    print(f"(indeks {(time.perf_counter() - t0) * 1000:.0f} ms'de yüklendi)", file=sys.stderr)
+    if a.cmd == "serve":
+        srv = make_server(idx, port=a.port)
+        print(f"http://127.0.0.1:{a.port}/search?q=...", file=sys.stderr)
+        try: srv.serve_forever()
+        except KeyboardInterrupt: pass
+        return
+    t0 = time.perf_counter()
+    res = idx.search(a.text, a.limit) if a.cmd == "query" else idx.sku_prefix(a.prefix, a.limit)
+    dt = (time.perf_counter() - t0) * 1000
+    for r in res:
+        print(f"{r['sku']:<20} {r['price']:>12} {r['currency']:<4} {r['title']}")
+    print(f"{len(res)} sonuç, {dt:.3f} ms", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Login hızlandırma (Selenium'suz yardımcılar; sürücü komutlarını scrape_gencer.login çağırır)
+- Oturum çerezleri şifreli olarak _cache/session.bin'e yazılır, sonraki koşuda geçerliyse
+  login formu hiç açılmaz (anahtar: GENCER_COOKIE_KEY ya da .env giriş bilgilerinden PBKDF2;
+  `cryptography` yoksa çerezler saklanmaz)
+- Son başarılı girişteki (frame, xpath) yerleri _cache/login_locators.json'da tutulur ve önce denenir
+- Üç giriş alanı tek execute_script ile, ana belge + erişilebilen tüm iframe'lerde birlikte aranır
+"""
+
+import os, json, time, base64, hashlib
+
+from gencer_cache import atomic_write_text, atomic_write_bytes
+from gencer_common import CACHE_DIR, log
+
+SESSION_PATH = CACHE_DIR / "session.bin"
+LOCATORS_PATH = CACHE_DIR / "login_locators.json"
+SESSION_MAX_AGE = 6 * 3600  # sona erme tarihi olmayan (ASP oturum) çerezleri için üst sınır
+
+# arguments[0]: {alan: [xpath, ...]}, arguments[1]: önce denenecek frame (ya da null).
+# Tüm alanları aynı belgede bulursa {frame: i|null, alan: xpath, ...} döner, yoksa null.
+FIND_FIELDS_JS = r"""
+var fields = arguments[0], prefer = arguments[1];
+var docs = [[null, document]];
+var fs = document.querySelectorAll("iframe");
+for (var i = 0; i < fs.length; i++) {
+  try { if (fs[i].contentDocument) docs.push([i, fs[i].contentDocument]); } catch (e) {}
+}
+if (prefer !== null) docs.sort(function(a, b){ return (b[0] === prefer) - (a[0] === prefer); });
+for (var d = 0; d < docs.length; d++) {
+  var doc = docs[d][1], out = {frame: docs[d][0]}, ok = true;
+  for (var name in fields) {
+    var hit = null;
+    for (var j = 0; j < fields[name].length && hit === null; j++) {
+      try {
+        var n = doc.evaluate(fields[name][j], doc, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (n) hit = fields[name][j];
+      } catch (e) {}
+    }
+    if (hit === null) { ok = false; break; }
+    out[name] = hit;
+  }
+  if (ok) return out;
+}
+return null;
+"""
+
+# --- bulunan yerler ---
+def load_locators(path=None):
+    path = path or LOCATORS_PATH
+    try: return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError): return {}
+
+def save_locators(locators, path=None):
+    path = path or LOCATORS_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(path, json.dumps(locators, ensure_ascii=False, indent=2))
+
+def prefer_first(xpaths, winner):
+    """Önceki koşuda kazanan xpath listenin başına."""
+    return [winner] + [x for x in xpaths if x != winner] if winner in xpaths else list(xpaths)
+
+def find_fields(driver, fields, remembered=None, timeout=12, poll=0.2):
+    """fields: {ad: [xpath, ...]}. Hepsini aynı belgede bulana kadar tek JS sorgusuyla yoklar.
+       {frame, ad: xpath, ...} ya da None döner."""
+    remembered = remembered or {}
+    ordered = {k: prefer_first(v, remembered.get(k)) for k, v in fields.items()}
+    deadline = time.monotonic() + timeout
+    while True:
+        try: found = driver.execute_script(FIND_FIELDS_JS, ordered, remembered.get("frame"))
+        except Exception: found = None
+        if found or time.monotonic() >= deadline:
+            return found
+        time.sleep(poll)
+
+# --- şifreli çerez kutusu ---
+def _fernet(secret):
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError:
+        return None
+    key = os.getenv("GENCER_COOKIE_KEY")
+    if not key:
+        raw = hashlib.pbkdf2_hmac("sha256", secret.encode("utf-8"), b"gencer-cookie-jar", 200_000)
+        key = base64.urlsafe_b64encode(raw)
+    return Fernet(key)
+
+class CookieJar:
+    """secret: anahtar türetmek için giriş bilgileri (GENCER_COOKIE_KEY yoksa)."""
+    def __init__(self, secret, path=None, max_age=SESSION_MAX_AGE):
+        self.path = path or SESSION_PATH
+        self.max_age = max_age
+        self.fernet = _fernet(secret)
+
+    @property
+    def enabled(self):
+        return self.fernet is not None
+
+    def save(self, cookies, url):
+        if not self.enabled:
+            return False
+        blob = json.dumps({"saved_at": time.time(), "url": url, "cookies": cookies}).encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(self.path, self.fernet.encrypt(blob))
+        return True
+
+    def load(self):
+        """Süresi geçmemiş {url, cookies} ya da None (dosya yok, anahtar değişmiş, süre dolmuş)."""
+        if not self.enabled or not self.path.exists():
+            return None
+        try:
+            data = json.loads(self.fernet.decrypt(self.path.read_bytes()))
+        except Exception:
+            log("Kayıtlı oturum okunamadı (anahtar değişmiş olabilir), yeniden login olunacak")
+            return None
+        now = time.time()
+        if now - data.get("saved_at", 0) > self.max_age:
+            return None
+        if any(c.get("expiry") and c["expiry"] <= now for c in data.get("cookies", [])):
+            return None
+        return data
+
+    def clear(self):
+        self.path.unlink(missing_ok=True)
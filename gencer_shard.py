@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Parçalı (shard) gezme: sayfa aralığı N ayrı işçi sürece bölünür
+- http: ebeveyn bir kez login olur; çerezler ve sayfa linki işçilere verilir, her işçi kendi
+  requests.Session'ı ile kendi aralığını çeker (host hız sınırı işçilere bölünür)
+- browser: her işçi kendi Chrome'unu açar, bir kez login olur, aralığının başına atlar
+- Her parça ayrı süreçte çalışır: biri çökse (Chrome, bellek, segfault) diğerleri etkilenmez;
+  yalnızca hata veren parçalar yeniden denenir; yine alınamayan parça varsa hata (eksik katalog yazılmaz)
+- Tarayıcı parçaları ayrıca boşluksuz olmalı: kısa biten (liste sonu) parçadan sonra gelen parçalar
+  boş dönmeli; arada eksik sayfa varsa hata
+- Sonuçlar ebeveynde sayfa sırasıyla birleştirilir
+"""
+
+import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from gencer_common import log
+from gencer_parse import parse_table_html
+from gencer_http import (HttpCrawlError, make_session, fetch_html, discover_page_param, page_url,
+                         iter_ordered, HostRateLimiter)
+
+class ShardError(Exception):
+    """Tarayıcı parçalarından biri tüm denemelere rağmen alınamadı."""
+
+def split_pages(first, last, shards):
+    """[first, last] aralığını en fazla `shards` ardışık, dengeli parçaya böler: [(lo, hi), ...]"""
+    n = last - first + 1
+    if n <= 0:
+        return []
+    shards = max(1, min(shards, n))
+    size, extra = divmod(n, shards)
+    out, lo = [], first
+    for i in range(shards):
+        hi = lo + size - 1 + (1 if i < extra else 0)
+        out.append((lo, hi))
+        lo = hi + 1
+    return out
+
+# --- işçiler (spawn ile başlatılır; modül düzeyinde olmalı) ---
+def http_shard(spec):
+    """spec: shard, lo, hi, link, param, cookies, user_agent, concurrency, rate, timeout.
+       [(sayfa, kayıtlar), ...] döner. Site son sayfadan sonrasını son sayfa olarak tekrar ettiği
+       için parçanın başındaki sayfa bir öncekiyle karşılaştırılır (aynıysa liste bitmiştir)."""
+    session = make_session(pool_size=max(1, spec.get("concurrency", 1)), user_agent=spec.get("user_agent"))
+    for c in spec.get("cookies", []):
+        session.cookies.set(c["name"], c["value"], domain=c.get("domain"), path=c.get("path", "/"))
+    limiter = HostRateLimiter(spec.get("rate"))
+    link, param, timeout = spec["link"], spec["param"], spec.get("timeout", 30)
+
+    def fetch(page):
+        url = page_url(link, param, page)
+        limiter.wait(url)
+        return parse_table_html(fetch_html(session, url, timeout), base_url=link)
+
+    lo, hi = spec["lo"], spec["hi"]
+    prev_skus = [r["sku"] for r in fetch(lo - 1)] if lo > 1 else []
+    pages = []
+    for page, rows in iter_ordered(fetch, range(lo, hi + 1), spec.get("concurrency", 1)):
+        skus = [r["sku"] for r in rows]
+        if not rows or skus == prev_skus:
+            break
+        pages.append((page, rows))
+        prev_skus = skus
+    return pages
+
+def browser_shard(spec):
+    """spec: shard, lo, hi, headless. İşçi kendi tarayıcısını açıp login olur. lo sayfasına
+       atlanamazsa boş döner (liste daha kısa olabilir; boşluk kontrolü ebeveynde, bkz.
+       check_coverage); sayfa içeriği gelmezse IncompleteCrawl ile parça başarısız olur."""
+    import scrape_gencer as sg  # selenium yalnız tarayıcı işçisinde yüklenir
+
+    pages = []
+    def keep(page, rows):
+        pages.append((page, rows))
+        return False
+
+    drv = sg.init_driver(headless=spec.get("headless", True))
+    try:
+        if not sg.login_and_open_price_list(drv):
+            raise RuntimeError("Fiyat listesi sayfası bulunamadı")
+        try:
+            sg.collect_all_pages(drv, max_pages=spec["hi"], start_page=spec["lo"], on_page=keep,
+                                 save_metrics=False)
+        except sg.PageUnreachable as e:
+            log(f"[shard] {spec['shard']}: {e} (liste bu parçadan önce bitmiş olabilir)")
+    finally:
+        try: drv.quit()
+        except Exception: pass
+    return pages
+
+# --- ebeveyn ---
+def _run_isolated(worker, spec, timeout):
+    """Parçayı kendine ait tek süreçlik havuzda çalıştırır (çökmesi diğer parçaları bozmaz)."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn")) as ex:
+        return ex.submit(worker, spec).result(timeout=timeout)
+
+def run_shards(worker, specs, workers=4, retries=1, timeout=None):
+    """Parçaları en fazla `workers` süreçte çalıştırır; hata veren parçalar `retries` kez yeniden
+       denenir. {shard: [(sayfa, kayıtlar), ...]} ve {shard: son hata} döner."""
+    results, errors = {}, {}
+    todo = list(specs)
+    for attempt in range(retries + 1):
+        if not todo:
+            break
+        if attempt:
+            log(f"[shard] {len(todo)} parça yeniden deneniyor ({attempt}/{retries}): "
+                f"{', '.join(str(s['shard']) for s in todo)}")
+        failed = []
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as tp:
+            futs = [(s, tp.submit(_run_isolated, worker, s, timeout)) for s in todo]
+            for spec, fut in futs:
+                try:
+                    results[spec["shard"]] = fut.result()
+                    errors.pop(spec["shard"], None)
+                    log(f"[shard] {spec['shard']} ({spec['lo']}-{spec['hi']}): "
+                        f"{len(results[spec['shard']])} sayfa")
+                except Exception as e:
+                    errors[spec["shard"]] = repr(e)
+                    failed.append(spec)
+                    log(f"[shard] {spec['shard']} ({spec['lo']}-{spec['hi']}) başarısız: {e!r}")
+        todo = failed
+    return results, errors
+
+def check_coverage(specs, results):
+    """Tarayıcı parçaları 1. sayfadan itibaren boşluksuz olmalı: her parça kendi lo'sundan ardışık
+       sayfalar döner; aralığını doldurmayan parça listenin sonudur, sonrakiler boş olmalı.
+       Aksi halde ShardError (eksik sayfa aralığı yayımlanmasın)."""
+    ended = None
+    for spec in sorted(specs, key=lambda s: s["lo"]):
+        got = [p for p, _ in results.get(spec["shard"], [])]
+        if ended is not None:
+            if got:
+                raise ShardError(f"Parça {spec['shard']}: liste {ended}. sayfada bitmiş görünürken "
+                                 f"{got[0]}. sayfa geldi (arada eksik sayfa)")
+            continue
+        if got != list(range(spec["lo"], spec["lo"] + len(got))):
+            raise ShardError(f"Parça {spec['shard']}: sayfalar ardışık değil: {got[:3]}...")
+        if not got and spec["lo"] == 1:
+            raise ShardError("1. sayfa alınamadı")
+        if len(got) < spec["hi"] - spec["lo"] + 1:
+            ended = got[-1] if got else spec["lo"] - 1
+
+def merge_shards(results):
+    """Parça sonuçlarını sayfa sırasıyla [(sayfa, kayıtlar), ...] olarak birleştirir."""
+    return sorted((p for pages in results.values() for p in pages), key=lambda p: p[0])
+
+def crawl_http_sharded(session, start_url, max_pages=149, shards=4, concurrency=1, rate=None,
+                       retries=1, timeout=30):
+    """crawl_http'nin çok süreçli hali: 1. sayfa ebeveynde çekilip sayfalama parametresi bulunur,
+       2..max_pages parçalara bölünür. [(sayfa, kayıtlar), ...] döner; bir parça tüm denemelerden
+       sonra da başarısızsa HttpCrawlError."""
+    html = fetch_html(session, start_url, timeout)
+    first = parse_table_html(html, base_url=start_url)
+    if not first:
+        raise HttpCrawlError("İlk sayfada tablo bulunamadı (HTML, tarayıcı ile aynı değil).")
+    param, link = discover_page_param(html, start_url)
+    if not param:
+        return [(1, first)]
+
+    cookies = [{"name": c.name, "value": c.value, "domain": c.domain, "path": c.path}
+               for c in session.cookies]
+    specs = [{"shard": i, "lo": lo, "hi": hi, "link": link, "param": param, "cookies": cookies,
+              "user_agent": session.headers.get("User-Agent"), "concurrency": concurrency,
+              "rate": rate / shards if rate else None, "timeout": timeout}
+             for i, (lo, hi) in enumerate(split_pages(2, max_pages, shards))]
+    ranges = ", ".join(f"{s['lo']}-{s['hi']}" for s in specs)
+    log(f"[shard] {max_pages - 1} sayfa {len(specs)} işçiye bölündü: {ranges}")
+    results, errors = run_shards(http_shard, specs, workers=len(specs), retries=retries)
+    if errors:
+        raise HttpCrawlError(f"Parçalar başarısız: {errors}")
+    return [(1, first)] + merge_shards(results)
+
+def crawl_browser_sharded(max_pages=149, shards=2, headless=True, retries=1):
+    """Her parça kendi tarayıcısıyla; [(sayfa, kayıtlar), ...] döner. Bir parça tüm denemelerden
+       sonra da başarısızsa ShardError (eksik sayfa aralığıyla katalog yazılmasın)."""
+    specs = [{"shard": i, "lo": lo, "hi": hi, "headless": headless}
+             for i, (lo, hi) in enumerate(split_pages(1, max_pages, shards))]
+    results, errors = run_shards(browser_shard, specs, workers=len(specs), retries=retries)
+    if errors:
+        raise ShardError(f"Parçalar başarısız: {errors}")
+    check_coverage(specs, results)
+    return merge_shards(results)
+
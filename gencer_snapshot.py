@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Tarayıcıyı bekletmeden sayfa ayrıştırma (Selenium'suz; collect_all_pages parse_workers>0 ile kullanır)
+- Toplayıcı her sayfada tablonun outerHTML'ini tek execute_script ile alır ve hemen sonraki
+  sayfaya geçer; HTML anlık görüntüsü işçi havuzunda lxml ile (parse_table_html) kayda çevrilir
+- Sonuçlar sayfa sırasıyla döner (on_page kancaları / erken bitiş sıralı çalışmaya devam eder)
+- Sınırlı kuyruk: en fazla max_pending sayfa bekler; dolduğunda toplayıcı en eski sayfanın
+  bitmesini bekler (geri basınç, bellek sayfa sayısından bağımsız)
+- lxml ayrıştırırken GIL'i bırakır, toplayıcı da çoğunlukla WebDriver cevabı beklediğinden
+  iş parçacıkları yeterli (süreç/pickle maliyeti yok)
+- İşçide ayrıştırma hata verirse sayfa sırası gelince bir kez eşzamanlı yeniden denenir; yine
+  olmazsa PageParseError (sayfa atlanıp eksik katalog yayımlanmasın; --resume o sayfadan sürer)
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from gencer_common import log
+from gencer_parse import parse_table_html
+
+class PageParseError(Exception):
+    """Sayfanın HTML anlık görüntüsü yeniden denemeye rağmen ayrıştırılamadı."""
+
+class PagePipeline:
+    """submit(sayfa, html) -> sırası gelmiş [(sayfa, kayıtlar, meta), ...]; sonda drain()."""
+    def __init__(self, workers=2, max_pending=4, parse=parse_table_html):
+        self.pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="parse")
+        self.max_pending = max(1, max_pending)
+        self.parse = parse
+        self.pending = deque()  # (sayfa, future, meta, (html, base_url) | None), sayfa sırasıyla
+        self.peak = 0
+
+    def _push(self, page, fut, meta, src=None):
+        out = []
+        while len(self.pending) >= self.max_pending:  # geri basınç
+            out.append(self._pop())
+        self.pending.append((page, fut, meta, src))
+        self.peak = max(self.peak, len(self.pending))
+        return out + self.ready()
+
+    def _pop(self):
+        """İşçide ayrıştırma hata verdiyse aynı HTML bir kez burada yeniden ayrıştırılır;
+           yine olmazsa PageParseError."""
+        page, fut, meta, src = self.pending.popleft()
+        try: return page, fut.result(), meta
+        except Exception as e:
+            if src is None: raise
+            log(f"Sayfa {page}: anlık görüntü ayrıştırılamadı ({e}), yeniden deneniyor")
+        try: return page, self.parse(*src), meta
+        except Exception as e:
+            raise PageParseError(f"Sayfa {page}: anlık görüntü ayrıştırılamadı: {e}") from e
+
+    def submit(self, page, html, base_url=None, meta=None):
+        return self._push(page, self.pool.submit(self.parse, html, base_url), meta, (html, base_url))
+
+    def done(self, page, records, meta=None):
+        """Ayrıştırması gerekmeyen sayfa (önbellek, kart görünümü) sıradaki yerini alır."""
+        fut = Future()
+        fut.set_result(records)
+        return self._push(page, fut, meta)
+
+    def ready(self):
+        out = []
+        while self.pending and self.pending[0][1].done():
+            out.append(self._pop())
+        return out
+
+    def drain(self):
+        return [self._pop() for _ in range(len(self.pending))]
+
+    def close(self):
+        for _, fut, _, _ in self.pending:
+            fut.cancel()
+        self.pending.clear()
+        self.pool.shutdown(wait=True)
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Akışlı çıktı yazıcıları (tüm katalog bellekte tek obje/tek string olarak tutulmaz)
+- json (indent=2, products.json ile bayt bayt aynı), json-compact, jsonl, csv, parquet (pyarrow varsa)
+- Her yazıcı geçici dosyaya yazar; close() ile os.replace (atomik), abort() ile siler
+- StreamingSink: collect_all_pages/crawl_http on_page kancası; her sayfa ayrıştırılır
+  ayrıştırılmaz normalize edip (SKU tekil, ilk gelen kalır) yazıcılara aktarır
+"""
+
+import os, csv, json
+
+from gencer_parse import make_sku
+
+FIELDS = ["image_url", "sku", "title", "stock", "kdv", "birim", "price", "currency"]
+FORMATS = {"json": ".json", "json-compact": ".min.json", "jsonl": ".jsonl", "csv": ".csv",
+           "parquet": ".parquet"}
+# products.json / products.csv'yi normalize_and_save yazar; gezme sırasında bunlar ek olarak yazılır
+STREAM_FORMATS = ("jsonl", "json-compact", "parquet")
+
+def _text(v):
+    if v is None or v != v:  # None / NaN
+        return ""
+    return str(v)
+
+def normalize_record(r):
+    """normalize_and_save ile aynı kurallar, tek kayıt için."""
+    out = {f: _text(r.get(f)) for f in FIELDS if f != "price"}
+    try: price = float(r.get("price") or 0.0)
+    except (TypeError, ValueError): price = 0.0
+    out["price"] = 0.0 if price != price else price
+    out["sku"] = make_sku(out["sku"], out["title"])
+    return {f: out[f] for f in FIELDS}
+
+class _AtomicWriter:
+    def __init__(self, path):
+        self.path = path
+        self.tmp = path.with_name(path.name + ".tmp")
+        self.count = 0
+
+    def _open(self, **kw):
+        return open(self.tmp, "w", encoding="utf-8", newline="", **kw)
+
+    def write(self, r):
+        raise NotImplementedError
+
+    def write_many(self, records):
+        for r in records:
+            self.write(r)
+
+    def _finish(self):
+        self.fh.close()
+
+    def close(self):
+        self._finish()
+        os.replace(self.tmp, self.path)
+
+    def abort(self):
+        try: self._finish()
+        except Exception: pass
+        self.tmp.unlink(missing_ok=True)
+
+    def __enter__(self): return self
+    def __exit__(self, exc_type, *exc):
+        self.abort() if exc_type else self.close()
+
+class JsonWriter(_AtomicWriter):
+    """JSON dizi; indent=2 çıktısı json.dumps(liste, indent=2) ile aynıdır."""
+    def __init__(self, path, indent=2):
+        super().__init__(path)
+        self.indent = indent
+        self.fh = self._open(buffering=1 << 20)
+        self.fh.write("[")
+
+    def write(self, r):
+        if self.indent:
+            body = json.dumps(r, ensure_ascii=False, indent=self.indent)
+            pad = " " * self.indent
+            self.fh.write(("," if self.count else "") + "\n" + pad + body.replace("\n", "\n" + pad))
+        else:
+            self.fh.write(("," if self.count else "") +
+                          json.dumps(r, ensure_ascii=False, separators=(",", ":")))
+        self.count += 1
+
+    def _finish(self):
+        if not self.fh.closed:
+            self.fh.write("\n]" if self.indent and self.count else "]")
+        self.fh.close()
+
+class JsonlWriter(_AtomicWriter):
+    def __init__(self, path):
+        super().__init__(path)
+        self.fh = self._open(buffering=1 << 20)
+
+    def write(self, r):
+        self.fh.write(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self.count += 1
+
+class CsvWriter(_AtomicWriter):
+    def __init__(self, path, fields=FIELDS):
+        super().__init__(path)
+        self.fh = self._open(buffering=1 << 20)
+        self.w = csv.DictWriter(self.fh, fieldnames=fields, lineterminator="\n")
+        self.w.writeheader()
+
+    def write(self, r):
+        self.w.writerow(r)
+        self.count += 1
+
+class ParquetWriter(_AtomicWriter):
+    """pyarrow ile row group'lar halinde yazar (batch_size kayıt bellekte)."""
+    def __init__(self, path, batch_size=5000):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        super().__init__(path)
+        self.pa = pa
+        self.schema = pa.schema([(f, pa.float64() if f == "price" else pa.string()) for f in FIELDS])
+        self.pw = pq.ParquetWriter(str(self.tmp), self.schema, compression="zstd")
+        self.batch_size = batch_size
+        self.buf = {f: [] for f in FIELDS}
+
+    def _flush(self):
+        if self.buf["sku"]:
+            self.pw.write_table(self.pa.table(self.buf, schema=self.schema))
+            self.buf = {f: [] for f in FIELDS}
+
+    def write(self, r):
+        for f in FIELDS:
+            self.buf[f].append(r[f])
+        self.count += 1
+        if len(self.buf["sku"]) >= self.batch_size:
+            self._flush()
+
+    def _finish(self):
+        if self.pw is not None:
+            self._flush()
+            self.pw.close()
+            self.pw = None
+
+def make_writer(fmt, path):
+    if fmt == "json": return JsonWriter(path, indent=2)
+    if fmt == "json-compact": return JsonWriter(path, indent=None)
+    if fmt == "jsonl": return JsonlWriter(path)
+    if fmt == "csv": return CsvWriter(path)
+    if fmt == "parquet": return ParquetWriter(path)
+    raise ValueError(f"Bilinmeyen çıktı biçimi: {fmt}")
+
+def output_path(base, fmt):
+    """products.json gibi bir taban yoldan biçime göre yol: products.jsonl, products.min.json..."""
+    return base.with_name(base.stem + FORMATS[fmt])
+
+class StreamingSink:
+    """Sayfa sayfa gelen ham kayıtları normalize edip yazıcılara akıtır. on_page olarak kullanılabilir
+       (her zaman False döner, gezmeyi durdurmaz)."""
+    def __init__(self, writers):
+        self.writers = list(writers)
+        self.seen = set()
+
+    def write_page(self, records):
+        for r in records:
+            r = normalize_record(r)
+            if r["sku"] in self.seen:
+                continue
+            self.seen.add(r["sku"])
+            for w in self.writers:
+                w.write(r)
+
+    def __call__(self, page, records):
+        self.write_page(records)
+        return False
+
+    def close(self):
+        for w in self.writers:
+            w.close()
+
+    def abort(self):
+        for w in self.writers:
+            w.abort()
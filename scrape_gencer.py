@@ -1,18 +1,32 @@
 # -*- coding: utf-8 -*-
 """
 Gencer bayi scraper (final, sağlam)
-- Login (name/id/placeholder/label + tüm iframeler; çerez banner kapatma)
+- Login (name/id/placeholder/label + tüm iframeler; çerez banner kapatma); oturum çerezleri
+  şifreli saklanır, geçerliyse sonraki koşuda login atlanır (bkz. gencer_session.py)
 - Fiyat listesine gider
-- Her sayfada scroll + 7sn bekler (lazy-load img)
-- Tablodan: image_url, sku, title, stock, kdv, birim, price, currency
+- Her sayfada scroll + lazy-load img'ler inene kadar bekler (en fazla 7sn)
+- Tablodan: image_url, sku, title, stock, kdv, birim, price, currency (sayfalar kolon bazlı
+  gencer_catalog.Catalog'da birikir; sayfa başına DataFrame + concat yok)
 - Döviz satırda yoksa tablo başlığından (TL/USD/EUR) düşer
 - 149 sayfa gezer (sağdan sola numaralandırma da destekli)
-- Çıktı: products.csv, products.json
-- Görselleri SKU.ext olarak _downloads/ klasörüne indirir
+- Varsayılan: login sonrası sayfalar requests+lxml ile çekilir; olmazsa Selenium
+- --shards N: sayfa aralığı N ayrı sürece bölünür (bkz. gencer_shard.py)
+- --parse-workers N: Selenium modunda tablo HTML'i alınıp sonraki sayfaya geçilir, ayrıştırma
+  arka planda (bkz. gencer_snapshot.py)
+- Çıktı: products.csv, products.json + önceki koşuya göre fark: changes.json
+- Her koşu price_history.sqlite'a gözlem olarak eklenir (bkz. gencer_history.py)
+- Fiyatı --alert-pct %'den fazla oynayan / stoğu değişen ürünler için uyarı (--alerts file,webhook,email;
+  SKU parmak izleri _cache/fingerprints.tsv'de, bkz. gencer_alerts.py)
+- Aşama süreleri ve sayaçlar logs/run_metrics.json'a yazılır (--prometheus ile ayrıca metin biçiminde)
+- Görselleri SKU.ext olarak _downloads/ klasörüne indirir (aynı içerik blobs/ altında tek kopya,
+  thumbs/ altında WebP küçük resimler)
 - Login hatasında _downloads/login_fail*.png, .html dump bırakır
+- Tarayıcı gerektirmeyen son işlemler gencer_pipeline.py'de (selenium yüklemeden import edilir);
+  chromedriver yolu _cache/chromedriver.json'da saklanır (bkz. gencer_driver.py,
+  GENCER_CHROMEDRIVER / GENCER_CHROMEDRIVER_VERSION)
 """
 
-import os, re, time, json, sys, datetime
+import os, time, sys, argparse
 from pathlib import Path
 import pandas as pd
 import requests
@@ -24,19 +38,28 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-
-# --- yollar ---
-ROOT = Path(__file__).resolve().parent
-CSV_PATH = ROOT / "products.csv"
-JSON_PATH = ROOT / "products.json"
-DOWNLOADS = ROOT / "_downloads"
-LOGS = ROOT / "logs"
-for d in (DOWNLOADS, LOGS):
-    d.mkdir(parents=True, exist_ok=True)
-
-def log(msg): print(f"[{datetime.datetime.now():%Y-%m-%d %H:%M:%S}] {msg}")
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, SessionNotCreatedException
+
+from gencer_common import BASE_URL, PAGE_HASHES_PATH, CACHE_DIR, DOWNLOADS, LOGS, log
+from gencer_cache import PageCache, content_hash
+from gencer_catalog import Catalog
+from gencer_snapshot import PagePipeline, PageParseError
+from gencer_diff import PageHashes
+from gencer_writers import STREAM_FORMATS
+from gencer_images import process_images
+from gencer_http import HttpCrawlError, LOGIN_MARKERS, session_from_driver, price_list_url, crawl_http
+from gencer_session import CookieJar, find_fields, load_locators, save_locators, prefer_first
+from gencer_shard import ShardError, crawl_http_sharded, crawl_browser_sharded
+from gencer_metrics import METRICS, count_driver_calls
+from gencer_alerts import SINKS, DEFAULT_SINKS, DEFAULT_PRICE_PCT, make_sinks
+from gencer_driver import resolve_chromedriver, invalidate as invalidate_chromedriver
+from gencer_ready import (WaitMetrics, table_signature, wait_table_changed,
+                          wait_images_loaded, wait_network_idle)
+from gencer_parse import (IMG_ATTRS, parse_price_currency, currency_from_header, row_record, BG_URL_RE,
+                          lxml_available)
+# normalize / çıktı / indirme adımları Selenium'suz modülde (eski içe aktarmalar için burada da)
+from gencer_pipeline import (normalize_and_save, open_stream_sink, chain_pages, download_images,
+                             fill_unvisited_pages, resume_point)
 
 def screenshot_dump(driver, tag=""):
     try:
@@ -48,9 +71,10 @@ def screenshot_dump(driver, tag=""):
         pass
 
 # --- Chrome driver ---
-def init_driver():
+def init_driver(headless=False):
     opts = Options()
-    # opts.add_argument("--headless=new")  # görünmez çalıştırmak istersen aç
+    if headless:
+        opts.add_argument("--headless=new")  # görünmez çalıştır
     opts.add_argument("--window-size=1366,900")
     opts.add_experimental_option("excludeSwitches", ["enable-automation","enable-logging"])
     opts.add_experimental_option("useAutomationExtension", False)
@@ -58,8 +82,13 @@ def init_driver():
     opts.add_argument("--lang=tr-TR,tr")
     opts.add_argument("--log-level=3")
     opts.set_capability("pageLoadStrategy", "eager")
-    service = Service(ChromeDriverManager().install())
-    drv = webdriver.Chrome(service=service, options=opts)
+    try:
+        drv = webdriver.Chrome(service=Service(resolve_chromedriver()), options=opts)
+    except SessionNotCreatedException as e:
+        # Chrome güncellenmiş, önbellekteki chromedriver eski kalmış olabilir
+        log(f"Tarayıcı oturumu açılamadı, chromedriver yeniden çözümleniyor: {e.msg}")
+        invalidate_chromedriver()
+        drv = webdriver.Chrome(service=Service(resolve_chromedriver()), options=opts)
     drv.set_page_load_timeout(40)
     try:
         # webdriver izini gizle
@@ -70,8 +99,8 @@ def init_driver():
     return drv
 
 # --- yardımcılar ---
-def scroll_whole_page(driver, step=700, pause=0.25):
-    """Lazy-load görseller açılsın diye tüm sayfayı gez."""
+def scroll_whole_page(driver, step=700, pause=0.05):
+    """Lazy-load görseller açılsın diye tüm sayfayı gez (inişi wait_images_loaded bekler)."""
     try:
         last = driver.execute_script("return document.body.scrollHeight") or 3000
         y = 0
@@ -79,9 +108,7 @@ def scroll_whole_page(driver, step=700, pause=0.25):
             driver.execute_script(f"window.scrollTo(0,{y});")
             time.sleep(pause)
             y += step
-        time.sleep(1.0)
         driver.execute_script("window.scrollTo(0,0);")
-        time.sleep(0.5)
     except Exception:
         pass
 
@@ -116,7 +143,40 @@ def find_in_any_frame(driver, xpaths, timeout=12):
     return None, None
 
 # --- LOGIN ---
-def login(driver):
+# login sonrası sayfada görünen kelimeler (login formu / hata sayfasında yok)
+POST_LOGIN_WORDS = ["fiyat", "liste", "ürün", "urun", "stok", "sepet", "çıkış", "cikis", "katalog"]
+
+def logged_in_page(driver):
+    return any(w in driver.page_source.lower() for w in POST_LOGIN_WORDS)
+
+def restore_session(driver, jar):
+    """Şifreli çerez kutusundaki oturumla devam etmeyi dener (bkz. gencer_session).
+       Login sayfasına dönülmemesi yetmez; login sonrası sayfa içeriği de görülmeli
+       (zaman aşımı / hata sayfası geçerli oturum sayılmaz)."""
+    data = jar.load()
+    if not data:
+        return False
+    try:
+        driver.get(f"{BASE_URL}/robots.txt")  # çerez eklemek için aynı alan adında olmak gerekir
+        for c in data["cookies"]:
+            try: driver.add_cookie({k: v for k, v in c.items() if k != "sameSite"})
+            except Exception: pass
+        driver.get(data["url"])
+        url = driver.current_url.lower()
+        if not any(m in url for m in LOGIN_MARKERS) and \
+                not driver.find_elements(By.XPATH, "//input[@type='password']") and logged_in_page(driver):
+            return True
+    except Exception as e:
+        log(f"Kayıtlı oturum denenemedi: {e}")
+    jar.clear()
+    try: driver.delete_all_cookies()
+    except Exception: pass
+    return False
+
+@METRICS.timed()
+def login(driver, reuse=True):
+    """reuse=False: kayıtlı oturum silinir, form ile giriş yapılır. Kayıtlı oturumla devam
+       edildiyse True döner."""
     load_dotenv()
     MUSTERI   = os.getenv("GENCER_MUSTERI", "").strip()
     KULLANICI = os.getenv("GENCER_KULLANICI", "").strip()
@@ -125,8 +185,15 @@ def login(driver):
         log("HATA: .env eksik (GENCER_MUSTERI, GENCER_KULLANICI, GENCER_SIFRE).")
         sys.exit(1)
 
+    jar = CookieJar(MUSTERI + KULLANICI + SIFRE)
+    if not reuse:
+        jar.clear()
+    elif restore_session(driver, jar):
+        METRICS.count("login_reused")
+        log("Kayıtlı oturum geçerli, login atlandı"); return True
+
     log("Login sayfası yükleniyor...")
-    driver.get("https://bayi.gencerteknik.com.tr/Login.asp")
+    driver.get(f"{BASE_URL}/Login.asp")
 
     # Çerez/popup kapat
     try:
@@ -164,13 +231,22 @@ def login(driver):
         "//a[contains(.,'Oturum Aç') or contains(.,'Giriş')]"
     ]
 
-    # Eleman yerlerini tespit
-    m_ifr, m_sel = find_in_any_frame(driver, musteri_xp, timeout=12)
-    k_ifr, k_sel = find_in_any_frame(driver, kullanici_xp, timeout=12)
-    s_ifr, s_sel = find_in_any_frame(driver, sifre_xp, timeout=12)
+    # Eleman yerlerini tespit: üç alan tek JS sorgusuyla (önce geçen koşuda bulunan yerler)
+    remembered = load_locators()
+    found = find_fields(driver, {"musteri": musteri_xp, "kullanici": kullanici_xp, "sifre": sifre_xp},
+                        remembered, timeout=12)
+    if found:
+        m_ifr = k_ifr = s_ifr = found["frame"]
+        m_sel, k_sel, s_sel = found["musteri"], found["kullanici"], found["sifre"]
+    else:
+        # alanlar farklı belgelerde ya da başka origin'li iframe'de: alan alan arama
+        m_ifr, m_sel = find_in_any_frame(driver, musteri_xp, timeout=6)
+        k_ifr, k_sel = find_in_any_frame(driver, kullanici_xp, timeout=6)
+        s_ifr, s_sel = find_in_any_frame(driver, sifre_xp, timeout=6)
 
     # Bulunamadıysa bir kez daha dene + dump
     if not (m_sel and k_sel and s_sel):
+        METRICS.count("login_retries")
         try:
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);"); time.sleep(0.6)
             driver.execute_script("window.scrollTo(0, 0);"); time.sleep(0.4)
@@ -202,8 +278,8 @@ def login(driver):
     type_in(s_ifr, s_sel, SIFRE)
 
     # Gönder
-    clicked = False
-    for xp in submit_xp:
+    clicked, submit_sel = False, None
+    for xp in prefer_first(submit_xp, remembered.get("submit")):
         f_ifr, f_sel = find_in_any_frame(driver, [xp], timeout=3)
         if f_sel:
             try:
@@ -214,7 +290,7 @@ def login(driver):
                         driver.switch_to.frame(frames[f_ifr])
                 btn = driver.find_element(By.XPATH, f_sel)
                 driver.execute_script("arguments[0].click();", btn)
-                clicked = True
+                clicked, submit_sel = True, f_sel
                 driver.switch_to.default_content()
                 break
             except Exception:
@@ -237,15 +313,42 @@ def login(driver):
 
     # Sonucu bekle
     try:
-        WebDriverWait(driver, 30).until(
-            lambda d: any(w in d.page_source.lower()
-                          for w in ["fiyat","liste","ürün","urun","stok","sepet","çıkış","cikis","katalog"]))
+        WebDriverWait(driver, 30).until(logged_in_page)
         log("Login sonrası sayfa yüklemesi: tamam")
     except TimeoutException:
         screenshot_dump(driver, "post_submit")
         raise
 
+    same_frame = m_ifr == k_ifr == s_ifr
+    try:
+        save_locators({"frame": m_ifr if same_frame else None, "musteri": m_sel, "kullanici": k_sel,
+                       "sifre": s_sel, "submit": submit_sel})
+    except Exception as e:
+        log(f"Login seçicileri kaydedilemedi: {e}")
+    try:
+        if jar.save(driver.get_cookies(), driver.current_url):
+            log("Oturum çerezleri şifreli olarak kaydedildi")
+        else:
+            log("cryptography kurulu değil, oturum çerezleri saklanmadı")
+    except Exception as e:
+        log(f"Oturum çerezleri kaydedilemedi: {e}")
+    return False
+
+def login_and_open_price_list(driver):
+    """login + goto_price_list; kayıtlı oturumla fiyat listesi açılmazsa oturum silinip
+       form ile bir kez daha denenir (bozuk oturum 6 saat boyunca her koşuyu düşürmesin)."""
+    reused = login(driver)
+    if goto_price_list(driver):
+        return True
+    if not reused:
+        return False
+    log("Kayıtlı oturumla fiyat listesi açılamadı, form ile yeniden login olunuyor")
+    METRICS.count("login_reuse_failed")
+    login(driver, reuse=False)
+    return goto_price_list(driver)
+
 # --- FİYAT LİSTESİ ---
+@METRICS.timed()
 def goto_price_list(driver):
     log("Fiyat listesine gidiliyor...")
     # öncelik: menüden tıklama
@@ -272,8 +375,8 @@ def goto_price_list(driver):
     else:
         # doğrudan URL dene (site düzenine göre alternatifler)
         for url in [
-            "https://bayi.gencerteknik.com.tr/FiyatListesi.asp",
-            "https://bayi.gencerteknik.com.tr/?page=fiyat-listesi",
+            f"{BASE_URL}/FiyatListesi.asp",
+            f"{BASE_URL}/?page=fiyat-listesi",
         ]:
             try:
                 driver.get(url); break
@@ -290,34 +393,18 @@ def goto_price_list(driver):
         log("Fiyat listesi bulunamadı."); return False
 
 # --- PARSE ---
-CURRENCY_MAP = {"₺":"TRY","TL":"TRY","TRY":"TRY","$":"USD","USD":"USD","€":"EUR","EUR":"EUR"}
-
-def parse_price_currency(s):
-    s = (s or "").strip()
-    if not s: return 0.0, ""
-    cur = ""
-    u = s.upper()
-    for k,v in CURRENCY_MAP.items():
-        if k in u or k in s: cur = v; break
-    sn = s.replace(" ","").replace(".","").replace(",",".")
-    m = re.findall(r"[-+]?\d*\.?\d+", sn)
-    val = float(m[0]) if m else 0.0
-    return val, cur
-
 def detect_table_currency(driver):
     """Tablo başlığında 'TL', 'USD', 'EUR' geçiyorsa onu döndürür."""
     try:
         ths = driver.find_elements(By.CSS_SELECTOR, "table thead th")
         if ths:
-            txt = " ".join([t.text for t in ths]).upper()
-            for k, v in CURRENCY_MAP.items():
-                if k in txt:
-                    return v
+            return currency_from_header(" ".join([t.text for t in ths]))
     except Exception:
         pass
     return "TRY"
 
-def parse_table(driver) -> pd.DataFrame:
+def parse_table_elements(driver) -> pd.DataFrame:
+    """Eski yol: her satır/hücre/özellik için ayrı WebDriver çağrısı."""
     rows = driver.find_elements(By.CSS_SELECTOR, "table tr")
     data = []
     if not rows:
@@ -331,46 +418,75 @@ def parse_table(driver) -> pd.DataFrame:
 
         # 0. kolonda resim olabilir
         img = ""
-        base = 0
+        has_img = False
         try:
             if tds[0].find_elements(By.TAG_NAME,"img"):
                 im = tds[0].find_element(By.TAG_NAME,"img")
-                for attr in ["src","data-src","data-original","data-lazy","data-echo","data-image"]:
+                for attr in IMG_ATTRS:
                     val = im.get_attribute(attr) or ""
                     if val and not val.startswith("data:image"): img = val; break
                 if not img:
                     style = tds[0].get_attribute("style") or ""
-                    m = re.search(r'url\([\'"]?([^\'")]+)[\'"]?\)', style)
+                    m = BG_URL_RE.search(style)
                     if m: img = m.group(1)
-                base = 1
+                has_img = True
         except Exception:
             pass
 
-        def td(i):
-            try: return tds[i].text.strip()
+        def td(t):
+            try: return t.text.strip()
             except Exception: return ""
 
-        sku   = td(base+0)
-        title = td(base+1)
-        stock = td(base+2) if len(tds)>base+2 else ""
-        kdv   = td(base+3) if len(tds)>base+3 else ""
-        birim = td(base+4) if len(tds)>base+4 else ""
-        price_t = tds[-1].text.strip() if tds else ""
-        price, currency = parse_price_currency(price_t)
-        if not currency: currency = default_cur
-
-        data.append({
-            "image_url": img,
-            "sku": sku,
-            "title": title,
-            "stock": stock,
-            "kdv": kdv,
-            "birim": birim,
-            "price": price,
-            "currency": currency
-        })
+        data.append(row_record([td(t) for t in tds], img, has_img, default_cur))
+    return pd.DataFrame(data)
+
+# Tüm tabloyu tarayıcı içinde tek seferde okur: {head: "...", rows: [{cells, img, has_img}]}
+TABLE_EXTRACT_JS = r"""
+var attrs = arguments[0];
+var ths = document.querySelectorAll("table thead th");
+var head = Array.prototype.map.call(ths, function(t){ return t.innerText || ""; }).join(" ");
+var trs = document.querySelectorAll("table tr");
+var rows = [];
+for (var i = 1; i < trs.length; i++) {
+  var tds = trs[i].querySelectorAll("td");
+  if (tds.length < 4) continue;
+  var img = "", hasImg = false;
+  var im = tds[0].querySelector("img");
+  if (im) {
+    hasImg = true;
+    for (var j = 0; j < attrs.length; j++) {
+      var v = (attrs[j] === "src" ? im.src : im.getAttribute(attrs[j])) || "";
+      if (v && v.indexOf("data:image") !== 0) { img = v; break; }
+    }
+    if (!img) {
+      var m = /url\(['"]?([^'")]+)['"]?\)/.exec(tds[0].getAttribute("style") || "");
+      if (m) img = m[1];
+    }
+  }
+  var cells = [];
+  for (var k = 0; k < tds.length; k++) cells.push((tds[k].innerText || "").trim());
+  rows.push({cells: cells, img: img, has_img: hasImg});
+}
+return {head: head, rows: rows, total: trs.length};
+"""
+
+def parse_table_js(driver) -> pd.DataFrame:
+    """Tek execute_script ile tüm satırları JSON olarak alır."""
+    res = driver.execute_script(TABLE_EXTRACT_JS, IMG_ATTRS) or {}
+    if not res.get("total"):
+        return pd.DataFrame()
+    default_cur = currency_from_header(res.get("head")) if res.get("head") else "TRY"
+    data = [row_record(r.get("cells") or [], r.get("img") or "", bool(r.get("has_img")), default_cur)
+            for r in res.get("rows") or []]
     return pd.DataFrame(data)
 
+def parse_table(driver) -> pd.DataFrame:
+    try:
+        return parse_table_js(driver)
+    except Exception as e:
+        log(f"JS tablo okuma başarısız, eleman bazlı okumaya düşülüyor: {e}")
+        return parse_table_elements(driver)
+
 def parse_cards(driver) -> pd.DataFrame:
     cards = driver.find_elements(By.CSS_SELECTOR, ".product,.urun,.card,.product-card")
     data=[]
@@ -390,7 +506,7 @@ def parse_cards(driver) -> pd.DataFrame:
             img = ""
             try:
                 im = c.find_element(By.CSS_SELECTOR,"img")
-                for attr in ["src","data-src","data-original","data-lazy","data-echo","data-image"]:
+                for attr in IMG_ATTRS:
                     val = im.get_attribute(attr) or ""
                     if val and not val.startswith("data:image"): img = val; break
             except Exception: pass
@@ -400,14 +516,41 @@ def parse_cards(driver) -> pd.DataFrame:
             continue
     return pd.DataFrame(data)
 
+@METRICS.timed()
 def parse_current_page(driver) -> pd.DataFrame:
     df = parse_table(driver)
     if not df.empty: return df
     return parse_cards(driver)
 
 # --- SAYFALAMA ---
-def click_next(driver) -> bool:
+WAITS = WaitMetrics()
+
+def save_wait_metrics(path=None):
+    path = path or (LOGS / "wait_metrics.json")
+    try:
+        WAITS.save(path)
+        for cond, s in WAITS.summary().items():
+            log(f"Bekleme [{cond}]: {s['n']} kez, toplam {s['waited_s']} sn, ort {s['avg_s']} sn, "
+                f"zaman aşımı {s['timeouts']}, sabit sleep'e göre kazanç ~{s['saved_s']} sn")
+    except Exception as e:
+        log(f"Bekleme metrikleri yazılamadı: {e}")
+
+def save_run_metrics(prometheus=None):
+    """logs/run_metrics.json (+ istenirse Prometheus metin dosyası); bkz. gencer_metrics."""
+    for cond, st in WAITS.summary().items():
+        METRICS.count(f"wait_{cond}_seconds", st["waited_s"])
+        METRICS.count(f"wait_{cond}_timeouts", st["timeouts"])
+    try:
+        METRICS.save(LOGS / "run_metrics.json")
+        if prometheus: METRICS.save_prometheus(Path(prometheus))
+        slow = sorted(METRICS.snapshot()["stages"].items(), key=lambda kv: -kv[1]["total_s"])
+        log("Süreler: " + ", ".join(f"{k} {v['total_s']:.1f} sn" for k, v in slow))
+    except Exception as e:
+        log(f"Koşu metrikleri yazılamadı: {e}")
+
+def click_next(driver, page=None) -> bool:
     # numara → ileri → rel=next → aria-label
+    before = table_signature(driver)
     for xp in [
         "//a[normalize-space(text())='»' or normalize-space(.)='›' or contains(.,'Sonraki') or contains(.,'İleri')]",
         "//button[normalize-space(text())='»' or normalize-space(.)='›' or contains(.,'Sonraki') or contains(.,'İleri')]",
@@ -416,7 +559,7 @@ def click_next(driver) -> bool:
         try:
             el = WebDriverWait(driver,4).until(EC.element_to_be_clickable((By.XPATH, xp)))
             driver.execute_script("arguments[0].click();", el)
-            time.sleep(1.0); return True
+            wait_table_changed(driver, before, metrics=WAITS, page=page, budget=1.0); return True
         except Exception:
             continue
     for css in ["a[rel='next']","a[aria-label*='Sonraki']","button[aria-label*='Sonraki']",
@@ -424,120 +567,298 @@ def click_next(driver) -> bool:
         try:
             el = WebDriverWait(driver,3).until(EC.element_to_be_clickable((By.CSS_SELECTOR, css)))
             driver.execute_script("arguments[0].click();", el)
-            time.sleep(1.0); return True
+            wait_table_changed(driver, before, metrics=WAITS, page=page, budget=1.0); return True
         except Exception:
             continue
     return False
 
 def click_page_number(driver, page_no: int) -> bool:
+    before = table_signature(driver)
     try:
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(0.3)
     except Exception:
         pass
     xp = f"//a[normalize-space(text())='{page_no}'] | //button[normalize-space(text())='{page_no}']"
     try:
         el = WebDriverWait(driver, 3).until(EC.element_to_be_clickable((By.XPATH, xp)))
         driver.execute_script("arguments[0].click();", el)
-        time.sleep(1.0); return True
+        wait_table_changed(driver, before, metrics=WAITS, page=page_no, budget=1.3); return True
     except Exception:
         return False
 
-def collect_all_pages(driver, max_pages=149) -> pd.DataFrame:
-    frames = []
+# yalnız en dıştaki tablolar: iç içe tablonun satırları dıştakinin outerHTML'inde zaten var
+TABLES_HTML_JS = r"""
+return Array.prototype.filter.call(document.querySelectorAll("table"),
+                                   function(t){ return !(t.parentElement && t.parentElement.closest("table")); })
+  .map(function(t){ return t.outerHTML; }).join("");
+"""
+
+PAGE_LINKS_JS = r"""
+var out = [];
+document.querySelectorAll("a,button").forEach(function(el){
+  var t = (el.innerText || "").trim();
+  if (/^\d+$/.test(t)) out.push(parseInt(t, 10));
+});
+return out;
+"""
+
+def skip_to_page(driver, target) -> bool:
+    """--resume için: ayrıştırmadan, görünen en büyük uygun numaraya atlayarak target sayfasına gider."""
     page = 1
-    while page <= max_pages:
-        log(f"Sayfa {page}: lazy-load için scroll yapılıyor...")
-        scroll_whole_page(driver)
-        log(f"Sayfa {page}: 7 sn bekleniyor (görseller insin)...")
-        time.sleep(7)
+    while page < target:
+        try: nums = [n for n in driver.execute_script(PAGE_LINKS_JS) or [] if page < n <= target]
+        except Exception: nums = []
+        if nums and click_page_number(driver, max(nums)):
+            page = max(nums)
+        elif click_next(driver, page=page+1):
+            page += 1
+        else:
+            return False
+    return True
+
+class IncompleteCrawl(Exception):
+    """Gezme listenin sonuna varmadan kesildi; eksik katalog yazılmaz (--resume kalan sayfaları gezer)."""
+
+class PageUnreachable(IncompleteCrawl):
+    """Başlangıç sayfasına atlanamadı (bağlantı yok: liste daha kısa olabilir, ya da tıklama başarısız)."""
+
+@METRICS.timed()
+def collect_all_pages(driver, max_pages=149, on_page=None, cache=None, start_page=1,
+                      parse_workers=0, queue_size=4, save_metrics=True) -> pd.DataFrame:
+    """on_page(page, kayıtlar) True dönerse gezme o sayfada biter (bkz. gencer_diff.PageHashes).
+       cache (gencer_cache.PageCache): tablo HTML hash'i aynıysa sayfa yeniden ayrıştırılmaz;
+       start_page>1 ise önce o sayfaya atlanır (--resume).
+       parse_workers>0: tablonun outerHTML'i alınıp hemen sonraki sayfaya geçilir, ayrıştırma
+       işçi havuzunda (en fazla queue_size sayfa bekler; bkz. gencer_snapshot). Sonuçlar yine
+       sayfa sırasıyla işlenir; erken bitişte o sırada kuyrukta olan sonraki sayfalar atılır.
+       Sayfa içeriği gelmezse / devam noktasına gidilemezse IncompleteCrawl, ayrıştırılamayan
+       sayfada PageParseError: önbellek o sayfadan öteye ilerlemez, koşu tamamlanmış sayılmaz
+       (eksik katalog yazılmaz; --resume o sayfadan devam eder).
+       save_metrics=False: logs/wait_metrics.json yazılmaz (parça işçileri birbirini ezmesin)."""
+    cat = Catalog()
+    page = start_page
+    if page > 1 and not skip_to_page(driver, page):
+        raise PageUnreachable(f"Sayfa {page}: devam noktasına gidilemedi")
+    stop = None  # erken bitişte o sayfa
+    pipe = PagePipeline(parse_workers, max_pending=queue_size) if parse_workers else None
+    base = driver.current_url if pipe else None
+
+    def finish(page, records, meta):
+        """Sayfa sırasıyla: önbellek, katalog, metrik, on_page."""
+        nonlocal stop
+        h, source, seconds = meta
+        if stop:
+            return
+        log(f"Sayfa {page}: {len(records)} kayıt" + (" (değişmemiş, önbellekten)" if source == "cache" else ""))
+        if h and records and source != "cache": cache.put(page, h, records)
+        cat.extend(records)
+        METRICS.page(page, seconds, len(records), source)
+        if cache: cache.done(page)
+        if on_page and on_page(page, records):
+            log(f"Sayfa {page}: önceki koşuyla aynı, gezme erken bitirildi"); stop = page
 
-        try:
-            WebDriverWait(driver, 20).until(
-                lambda d: d.find_elements(By.CSS_SELECTOR,"table tr") or
-                          d.find_elements(By.CSS_SELECTOR,".product,.urun,.card,.product-card"))
-        except TimeoutException:
-            log(f"Sayfa {page}: içerik gelmedi"); break
-
-        df = parse_current_page(driver)
-        log(f"Sayfa {page}: {len(df)} kayıt")
-        if not df.empty: frames.append(df)
-
-        if not (click_page_number(driver, page+1) or click_next(driver)):
-            break
-        page += 1
-
-    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
-
-# --- normalize & kaydet ---
-def normalize_and_save(df: pd.DataFrame):
-    out = pd.DataFrame()
-    out["image_url"] = df.get("image_url","").fillna("").astype(str)
-    out["sku"] = df.get("sku","").fillna("").astype(str)
-    out["title"] = df.get("title","").fillna("").astype(str)
-    out["stock"] = df.get("stock","").fillna("").astype(str)
-    out["kdv"] = df.get("kdv","").fillna("").astype(str)
-    out["birim"] = df.get("birim","").fillna("").astype(str)
-    out["price"] = pd.to_numeric(df.get("price",0), errors="coerce").fillna(0.0).astype(float)
-    out["currency"] = df.get("currency","").fillna("").astype(str)
-
-    # SKU boşsa başlıktan türet
-    def make_sku(row):
-        if row["sku"]: return row["sku"]
-        base = re.sub(r"[^\w\.-]+","_", row["title"], flags=re.U).strip("_")
-        return base[:90] or ("SKU_"+str(abs(hash(row["title"])))[:12])
-    out["sku"] = out.apply(make_sku, axis=1)
-
-    out = out.drop_duplicates(subset=["sku"], keep="first")
-
-    out.to_csv(CSV_PATH, index=False, encoding="utf-8")
-    JSON_PATH.write_text(json.dumps(out.to_dict(orient="records"), ensure_ascii=False, indent=2),
-                         encoding="utf-8")
-    log(f"Yazıldı: {len(out)} ürün -> products.csv + products.json")
-
-def sanitize_name(s):
-    s = re.sub(r"[^\w\.-]+","_", s, flags=re.U)
-    return s.strip("_")[:80] or "IMG"
-
-def download_images(df: pd.DataFrame, outdir: Path = DOWNLOADS):
-    outdir.mkdir(parents=True, exist_ok=True)
-    ok = 0
-    for _, row in df.iterrows():
-        url = (row.get("image_url") or "").strip()
-        sku = sanitize_name((row.get("sku") or "").strip())
-        if not url or not sku:
-            continue
-        try:
-            ext = os.path.splitext(url.split("?")[0])[1].lower()
-            if ext not in [".jpg",".jpeg",".png",".webp",".gif",".bmp"]:
-                ext = ".jpg"
-            fpath = outdir / f"{sku}{ext}"
-            if fpath.exists():
-                continue
-            r = requests.get(url, timeout=20)
-            if r.ok and r.content:
-                fpath.write_bytes(r.content)
-                ok += 1
-        except Exception as e:
-            log(f"Görsel indirilemedi ({sku}): {e}")
-    log(f"Görsel indirme tamam: {ok} dosya")
-
-# --- akış ---
-def run():
-    drv = init_driver()
     try:
-        login(drv)
-        if not goto_price_list(drv):
-            log("HATA: Fiyat listesi sayfası bulunamadı."); return
-        df = collect_all_pages(drv, max_pages=149)
+        while page <= max_pages:
+            t_page = time.perf_counter()
+            log(f"Sayfa {page}: lazy-load için scroll yapılıyor...")
+            scroll_whole_page(driver)
+            # eskiden: adım başına 0.25 sn + 1.5 sn + 7 sn sabit bekleme
+            if not (wait_images_loaded(driver, timeout=7, metrics=WAITS, page=page, budget=8.5) or
+                    wait_network_idle(driver, idle=0.5, timeout=2, metrics=WAITS, page=page)):
+                log(f"Sayfa {page}: görseller 7 sn içinde tamamlanmadı, devam")
+
+            try:
+                WebDriverWait(driver, 20).until(
+                    lambda d: d.find_elements(By.CSS_SELECTOR,"table tr") or
+                              d.find_elements(By.CSS_SELECTOR,".product,.urun,.card,.product-card"))
+            except TimeoutException:
+                raise IncompleteCrawl(f"Sayfa {page}: içerik gelmedi")
+
+            h = html = None
+            if cache or pipe:
+                try: html = driver.execute_script(TABLES_HTML_JS)
+                except Exception: html = ""
+                h = content_hash(html) if html and cache else None
+            cached = cache.lookup(page, h) if h else None
+            if cached is not None:
+                records, source = cached, "cache"
+            elif pipe and "<tr" in html:
+                records, source = None, "snapshot"
+            else:  # kart görünümü vb.: tarayıcıda hemen ayrıştır
+                records, source = parse_current_page(driver).to_dict(orient="records"), "browser"
+            meta = (h, source, time.perf_counter() - t_page)
+            if not pipe:
+                done = [(page, records, meta)]
+            elif source == "snapshot":
+                done = pipe.submit(page, html, base, meta=meta)
+                METRICS.count("snapshot_pages")
+            else:
+                done = pipe.done(page, records, meta)  # kuyruktaki önceki sayfalardan sonra
+            for args in done: finish(*args)
+            if stop: break
+
+            if not (click_page_number(driver, page+1) or click_next(driver, page=page+1)):
+                break
+            page += 1
+        if pipe:
+            for args in pipe.drain(): finish(*args)
+    finally:
+        if pipe: pipe.close()
+        if save_metrics: save_wait_metrics()
+
+    if cache: cache.finish(stopped_at=stop)
+    return cat.to_frame() if len(cat) else pd.DataFrame()
+
+@METRICS.timed()
+def collect_all_pages_http(driver, max_pages=149, concurrency=4, rate=8.0,
+                           on_page=None, cache=None, start_page=1) -> pd.DataFrame:
+    """Login çerezleriyle sayfaları requests + lxml üzerinden çeker (Selenium'suz)."""
+    session = session_from_driver(driver, pool_size=max(concurrency, 1))
+    url = price_list_url(driver)
+    log(f"HTTP modunda sayfalar çekiliyor ({concurrency} paralel, {rate or '∞'} istek/sn): {url}")
+    return pd.DataFrame(crawl_http(session, url, max_pages=max_pages,
+                                   concurrency=concurrency, rate=rate, on_page=on_page,
+                                   cache=cache, start_page=start_page))
+
+@METRICS.timed()
+def collect_sharded(driver, mode="http", max_pages=149, shards=4, concurrency=1, rate=8.0,
+                    headless=False, on_page=None) -> pd.DataFrame:
+    """Sayfa aralığını `shards` işçi sürece bölerek gezer (bkz. gencer_shard). on_page kancaları
+       birleştirilmiş sonuç üzerinde sayfa sırasıyla çağrılır; erken bitiş uygulanmaz."""
+    if mode == "http":
+        session = session_from_driver(driver, pool_size=concurrency)
+        url = price_list_url(driver)
+        log(f"HTTP modunda sayfalar {shards} işçiyle çekiliyor: {url}")
+        pages = crawl_http_sharded(session, url, max_pages=max_pages, shards=shards,
+                                   concurrency=concurrency, rate=rate)
+    else:
+        log(f"Sayfalar {shards} tarayıcı işçisiyle geziliyor")
+        pages = crawl_browser_sharded(max_pages=max_pages, shards=shards, headless=headless)
+    cat = Catalog()
+    for page, rows in pages:
+        cat.extend(rows)
+        if on_page: on_page(page, rows)
+    log(f"{len(pages)} sayfa birleştirildi")
+    return cat.to_frame() if len(cat) else pd.DataFrame()
+
+def run(mode="http", max_pages=149, headless=False, concurrency=4, rate=8.0, stop_unchanged=0,
+        resume=False, formats=(), shards=1, prometheus=None, parse_workers=0,
+        alerts=(), alert_pct=DEFAULT_PRICE_PCT):
+    """Çıkış kodu döner: 0 tamam; 1 katalog yazılmadı (login / liste yok, yarım gezme)."""
+    if not lxml_available() and (mode == "http" or parse_workers):
+        # HTTP modu ve arka plan ayrıştırma lxml ister; yoksa doğrudan Selenium ile tarayıcıda
+        log("lxml kurulu değil: HTTP modu / --parse-workers kapalı, sayfalar Selenium ile gezilecek")
+        mode, parse_workers = "browser", 0
+    cache = PageCache(CACHE_DIR / "pages")
+    sink = open_stream_sink(formats) if formats else None
+    with METRICS.stage("init_driver"):
+        drv = count_driver_calls(init_driver(headless=headless))
+    try:
+        if not login_and_open_price_list(drv):
+            log("HATA: Fiyat listesi sayfası bulunamadı."); return 1
+        df = pd.DataFrame()
+        pages = PageHashes(PAGE_HASHES_PATH, stop_after=stop_unchanged)
+        if shards > 1:
+            pages = PageHashes(PAGE_HASHES_PATH)  # tüm sayfalar zaten paralel çekiliyor
+            cache.start(sharded=True)  # önceki koşunun sayfaları bu koşununmuş gibi okunmasın
+            try:
+                df = collect_sharded(drv, mode=mode, max_pages=max_pages, shards=shards,
+                                     concurrency=max(1, concurrency // shards), rate=rate,
+                                     headless=headless, on_page=chain_pages(pages, sink))
+            except (HttpCrawlError, ShardError, requests.RequestException) as e:
+                # eksik parçalı sonuç yazılmaz; tek tarayıcıyla baştan gezilir
+                log(f"Parçalı gezme başarısız, Selenium ile devam: {e}")
+                METRICS.count("http_fallbacks")
+        elif mode == "http":
+            start, done = resume_point(cache, resume, pages)
+            if sink: sink.write_page(done.to_dict(orient="records"))
+            try:
+                df = pd.concat([done, collect_all_pages_http(
+                    drv, max_pages=max_pages, concurrency=concurrency, rate=rate,
+                    on_page=chain_pages(pages, sink), cache=cache, start_page=start)],
+                    ignore_index=True)
+            except (HttpCrawlError, requests.RequestException) as e:
+                log(f"HTTP modu başarısız, Selenium ile devam: {e}")
+                METRICS.count("http_fallbacks")
+                resume = True  # HTTP'nin bitirdiği sayfalar tekrar gezilmesin
         if df.empty:
-            log("Uyarı: Hiç kayıt bulunamadı."); return
-        normalize_and_save(df)
+            pages = PageHashes(PAGE_HASHES_PATH, stop_after=stop_unchanged)
+            start, done = resume_point(cache, resume, pages)
+            if sink: sink.write_page(done.to_dict(orient="records"))  # SKU tekrarı sink'te elenir
+            try:
+                df = pd.concat([done, collect_all_pages(drv, max_pages=max_pages,
+                                                        on_page=chain_pages(pages, sink),
+                                                        cache=cache, start_page=start,
+                                                        parse_workers=parse_workers)],
+                               ignore_index=True)
+            except (IncompleteCrawl, PageParseError) as e:
+                # yarım katalog yayımlanmaz (sahte "removed", eksik geçmiş); tekrar --resume ile
+                log(f"HATA: {e}; katalog yazılmadı, --resume ile kalan sayfalardan devam edilebilir")
+                METRICS.count("incomplete_runs")
+                return 1
+        if df.empty:
+            log("Uyarı: Hiç kayıt bulunamadı."); return 1
+        df = fill_unvisited_pages(df, pages, sink)
+        METRICS.count("rows", len(df))
+        normalize_and_save(df, sinks=make_sinks(alerts), price_pct=alert_pct)
+        pages.save()
+        if sink:
+            sink.close(); log(f"Akışlı çıktılar yazıldı: {', '.join(formats)}")
+            sink = None
         try: download_images(df)
         except Exception as e: log(f"Görsel indirme atlandı: {e}")
+        try:
+            with METRICS.stage("process_images"):
+                st = process_images(DOWNLOADS)
+            log(f"Görseller: {st['blobs']} benzersiz, {st['saved_bytes'] / 1e6:.1f} MB tekrar önlendi, "
+                f"küçük resim {st['made']} yeni / {st['skipped']} hazır / {st['failed']} hata")
+        except Exception as e: log(f"Görsel işleme atlandı: {e}")
+        return 0
     finally:
+        if sink: sink.abort()
         try: drv.quit()
         except Exception: pass
+        save_run_metrics(prometheus)
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Gencer bayi fiyat listesi scraper")
+    p.add_argument("--mode", choices=["http", "browser"], default="http",
+                   help="http: login sonrası requests+lxml (varsayılan), browser: tüm sayfalar Selenium ile")
+    p.add_argument("--max-pages", type=int, default=149)
+    p.add_argument("--headless", action="store_true")
+    p.add_argument("--concurrency", type=int, default=4, help="http modunda paralel sayfa isteği")
+    p.add_argument("--rate", type=float, default=8.0, help="http modunda host başına istek/sn (0: sınırsız)")
+    p.add_argument("--resume", action="store_true",
+                   help="yarıda kalan önceki koşunun son tamamlanan sayfasından devam et")
+    p.add_argument("--stop-unchanged", type=int, default=0, metavar="N",
+                   help="art arda N sayfa önceki koşuyla aynıysa gezmeyi bitir, kalanı önceki snapshot'tan al")
+    p.add_argument("--shards", type=int, default=1, metavar="N",
+                   help="sayfa aralığını N ayrı işçi sürece böl (her biri kendi oturumu/tarayıcısıyla)")
+    p.add_argument("--parse-workers", type=int, default=0, metavar="N",
+                   help="Selenium ile gezerken tablo HTML'ini N iş parçacığında ayrıştır, "
+                        "tarayıcı beklemeden sonraki sayfaya geçsin (0: kapalı)")
+    p.add_argument("--prometheus", metavar="YOL",
+                   help="koşu metriklerini ayrıca Prometheus metin biçiminde yaz (node_exporter textfile)")
+    p.add_argument("--alerts", default=DEFAULT_SINKS, metavar="HEDEFLER",
+                   help="fiyat/stok değişim uyarıları, virgülle: file,webhook,email (boş: kapalı; "
+                        "ayarlar .env'den, bkz. gencer_alerts.py)")
+    p.add_argument("--alert-pct", type=float, default=DEFAULT_PRICE_PCT, metavar="YÜZDE",
+                   help="en az bu kadar % oynayan fiyatlar için uyarı")
+    p.add_argument("--formats", default="",
+                   help="gezme sırasında ek akışlı çıktılar, virgülle: jsonl,json-compact,parquet")
+    a = p.parse_args(argv)
+    a.formats = [f for f in a.formats.split(",") if f.strip()]
+    for f in a.formats:
+        if f not in STREAM_FORMATS: p.error(f"bilinmeyen biçim: {f}")
+    a.alerts = [s for s in a.alerts.split(",") if s.strip()]
+    for s in a.alerts:
+        if s not in SINKS: p.error(f"bilinmeyen uyarı hedefi: {s}")
+    return a
 
 if __name__ == "__main__":
-    run()
+    args = parse_args()
+    sys.exit(run(mode=args.mode, max_pages=args.max_pages, headless=args.headless,
+                 concurrency=args.concurrency, rate=args.rate or None, stop_unchanged=args.stop_unchanged,
+                 resume=args.resume, formats=args.formats, shards=args.shards,
+                 prometheus=args.prometheus, parse_workers=args.parse_workers,
+                 alerts=args.alerts, alert_pct=args.alert_pct))